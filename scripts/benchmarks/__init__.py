@@ -0,0 +1 @@
+"""Offline benchmarks for the crawler and corpus tooling (run from ``scripts/``)."""
@@ -0,0 +1,6 @@
+"""The quarterly markdown tools as they were before :mod:`quarterly_doc`.
+
+Verbatim copies kept only as the :mod:`benchmarks.quarterly` baseline: CLI
+entry points are dropped and the file readers (reorder, repair, validate,
+deploy front matter) take the text instead of a path.
+"""
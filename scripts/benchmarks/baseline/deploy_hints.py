@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""Front-matter period read used by deploy hints."""
+
+from __future__ import annotations
+
+import yaml
+
+
+def _front_matter_period(text: str) -> tuple[str, str] | None:
+    if not text.startswith("---"):
+        return None
+    end = text.find("\n---", 3)
+    if end < 0:
+        return None
+    fm = yaml.safe_load(text[3:end]) or {}
+    period = fm.get("period") or {}
+    start = period.get("start")
+    end_date = period.get("end")
+    if start and end_date:
+        return str(start), str(end_date)
+    return None
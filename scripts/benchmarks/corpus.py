@@ -0,0 +1,57 @@
+"""Full corpus export time, serial and with a process pool.
+
+    cd scripts && python -m benchmarks.corpus [--jobs 1 2 4] [--repeat 3]
+
+Every run reparses all quarter files under ``docs/quality-updates`` (``full``
+export into a scratch directory), so the numbers are the parse cost an
+incremental export saves. Each pooled run's ``corpus.jsonl`` is compared
+byte for byte with the serial one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from export_corpus import export_corpus  # noqa: E402
+
+
+def time_export(jobs: int, out_dir: Path, repeat: int) -> tuple[float, dict]:
+    """Best wall time of ``repeat`` full exports into ``out_dir``, and the last stats."""
+    best = float("inf")
+    stats: dict = {}
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        stats = export_corpus(output_dir=out_dir, full=True, jobs=jobs)
+        best = min(best, time.perf_counter() - t0)
+    return best, stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="corpus export 병렬 파싱 벤치마크")
+    ap.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    jobs_list = sorted(set(args.jobs) | {1})
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {jobs: time_export(jobs, Path(tmp) / f"jobs{jobs}", args.repeat) for jobs in jobs_list}
+        serial = (Path(tmp) / "jobs1" / "corpus.jsonl").read_bytes()
+        same = {jobs: (Path(tmp) / f"jobs{jobs}" / "corpus.jsonl").read_bytes() == serial for jobs in jobs_list}
+
+    base = results[1][0]
+    print(f"{results[1][1]['reparsed']} files, {results[1][1]['item_count']} items")
+    print(f"{'jobs':>4} {'wall':>10} {'speedup':>8} {'same':>5}")
+    for jobs, (t, _) in results.items():
+        print(f"{jobs:>4} {t * 1000:8.0f}ms {base / t:7.2f}× {'yes' if same[jobs] else 'NO':>5}")
+    return 0 if all(same.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
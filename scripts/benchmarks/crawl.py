@@ -0,0 +1,142 @@
+"""Crawl benchmark over recorded board traffic.
+
+Record every board's requests for a period once (needs network)::
+
+    cd scripts && python -m benchmarks.crawl record --year 2026 --quarter 1 \\
+        --dir .cache/crawler/recordings/2026Q1
+
+Replay them with simulated latency, sequentially and concurrently::
+
+    python -m benchmarks.crawl replay --dir .cache/crawler/recordings/2026Q1 \\
+        --latency 0.15 --jitter 0.05 --jobs 8
+
+The report lists pages/sec, items/sec, bytes and parse time per board for each
+mode. "Pages" are HTTP responses, so KASB boards include their one
+session-priming GET.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawl import resolve_period  # noqa: E402
+from crawler import metrics, unified  # noqa: E402
+from crawler.replay import Cassettes, recording_transport, replay_transport  # noqa: E402
+
+
+def record(root: Path, start: str, end: str, jobs: int) -> list[Path]:
+    cassettes = Cassettes(root)
+    ctx = unified.CrawlContext(start, end, transport=recording_transport(cassettes))
+    try:
+        unified.fetch_boards(ctx, unified.board_specs(), jobs=jobs)
+    finally:
+        ctx.transport.close()
+    return cassettes.save({"start": start, "end": end})
+
+
+def run_mode(
+    cassettes: Cassettes,
+    jobs: int,
+    *,
+    latency: float,
+    jitter: float,
+    seed: int,
+    min_interval: float | None = None,
+) -> dict:
+    """Replay one crawl; returns wall time and per-board metrics."""
+    meta = cassettes.meta()
+    kwargs = {} if min_interval is None else {"min_interval": min_interval}
+    ctx = unified.CrawlContext(
+        meta["start"],
+        meta["end"],
+        transport=replay_transport(cassettes, latency=latency, jitter=jitter, seed=seed, **kwargs),
+    )
+    metrics.reset()
+    try:
+        t0 = time.perf_counter()
+        unified.fetch_boards(ctx, unified.board_specs(), jobs=jobs)
+        wall = time.perf_counter() - t0
+    finally:
+        ctx.transport.close()
+    return {"jobs": jobs, "wall_seconds": wall, "boards": metrics.snapshot()}
+
+
+def format_report(label: str, result: dict) -> str:
+    lines = [f"== {label} (jobs={result['jobs']}): {result['wall_seconds']:.2f}s wall"]
+    lines.append(f"{'board':<28} {'pages':>6} {'pages/s':>8} {'items':>6} {'items/s':>8} {'KB':>8} {'parse ms':>9}")
+    total_pages = total_items = 0
+    for board, m in result["boards"].items():
+        secs = m["seconds"] or 1e-9
+        total_pages += m["requests"]
+        total_items += m["items"]
+        lines.append(
+            f"{board:<28} {m['requests']:>6} {m['requests'] / secs:>8.1f} {m['items']:>6} "
+            f"{m['items'] / secs:>8.1f} {m['bytes'] / 1024:>8.0f} {m['parse_seconds'] * 1000:>9.1f}"
+        )
+    wall = result["wall_seconds"] or 1e-9
+    lines.append(f"{'total':<28} {total_pages:>6} {total_pages / wall:>8.1f} {total_items:>6} {total_items / wall:>8.1f}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="crawler 기록/재생 벤치마크")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Crawl live sites once and save per-board recordings")
+    rec.add_argument("--dir", type=Path, required=True)
+    rec.add_argument("--year", type=int)
+    rec.add_argument("--quarter", type=int, choices=[1, 2, 3, 4])
+    rec.add_argument("--start")
+    rec.add_argument("--end")
+    rec.add_argument("--jobs", type=int, default=unified.DEFAULT_JOBS)
+
+    rep = sub.add_parser("replay", help="Benchmark sequential and concurrent crawls from recordings")
+    rep.add_argument("--dir", type=Path, required=True)
+    rep.add_argument("--latency", type=float, default=0.15, help="Seconds per response (default: 0.15)")
+    rep.add_argument("--jitter", type=float, default=0.05, help="± seconds of uniform noise (default: 0.05)")
+    rep.add_argument("--seed", type=int, default=0)
+    rep.add_argument("--jobs", type=int, default=unified.DEFAULT_JOBS, help="Concurrent mode workers")
+    rep.add_argument("--min-interval", type=float, default=None, help="Per-host request spacing override")
+    rep.add_argument("--json", type=Path, help="Also write both results as JSON")
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "record":
+        try:
+            start, end = resolve_period(args)
+        except ValueError as exc:
+            print(f"[ERROR] {exc}", file=sys.stderr)
+            return 2
+        for path in record(args.dir, start, end, args.jobs):
+            print(f"[INFO] Recorded {path}")
+        return 0
+
+    cassettes = Cassettes.load(args.dir)
+    if not cassettes.boards():
+        print(f"[ERROR] No recordings in {args.dir}", file=sys.stderr)
+        return 2
+    opts = dict(latency=args.latency, jitter=args.jitter, seed=args.seed, min_interval=args.min_interval)
+    results = {
+        "sequential": run_mode(cassettes, 1, **opts),
+        "concurrent": run_mode(cassettes, args.jobs, **opts),
+    }
+    for label, result in results.items():
+        print(format_report(label, result))
+        print()
+    speedup = results["sequential"]["wall_seconds"] / (results["concurrent"]["wall_seconds"] or 1e-9)
+    print(f"concurrent speedup: ×{speedup:.1f}")
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
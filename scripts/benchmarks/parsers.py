@@ -0,0 +1,104 @@
+"""Per-board list-page parse time for each :mod:`crawler.parsing` backend.
+
+    cd scripts && python -m benchmarks.parsers [--repeat 200]
+
+Pages are the saved fixtures in ``tests/fixtures/crawler``; every board's
+parser is normalized to ``(yy-mm-dd, title, link)`` rows so the same table
+backs the equivalence test.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import FSC, FSS, KASB, KICPA, KICPA_Standards, parsing  # noqa: E402
+from crawler.unified import item_row  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "crawler"
+
+
+def _fss(base_url: str, selector: str) -> Callable[[str], list]:
+    def run(html: str) -> list:
+        _, items = FSS.parse_list_page(html, base_url, selector)
+        return [(i["dt"].strftime("%y-%m-%d"), i["title"], i["link"]) for i in items]
+
+    return run
+
+
+def _fss_rules(html: str) -> list:
+    items = FSS.parse_rules_page(html) or []
+    return [(i["dt"].strftime("%y-%m-%d") if i["dt"] else None, i["title"], i["link"]) for i in items]
+
+
+def _kicpa(parse: Callable[[str], list]) -> Callable[[str], list]:
+    return lambda html: [(i["date"].strftime("%y-%m-%d"), i["title"], i["link"]) for i in parse(html)]
+
+
+BOARD_PARSERS: dict[str, tuple[str, Callable[[str], list]]] = {
+    "FSS 보도자료": ("fss_press.html", _fss(FSS.PRESS_URL, "div.bd-list table tbody tr")),
+    "FSS 세칙 제·개정": ("fss_rules.html", _fss_rules),
+    "FSS 회계감독 동향": ("fss_trend.html", _fss(FSS.TREND_URL, "table tbody tr")),
+    "FSC 게시판": ("fsc_board.html", lambda html: [item_row(line) for line in FSC.parse_page(html)]),
+    "KICPA 공지사항": ("kicpa_noti.html", _kicpa(lambda html: KICPA.parse_table("noti", html))),
+    "KICPA 회계기준 요약": ("kicpa_sumboard.html", _kicpa(KICPA_Standards.parse_list)),
+    "KASB 공지사항": ("kasb_notice.html", lambda html: KASB.parse_page(html, KASB.BOARDS["공지사항"])),
+    "KASB 보도자료": ("kasb_press.html", lambda html: KASB.parse_page(html, KASB.BOARDS["보도자료"])),
+    "KASB 주요일정": ("kasb_schedule.html", KASB.parse_schedule_page),
+}
+
+
+def load_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def rows_with(backend: str, board: str) -> list:
+    fixture, parse = BOARD_PARSERS[board]
+    previous = parsing.backend()
+    parsing.set_backend(backend)
+    try:
+        return parse(load_fixture(fixture))
+    finally:
+        parsing.set_backend(previous)
+
+
+def time_parse(backend: str, parse: Callable[[str], list], html: str, repeat: int) -> float:
+    """Mean seconds per page."""
+    previous = parsing.backend()
+    parsing.set_backend(backend)
+    try:
+        parse(html)
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            parse(html)
+        return (time.perf_counter() - t0) / repeat
+    finally:
+        parsing.set_backend(previous)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="crawler 파서 백엔드 벤치마크")
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args(argv)
+
+    baseline = "html.parser"
+    others = [b for b in parsing.BACKENDS if b != baseline]
+    print(f"{'board':<18} {baseline:>12} " + " ".join(f"{b:>18}" for b in others))
+    for board, (fixture, parse) in BOARD_PARSERS.items():
+        html = load_fixture(fixture)
+        base = time_parse(baseline, parse, html, args.repeat)
+        cells = []
+        for b in others:
+            t = time_parse(b, parse, html, args.repeat)
+            cells.append(f"{t * 1000:8.2f}ms ×{base / t:5.1f}")
+        print(f"{board:<18} {base * 1000:10.2f}ms " + " ".join(f"{c:>18}" for c in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Full-repo pass of every quarterly markdown tool: original vs shared tokenization.
+
+    cd scripts && python -m benchmarks.quarterly [--repeat 5]
+
+Each quarter file under ``docs/quality-updates`` goes through the editor
+parser, corpus parse, skip removal, source-marker fix and spacing
+normalization, reorder, repair, every ``validate_content`` rule and the
+deploy front-matter read.
+
+- ``previous``: the implementations before :mod:`quarterly_doc`
+  (:mod:`benchmarks.baseline`), each scanning the text with its own regexes;
+- ``separate``: the current tools with the tokenizer cache cleared before
+  each one, as when a single script runs on its own;
+- ``shared``: the current tools sharing one tokenization per document.
+
+All three modes must produce identical outputs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.baseline import corpus_parse as old_corpus  # noqa: E402
+from benchmarks.baseline import deploy_hints as old_deploy  # noqa: E402
+from benchmarks.baseline import editor_parser as old_editor  # noqa: E402
+from benchmarks.baseline import reorder_chronological as old_reorder  # noqa: E402
+from benchmarks.baseline import repair_quarterly_structure as old_repair  # noqa: E402
+from benchmarks.baseline import skip_removal as old_skip  # noqa: E402
+from benchmarks.baseline import source_marker_layout as old_source  # noqa: E402
+from benchmarks.baseline import validate_content as old_validate  # noqa: E402
+from corpus.parse import discover_quarter_files, parse_corpus_items  # noqa: E402
+from deploy_hints import _front_matter_period  # noqa: E402
+from editor.parser import parse_links  # noqa: E402
+from quarterly_doc import tokenize  # noqa: E402
+from reorder_chronological import reorder_text  # noqa: E402
+from repair_quarterly_structure import repair_text  # noqa: E402
+from skip_removal import remove_skip_pairs  # noqa: E402
+from source_marker_layout import fix_mkdocs_source_layout, normalize_quarterly_spacing  # noqa: E402
+from validate_content import validate_text  # noqa: E402
+
+MODES = ("previous", "separate", "shared")
+Tool = Callable[[str, Path], Any]
+
+
+def _errors(repair: Callable[[str], Any]) -> Callable[[str, Path], Any]:
+    def run(text: str, path: Path) -> Any:
+        try:
+            return repair(text)
+        except ValueError as e:
+            return f"ValueError: {e}"
+
+    return run
+
+
+# (name, previous implementation, current implementation)
+TOOLS: list[tuple[str, Tool, Tool]] = [
+    ("editor", lambda text, path: old_editor.parse_links(text), lambda text, path: parse_links(text)),
+    (
+        "corpus",
+        lambda text, path: old_corpus.parse_corpus_items(text, path.name),
+        lambda text, path: parse_corpus_items(text, path.name),
+    ),
+    ("skip", lambda text, path: old_skip.remove_skip_pairs(text), lambda text, path: remove_skip_pairs(text)),
+    (
+        "source",
+        lambda text, path: old_source.fix_mkdocs_source_layout(text),
+        lambda text, path: fix_mkdocs_source_layout(text),
+    ),
+    (
+        "spacing",
+        lambda text, path: old_source.normalize_quarterly_spacing(text),
+        lambda text, path: normalize_quarterly_spacing(text),
+    ),
+    ("reorder", lambda text, path: old_reorder.reorder_text(text), lambda text, path: reorder_text(text)),
+    ("repair", _errors(old_repair.repair_text), _errors(repair_text)),
+    (
+        "validate",
+        lambda text, path: old_validate.validate_text(text, path, True),
+        lambda text, path: validate_text(text, path, True),
+    ),
+    ("deploy", lambda text, path: old_deploy._front_matter_period(text), lambda text, path: _front_matter_period(text)),
+]
+
+
+def run_pass(docs: list[tuple[Path, str]], mode: str) -> list[Any]:
+    """All tools over all documents in one of :data:`MODES`."""
+    outputs = []
+    for path, text in docs:
+        tokenize.cache_clear()
+        for _, previous, current in TOOLS:
+            if mode == "previous":
+                outputs.append(previous(text, path))
+                continue
+            if mode == "separate":
+                tokenize.cache_clear()
+            outputs.append(current(text, path))
+    return outputs
+
+
+def time_pass(docs: list[tuple[Path, str]], mode: str, repeat: int) -> tuple[float, list[Any]]:
+    best = float("inf")
+    outputs: list[Any] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        outputs = run_pass(docs, mode)
+        best = min(best, time.perf_counter() - t0)
+    return best, outputs
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="quarterly markdown 도구 전체 패스 벤치마크 (이전 구현 대비)")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    root = Path(__file__).resolve().parent.parent.parent / "docs" / "quality-updates"
+    docs = [(p, p.read_text(encoding="utf-8")) for p in discover_quarter_files(root)]
+    size = sum(len(text.encode("utf-8")) for _, text in docs)
+
+    results = {mode: time_pass(docs, mode, args.repeat) for mode in MODES}
+    previous, previous_out = results["previous"]
+    same = all(out == previous_out for _, out in results.values())
+
+    print(f"{len(docs)} files, {size / 1024:.0f} KiB, {len(TOOLS)} tools")
+    print(f"{'mode':>8} {'wall':>10} {'speedup':>8}")
+    for mode, (wall, _) in results.items():
+        print(f"{mode:>8} {wall * 1000:8.0f}ms {previous / wall:7.2f}×")
+    print(f"same output: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
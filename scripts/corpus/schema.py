@@ -8,6 +8,8 @@ import json
 from dataclasses import asdict, dataclass, field
 from typing import Any
 
+from crawler.urls import canonical_url
+
 SCHEMA_VERSION = "1.0.0"
 
 
@@ -53,7 +55,8 @@ class CorpusItem:
 
 
 def url_hash8(url: str) -> str:
-    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:8]
+    """First 8 hex digits of the SHA-256 of the canonical URL."""
+    return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()[:8]
 
 
 def make_id(period_label: str, agency: str, date: str, url: str) -> str:
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Per-period corpus shards and their byte-offset index.
+
+The sharded layout writes ``shards/<period_label>.jsonl`` instead of one
+``corpus.jsonl``. The manifest's ``shards`` list gives each shard's item
+count, byte size, sha256 and ``offsets`` (item id -> [byte offset, length]),
+so a consumer can load only some periods or read a single item with one seek.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Iterable
+
+SHARDS_DIR = "shards"
+UNLABELED = "unlabeled"
+
+
+def shard_name(period_label: str) -> str:
+    """File stem for a period: the label with path-unsafe characters replaced."""
+    return re.sub(r"[^\w~.-]", "_", period_label) or UNLABELED
+
+
+def shard_entry(period_label: str, lines: list[str], ids: list[str]) -> tuple[dict[str, Any], bytes]:
+    """Manifest entry for one shard and the shard's bytes."""
+    offsets: dict[str, list[int]] = {}
+    chunks: list[bytes] = []
+    pos = 0
+    for line, item_id in zip(lines, ids):
+        data = (line + "\n").encode("utf-8")
+        offsets[item_id] = [pos, len(data) - 1]
+        chunks.append(data)
+        pos += len(data)
+    body = b"".join(chunks)
+    entry = {
+        "period_label": period_label,
+        "path": f"{SHARDS_DIR}/{shard_name(period_label)}.jsonl",
+        "items": len(lines),
+        "bytes": len(body),
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "offsets": offsets,
+    }
+    return entry, body
+
+
+def write_shards(
+    out_dir: Path,
+    groups: dict[str, tuple[list[str], list[str]]],
+    previous: Iterable[dict[str, Any]] = (),
+) -> list[dict[str, Any]]:
+    """Write one shard per period (``groups``: label -> (lines, ids)); returns manifest entries.
+
+    Shards whose sha256 matches the previous manifest are left untouched, and
+    shard files of periods that no longer exist are removed.
+    """
+    known = {s["path"]: s["sha256"] for s in previous}
+    (out_dir / SHARDS_DIR).mkdir(parents=True, exist_ok=True)
+    entries = []
+    for label, (lines, ids) in sorted(groups.items()):
+        entry, body = shard_entry(label, lines, ids)
+        dest = out_dir / entry["path"]
+        if known.get(entry["path"]) != entry["sha256"] or not dest.exists():
+            tmp = dest.with_suffix(".jsonl.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, dest)
+        entries.append(entry)
+    current = {out_dir / e["path"] for e in entries}
+    for stale in (out_dir / SHARDS_DIR).glob("*.jsonl"):
+        if stale not in current:
+            stale.unlink()
+    return entries
+
+
+def shard_lines(out_dir: Path, entry: dict[str, Any]) -> list[str]:
+    """A shard's JSON lines (empty when the file is missing)."""
+    path = out_dir / entry["path"]
+    if not path.exists():
+        return []
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def read_item(out_dir: Path, manifest: dict[str, Any], item_id: str) -> dict[str, Any] | None:
+    """One item by id, read with a single seek into its shard."""
+    for entry in manifest.get("shards") or []:
+        span = entry["offsets"].get(item_id)
+        if span is None:
+            continue
+        with (out_dir / entry["path"]).open("rb") as f:
+            f.seek(span[0])
+            return json.loads(f.read(span[1]))
+    return None
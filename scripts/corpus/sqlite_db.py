@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""SQLite + FTS5 copy of the exported corpus (``corpus.sqlite``).
+
+``items`` holds the filter columns (agency, period_label, ISO date,
+summary_status, subsection) with indexes plus each item's JSON, in corpus
+order. ``items_fts`` is a trigram FTS5 table over the same text the in-memory
+search scans (title, note bullets and table cells), so substring queries of
+three or more characters are index lookups. ``aliases`` and ``meta`` (the
+manifest) complete what the MCP tools need.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+from crawler.urls import canonical_url
+
+DB_NAME = "corpus.sqlite"
+YYMMDD_RE = re.compile(r"\d{2}-\d{2}-\d{2}")
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE items (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    url_key TEXT NOT NULL,
+    agency TEXT NOT NULL,
+    period_label TEXT NOT NULL,
+    date TEXT NOT NULL,
+    date_iso TEXT NOT NULL,
+    summary_status TEXT NOT NULL,
+    subsection TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    doc TEXT NOT NULL
+);
+CREATE INDEX items_id ON items (id);
+CREATE INDEX items_url ON items (url_key);
+CREATE INDEX items_agency ON items (agency, date_iso);
+CREATE INDEX items_period ON items (period_label, date_iso);
+CREATE INDEX items_date ON items (date_iso);
+CREATE INDEX items_status ON items (summary_status);
+CREATE VIRTUAL TABLE items_fts USING fts5 (text, tokenize = 'trigram');
+CREATE TABLE aliases (old TEXT PRIMARY KEY, new TEXT NOT NULL);
+"""
+
+
+def iso_date(d: str) -> str:
+    """``yy-mm-dd`` -> ``20yy-mm-dd``; other text unchanged."""
+    return "20" + d if YYMMDD_RE.fullmatch(d) else d
+
+
+def item_text(item: dict[str, Any]) -> str:
+    """Lowercased searchable text: title, note bullets and table cells."""
+    parts = [item.get("title", "")]
+    for note in item.get("notes") or []:
+        parts.extend(note.get("bullets") or [])
+        for table in note.get("tables") or []:
+            parts.extend(table)
+    return "\n".join(parts).lower()
+
+
+def item_snippet(item: dict[str, Any]) -> str:
+    """First note bullet (120 chars), or the title."""
+    notes = item.get("notes") or []
+    if notes and notes[0].get("bullets"):
+        return notes[0]["bullets"][0][:120]
+    return item.get("title", "")
+
+
+def write_database(
+    path: Path,
+    lines: Iterable[str],
+    manifest: dict[str, Any],
+    aliases: dict[str, str],
+) -> Path:
+    """Build the database from corpus JSON lines (atomically replacing ``path``)."""
+    tmp = path.with_suffix(".sqlite.tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(SCHEMA)
+        for seq, line in enumerate(lines, 1):
+            item = json.loads(line)
+            conn.execute(
+                "INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    seq,
+                    item["id"],
+                    canonical_url(item["url"]),
+                    item.get("agency", ""),
+                    item.get("period_label", ""),
+                    item.get("date", ""),
+                    iso_date(item.get("date", "")),
+                    item.get("summary_status", ""),
+                    item.get("subsection", ""),
+                    item_snippet(item),
+                    line,
+                ),
+            )
+            conn.execute("INSERT INTO items_fts (rowid, text) VALUES (?, ?)", (seq, item_text(item)))
+        conn.executemany("INSERT INTO aliases VALUES (?, ?)", aliases.items())
+        conn.execute("INSERT INTO meta VALUES ('manifest', ?)", (json.dumps(manifest, ensure_ascii=False),))
+        conn.execute("INSERT INTO items_fts (items_fts) VALUES ('optimize')")
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
@@ -5,8 +5,12 @@ from __future__ import annotations
 
 import argparse
 import calendar
+import json
 import os
+import re
+import signal
 import sys
+import time
 from datetime import date, datetime
 from pathlib import Path
 
@@ -37,6 +41,177 @@ def current_quarter(today: date | None = None) -> tuple[int, int]:
     return today.year, quarter
 
 
+RANGE_RE = re.compile(r"^(\d{4})Q([1-4])\.\.(\d{4})Q([1-4])$")
+
+
+def parse_range(text: str) -> list[tuple[str, str]]:
+    """Quarter periods for ``YYYYQn..YYYYQn`` (inclusive), oldest first."""
+    m = RANGE_RE.match(text.strip())
+    if not m:
+        raise ValueError(f"--range must look like 2022Q1..2026Q3, got {text!r}")
+    y0, q0, y1, q1 = map(int, m.groups())
+    first, last = y0 * 4 + q0 - 1, y1 * 4 + q1 - 1
+    if first > last:
+        raise ValueError("--range start must be on or before its end")
+    return [quarter_dates(n // 4, n % 4 + 1) for n in range(first, last + 1)]
+
+
+def default_cache_dir() -> Path:
+    return repo_root() / ".cache" / "crawler" / "http"
+
+
+def default_store_dir() -> Path:
+    return repo_root() / ".cache" / "crawler" / "store"
+
+
+def run_prefetch(args: argparse.Namespace, paths: list[Path]) -> None:
+    """--prefetch: store detail pages and attachments of every linked item for the editor."""
+    paths = [p for p in paths if p.exists()]
+    if not args.prefetch or args.dry_run or not paths:
+        return
+    from crawler import prefetch
+    from crawler.store import ContentStore
+
+    print(f"[INFO] Prefetching detail pages and attachments ({len(paths)} files)")
+    stats = prefetch.prefetch_files(paths, ContentStore(default_store_dir()))
+    print(f"[INFO] Prefetch: {prefetch.format_stats(stats)} → {default_store_dir()}")
+
+
+def page_size_path() -> Path:
+    return repo_root() / ".cache" / "crawler" / "page_sizes.json"
+
+
+def page_sizes(args: argparse.Namespace):
+    """Page-size negotiator for the run (None with --page-size default)."""
+    from crawler.pagesize import Negotiator
+
+    return Negotiator(page_size_path()) if args.page_size == "auto" else None
+
+
+def item_store_dir() -> Path:
+    return repo_root() / ".cache" / "crawler" / "items"
+
+
+def item_store(args: argparse.Namespace):
+    """Raw item store every crawl writes first (None for --dry-run)."""
+    from crawler.itemstore import ItemStore
+
+    return None if args.dry_run else ItemStore(item_store_dir())
+
+
+def feed_path() -> Path:
+    return repo_root() / ".cache" / "crawler" / "feed.jsonl"
+
+
+def watermark_path(start_str: str, end_str: str) -> Path:
+    return repo_root() / ".cache" / "crawler" / "watermarks" / f"{start_str}_to_{end_str}.json"
+
+
+def checkpoint_dir(start_str: str, end_str: str) -> Path:
+    return repo_root() / ".cache" / "crawler" / "checkpoints" / f"{start_str}_to_{end_str}"
+
+
+def open_checkpoints(args: argparse.Namespace, start_str: str, end_str: str):
+    """Board checkpoints for the period; a run without --resume starts from none."""
+    from crawler.checkpoint import Checkpoints
+
+    checkpoints = Checkpoints(checkpoint_dir(start_str, end_str))
+    if not args.resume:
+        checkpoints.clear()
+    elif done := checkpoints.completed():
+        print(f"[INFO] Resuming: {len(done)} boards restored from checkpoints")
+    return checkpoints
+
+
+def keep_checkpoints(checkpoints) -> None:
+    print(f"[INFO] Checkpoints kept → {checkpoints.root} (rerun with --resume)", file=sys.stderr)
+
+
+def configure_transport(args: argparse.Namespace):
+    """Process default transport for the run (HTTP cache per the --cache-* flags)."""
+    from crawler import transport
+    from crawler.cache import DEFAULT_TTL, HttpCache
+
+    http_cache = None
+    if args.cache_mode != "off":
+        http_cache = HttpCache(
+            args.cache_dir or default_cache_dir(),
+            ttl=DEFAULT_TTL if args.cache_ttl is None else args.cache_ttl,
+            mode=args.cache_mode,
+        )
+    net = transport.Transport(cache=http_cache, hedge=not args.no_hedge)
+    transport.set_default_transport(net)
+    return net
+
+
+def crawl_deadline(args: argparse.Namespace) -> float | None:
+    """Monotonic time by which the crawl must finish (--budget), or None."""
+    return time.monotonic() + args.budget if args.budget else None
+
+
+def print_http_summary(net) -> None:
+    from crawler import transport
+
+    print(f"[INFO] HTTP: {transport.format_stats(net.stats())}")
+    hedges = net.hedge_summary()
+    if hedges:
+        print(f"[INFO] Hedged list requests:\n{transport.format_hedges(hedges)}")
+
+
+def telemetry_path(out_path: Path) -> Path:
+    return out_path.with_name(out_path.stem + ".crawl.json")
+
+
+class RunTelemetry:
+    """Per-board crawl metrics for one run, written as JSON next to each output file."""
+
+    def __init__(self, args: argparse.Namespace, mode: str, start_str: str, end_str: str, jobs: int) -> None:
+        self.live = args.live
+        self.run = {
+            "mode": mode,
+            "period": {"start": start_str, "end": end_str},
+            "jobs": jobs,
+            "parser": args.parser,
+            "cache_mode": args.cache_mode,
+        }
+        self._t0 = 0.0
+        self._summary = None
+
+    def __enter__(self) -> "RunTelemetry":
+        from crawler import metrics
+
+        metrics.reset()
+        self.run["started_at"] = datetime.now().astimezone().isoformat(timespec="seconds")
+        self._t0 = time.monotonic()
+        if self.live:
+            self._summary = metrics.LiveSummary().__enter__()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._summary is not None:
+            self._summary.__exit__(*exc)
+
+    def finish(self, outputs: list[Path], status: str = "ok") -> None:
+        from crawler import metrics, transport
+
+        report = metrics.report(
+            **self.run,
+            status=status,
+            wall_seconds=round(time.monotonic() - self._t0, 3),
+            outputs=[p.name for p in outputs],
+            transport=transport.default_transport().stats(),
+            throttle=transport.default_transport().throttle.snapshot(),
+            hedges=transport.default_transport().hedge_summary(),
+        )
+        if self.live:
+            print(metrics.format_table(report["boards"]), flush=True)
+        for out_path in outputs:
+            path = telemetry_path(out_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            print(f"[INFO] Telemetry → {path}")
+
+
 def compute_output_path(start_str: str, end_str: str) -> Path:
     start_year = datetime.strptime(start_str, "%Y-%m-%d").year
     return (
@@ -75,43 +250,344 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--start", help="Period start YYYY-MM-DD (overrides --quarter)")
     parser.add_argument("--end", help="Period end YYYY-MM-DD (overrides --quarter)")
     parser.add_argument("--force", action="store_true", help="Overwrite existing output file")
+    parser.add_argument(
+        "--range",
+        help="Backfill quarters YYYYQn..YYYYQn with one crawl of each board (e.g. 2022Q1..2026Q3)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Merge only items newer than each board's watermark into the existing file",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Collect only; do not write file")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse board checkpoints of an interrupted run of the same period",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Boards fetched in parallel (default: 8; 1 = sequential)",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=["use", "refresh", "offline", "off"],
+        default="use",
+        help="HTTP cache for list pages: use (default), refresh, offline, off",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds a cached page is served without revalidation (default: 3600)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="HTTP cache directory (default: .cache/crawler/http)",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=["strained", "lxml", "html.parser"],
+        default=None,
+        help="List page parser backend (default: strained = lxml on the target table only)",
+    )
+    parser.add_argument(
+        "--page-size",
+        choices=["auto", "default"],
+        default="auto",
+        help="auto (default): probe each board's largest honoured page size (cached a week); default: site default",
+    )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Rebuild the period's file(s) from the raw item store (.cache/crawler/items) without crawling",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Seconds the whole crawl may take; requests are cut off at the deadline (checkpoints kept for --resume)",
+    )
+    parser.add_argument(
+        "--no-hedge",
+        action="store_true",
+        help="Never send a duplicate of a slow list-page GET (default: hedge after the host's p95 latency)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Also fetch every item's detail page and attachments into .cache/crawler/store for the editor",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running: poll each board of the current quarter on its schedule and merge new items",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Seconds between polls of every board in --daemon mode (default: per board, 30 min-6 h)",
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Print a live progress line while crawling and a per-board table at the end",
+    )
     return parser.parse_args(argv)
 
 
+def run_range(args: argparse.Namespace, periods: list[tuple[str, str]]) -> int:
+    pending = []
+    for start_str, end_str in periods:
+        out_path = compute_output_path(start_str, end_str)
+        if out_path.exists() and not args.force:
+            print(f"[WARN] Output exists, skipping: {out_path}")
+        else:
+            pending.append((start_str, end_str))
+    if not pending:
+        run_prefetch(args, [compute_output_path(s, e) for s, e in periods])
+        return 0
+
+    from crawler import parsing, transport, unified
+    from crawler.incremental import save_watermarks
+
+    print("[INFO] Unified crawler started (range backfill)")
+    print(f"[INFO] Jurisdiction: {unified.JURISDICTION}")
+    print(f"[INFO] Period: {pending[0][0]} ~ {pending[-1][1]} ({len(pending)} quarters)")
+
+    net = configure_transport(args)
+    if args.parser:
+        parsing.set_backend(args.parser)
+    jobs = args.jobs if args.jobs is not None else unified.DEFAULT_JOBS
+    outputs = [] if args.dry_run else [compute_output_path(s, e) for s, e in pending]
+    checkpoints = open_checkpoints(args, pending[0][0], pending[-1][1])
+    ctx = unified.CrawlContext(
+        pending[0][0],
+        pending[-1][1],
+        transport=net,
+        checkpoints=checkpoints,
+        page_sizes=page_sizes(args),
+        deadline=crawl_deadline(args),
+        items=item_store(args),
+    )
+    try:
+        with RunTelemetry(args, "range", pending[0][0], pending[-1][1], jobs) as run:
+            try:
+                results = unified.run_range(ctx, pending, jobs=jobs, write=not args.dry_run)
+            except Exception as exc:
+                print(f"[ERROR] Crawl failed: {exc}", file=sys.stderr)
+                keep_checkpoints(checkpoints)
+                run.finish(outputs, status="failed")
+                return 1
+            run.finish(outputs)
+        checkpoints.clear()
+        for (start_str, end_str), (path, marks) in zip(pending, results):
+            if args.dry_run:
+                print(f"[DRY-RUN] Would write → {path}")
+                continue
+            save_watermarks(watermark_path(start_str, end_str), marks)
+            print(f"[DONE] Markdown generated → {path}")
+        run_prefetch(args, [compute_output_path(s, e) for s, e in periods])
+        return 0
+    finally:
+        print_http_summary(transport.default_transport())
+
+
+def run_render(args: argparse.Namespace, periods: list[tuple[str, str]]) -> int:
+    """Rebuild quarter files from the raw item store without fetching anything."""
+    from crawler import unified
+    from crawler.incremental import save_watermarks
+    from crawler.itemstore import ItemStore
+
+    store = ItemStore(item_store_dir())
+    status = 0
+    for start_str, end_str in periods:
+        out_path = compute_output_path(start_str, end_str)
+        if out_path.exists() and not args.force and not args.dry_run:
+            print(f"[WARN] Output exists, skipping: {out_path} (--force to re-render)")
+            continue
+        ctx = unified.CrawlContext(start_str, end_str, items=store)
+        t0 = time.perf_counter()
+        try:
+            if args.dry_run:
+                unified.render_from_store(ctx)
+            else:
+                unified.write_from_store(ctx, out_path)
+        except FileNotFoundError as exc:
+            print(f"[ERROR] {exc}", file=sys.stderr)
+            status = 1
+            continue
+        elapsed = (time.perf_counter() - t0) * 1000
+        if args.dry_run:
+            print(f"[DRY-RUN] Would write → {out_path} (rendered in {elapsed:.0f} ms)")
+            continue
+        save_watermarks(watermark_path(start_str, end_str), unified.current_watermarks(ctx))
+        print(f"[DONE] Rendered from {store.root} in {elapsed:.0f} ms → {out_path}")
+    return status
+
+
+def refresh_corpus(paths: list[Path]) -> None:
+    """Re-export data/corpus after the daemon changed quarter files."""
+    from export_corpus import export_corpus
+
+    stats = export_corpus()
+    names = ", ".join(p.name for p in paths)
+    print(f"[INFO] Corpus refreshed ({stats['item_count']} items) after {names}", flush=True)
+
+
+def run_daemon(args: argparse.Namespace) -> int:
+    from crawler import parsing, transport, unified
+    from crawler.daemon import DEFAULT_WORKERS, Daemon
+
+    if args.cache_mode == "use":
+        args.cache_mode = "refresh"  # every poll revalidates; unchanged list pages are 304s
+    net = configure_transport(args)
+    if args.parser:
+        parsing.set_backend(args.parser)
+    daemon = Daemon(
+        unified.board_specs(),
+        period=lambda: quarter_dates(*current_quarter()),
+        output_path=compute_output_path,
+        watermark_path=watermark_path,
+        feed_path=feed_path(),
+        net=net,
+        page_sizes=page_sizes(args),
+        items=item_store(args),
+        on_change=refresh_corpus,
+        interval=args.poll_interval,
+        workers=args.jobs or DEFAULT_WORKERS,
+    )
+
+    def stop(signum, frame) -> None:
+        print(f"[INFO] Signal {signum}: stopping after in-flight polls", flush=True)
+        daemon.stop()
+
+    for name in ("SIGINT", "SIGTERM"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), stop)
+    print(f"[INFO] Daemon started (change feed → {feed_path()})", flush=True)
+    try:
+        daemon.run()
+    finally:
+        print_http_summary(net)
+        net.close()
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     try:
         args = parse_args(argv)
-        start_str, end_str = resolve_period(args)
+        if args.render and (args.daemon or args.incremental):
+            raise ValueError("--render rebuilds whole quarter files; drop --daemon/--incremental")
+        if args.daemon:
+            if any((args.range, args.incremental, args.dry_run, args.year, args.quarter, args.start, args.end)):
+                raise ValueError("--daemon always follows the current quarter; drop the period/--dry-run flags")
+        elif args.range:
+            if args.incremental or args.year or args.quarter or args.start or args.end:
+                raise ValueError("--range cannot be combined with --year/--quarter/--start/--end/--incremental")
+            periods = parse_range(args.range)
+        else:
+            start_str, end_str = resolve_period(args)
     except ValueError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
         return 2
+    if args.daemon:
+        return run_daemon(args)
+    if args.render:
+        return run_render(args, periods if args.range else [(start_str, end_str)])
+    if args.range:
+        return run_range(args, periods)
 
     out_path = compute_output_path(start_str, end_str)
-    if out_path.exists() and not args.force:
+    incremental = args.incremental and out_path.exists() and not args.force
+    if out_path.exists() and not args.force and not incremental:
         print(f"[WARN] Output exists, skipping: {out_path}")
+        run_prefetch(args, [out_path])
         return 0
 
-    from crawler import unified
+    from crawler import parsing, transport, unified
+    from crawler.incremental import load_watermarks, save_watermarks
 
-    unified.configure_period(start_str, end_str)
     print("[INFO] Unified crawler started")
     print(f"[INFO] Jurisdiction: {unified.JURISDICTION}")
     print(f"[INFO] Period: {start_str} ~ {end_str}")
 
-    if args.dry_run:
-        unified.run_collection()
-        print(f"[DRY-RUN] Would write → {out_path}")
-        return 0
+    jobs = args.jobs if args.jobs is not None else unified.DEFAULT_JOBS
 
+    net = configure_transport(args)
+    if args.parser:
+        parsing.set_backend(args.parser)
+    marks_path = watermark_path(start_str, end_str)
+    outputs = [] if args.dry_run else [out_path]
+    run = RunTelemetry(args, "incremental" if incremental else "full", start_str, end_str, jobs)
+    checkpoints = open_checkpoints(args, start_str, end_str)
+    ctx = unified.CrawlContext(
+        start_str,
+        end_str,
+        transport=net,
+        checkpoints=checkpoints,
+        page_sizes=page_sizes(args),
+        deadline=crawl_deadline(args),
+        items=item_store(args),
+    )
     try:
-        written = unified.write_markdown(out_path)
-    except Exception as exc:
-        print(f"[ERROR] Crawl failed: {exc}", file=sys.stderr)
-        return 1
+        if incremental:
+            with run:
+                try:
+                    added, marks = unified.run_incremental(
+                        ctx,
+                        out_path,
+                        jobs=jobs,
+                        marks=load_watermarks(marks_path),
+                        write=not args.dry_run,
+                    )
+                except Exception as exc:
+                    print(f"[ERROR] Incremental crawl failed: {exc}", file=sys.stderr)
+                    keep_checkpoints(checkpoints)
+                    run.finish(outputs, status="failed")
+                    return 1
+                run.finish(outputs)
+            checkpoints.clear()
+            for board, count in added.items():
+                if count:
+                    print(f"[INFO] +{count} {board}")
+            if args.dry_run:
+                print(f"[DRY-RUN] {sum(added.values())} new items (file not written)")
+                return 0
+            save_watermarks(marks_path, marks)
+            print(f"[DONE] Merged {sum(added.values())} new items → {out_path}")
+            run_prefetch(args, [out_path])
+            return 0
 
-    print(f"[DONE] Markdown generated → {written}")
-    return 0
+        with run:
+            try:
+                if args.dry_run:
+                    unified.run_collection(ctx, jobs=jobs)
+                else:
+                    written = unified.write_markdown(ctx, out_path, jobs=jobs)
+            except Exception as exc:
+                print(f"[ERROR] Crawl failed: {exc}", file=sys.stderr)
+                keep_checkpoints(checkpoints)
+                run.finish(outputs, status="failed")
+                return 1
+            run.finish(outputs)
+        checkpoints.clear()
+
+        if args.dry_run:
+            print(f"[DRY-RUN] Would write → {out_path}")
+            return 0
+
+        save_watermarks(marks_path, unified.current_watermarks(ctx))
+        print(f"[DONE] Markdown generated → {written}")
+        run_prefetch(args, [written])
+        return 0
+    finally:
+        print_http_summary(transport.default_transport())
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
+
+from . import engine, metrics, pagesize, parsing, transport
 
 # 세 게시판 URL
 BASE_URLS = {
@@ -8,27 +8,31 @@ BASE_URLS = {
     "입법예고": "https://fsc.go.kr/po040301",
 }
 
+# 단독 실행 시 기본 기간 (수집 기간은 unified.CrawlContext 가 start/end 로 넘긴다)
 START_DATE = "2024-01-01"
 END_DATE = "2024-03-31"
 
-def fetch_page(url, page):
+# 목록 기본 10행; 행 수 파라미터는 pagesize 가 게시판별로 확인해 쓴다
+PAGE_SIZE = pagesize.PageSize(default=10, fields=("pageSize", "pageUnit", "rows"))
+
+def fetch_page(url, page, start=None, end=None, extra=None):
     params = {
         "curPage": page,
-        "srchBeginDt": START_DATE,
-        "srchEndDt": END_DATE,
+        "srchBeginDt": start or START_DATE,
+        "srchEndDt": end or END_DATE,
         "srchCtgry": "",
         "srchKey": "",
         "srchText": "",
+        **(extra or {}),
     }
-    res = requests.get(url, params=params)
+    res = transport.get(url, params=params, hedge=True)
     res.raise_for_status()
     return res.text
 
 def parse_page(html):
-    soup = BeautifulSoup(html, "html.parser")
     results = []
 
-    items = soup.select("li > div.inner")  # 각 항목 블록
+    items = parsing.select(html, "li > div.inner")  # 각 항목 블록
 
     for item in items:
         subject_tag = item.select_one(".subject a")
@@ -51,23 +55,31 @@ def parse_page(html):
 
     return results
 
-def crawl_board(name, base_url):
+def crawl_board(name, base_url, start=None, end=None):
     print(f"\n===== 크롤링 시작: {name} =====")
-    
-    page = 1
+
     all_items = []
 
-    while True:
-        html = fetch_page(base_url, page)
-        items = parse_page(html)
+    def probe(fields):
+        html = fetch_page(base_url, 1, start, end, fields)
+        return len(parse_page(html)), pagesize.reported_total(html)
+
+    extra = pagesize.params(f"fsc:{base_url.rsplit('/', 1)[-1]}", PAGE_SIZE, probe)
+
+    pages = engine.crawl_pages(
+        lambda page: fetch_page(base_url, page, start, end, extra),
+        parse_page,
+        until=lambda page, items: not items,
+    )
 
+    for page, items in pages:
         if not items:
             break
 
         print(f"{name} Page {page}: {len(items)} items")
         all_items.extend(items)
-        page += 1
 
+    metrics.finish("empty_page", kept=len(all_items), seen=len(all_items))
     return all_items
 
 if __name__ == "__main__":
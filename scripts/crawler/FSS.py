@@ -1,224 +1,303 @@
-import requests
-from bs4 import BeautifulSoup
+import math
 from urllib.parse import urljoin, urlparse, parse_qs
 from datetime import datetime
 
+from . import engine, metrics, pagesize, parsing, transport
+
 # =====================================================
 # 공통 설정
 # =====================================================
+# 단독 실행 시 기본 기간 (수집 기간은 unified.CrawlContext 가 start/end 로 넘긴다)
 START_DATE = "2024-01-01"
 END_DATE   = "2024-03-31"
-start_dt = datetime.strptime(START_DATE, "%Y-%m-%d")
-
-session = requests.Session()
-session.headers.update({
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-    "Accept-Language": "ko-KR,ko;q=0.9",
-})
 
 # =====================================================
-# 1. 보도자료
+# 게시판 목록 (보도자료 · 회계감독 동향자료 공통)
 # =====================================================
-def fetch_press_release(max_page=50):
-    BASE_URL = "https://www.fss.or.kr/fss/bbs/B0000188/list.do"
-    results = []
+PRESS_URL = "https://www.fss.or.kr/fss/bbs/B0000188/list.do"
+TREND_URL = "https://www.fss.or.kr/fss/bbs/B0000154/list.do"
+RULES_URL = "https://www.fss.or.kr/fss/job/lrgRegItnPrvntc/list.do"
 
-    print("\n[START] 보도자료 수집", flush=True)
+# eGov 게시판: 기본 10행, pageUnit 으로 한 페이지 행 수 확대 (pagesize 가 협상)
+PAGE_SIZE = pagesize.PageSize(default=10, fields=("pageUnit", "recordCountPerPage"))
 
-    for page in range(1, max_page + 1):
-        print(f"[보도자료] pageIndex={page}", flush=True)
-
-        res = session.get(
-            BASE_URL,
-            params={
-                "menuNo": "200218",
-                "pageIndex": page,
-                "sdate": START_DATE,
-                "edate": END_DATE,
-                "searchCnd": "1",
-                "searchWrd": "",
-            },
-            timeout=10,
-        )
+# 분기(≈92일)당 페이지 상한: 기본 10행이면 500건 (보도자료는 분기 200~260건).
+# 여러 분기를 한 번에 수집하면 상한도 분기 수만큼 늘어난다.
+PAGES_PER_QUARTER = 50
 
-        soup = BeautifulSoup(res.text, "html.parser")
-        rows = soup.select("div.bd-list table tbody tr")
-        print(f"  └ rows: {len(rows)}", flush=True)
 
-        if not rows:
-            break
+class PageCapReached(RuntimeError):
+    """A window longer than one quarter hit its page cap: older posts would be dropped."""
 
-        for row in rows:
-            a = row.select_one("td.title a")
-            tds = row.find_all("td")
-            if not a or len(tds) < 4:
-                continue
 
-            try:
-                dt = datetime.strptime(tds[3].get_text(strip=True), "%Y-%m-%d")
-            except:
-                continue
+def _period(start, end):
+    """Explicit (start, end) or the default period; returns (start, end, start_dt)."""
+    start, end = start or START_DATE, end or END_DATE
+    return start, end, datetime.strptime(start, "%Y-%m-%d")
 
-            if dt < start_dt:
-                print("  └ 시작일 이전 도달 → 종료", flush=True)
-                return results
 
-            results.append({
-                "date": dt.strftime("%y-%m-%d"),
-                "title": a.get_text(strip=True),
-                "link": urljoin(BASE_URL, a["href"]),
-            })
-
-    return results
+def _quarters(start, end):
+    days = (datetime.strptime(end, "%Y-%m-%d") - datetime.strptime(start, "%Y-%m-%d")).days + 1
+    return max(1, math.ceil(days / 92))
 
 
-# =====================================================
-# 2. 회계감독 동향자료
-# =====================================================
-def fetch_accounting_trend(max_page=50):
-    BASE_URL = "https://www.fss.or.kr/fss/bbs/B0000154/list.do"
-    results = []
+def max_pages(start, end):
+    """Page cap for a (start, end) window."""
+    return PAGES_PER_QUARTER * _quarters(start, end)
 
-    print("\n[START] 회계감독 동향자료 수집", flush=True)
 
-    for page in range(1, max_page + 1):
-        print(f"[회계감독] pageIndex={page}", flush=True)
-
-        res = session.get(
-            BASE_URL,
-            params={
-                "menuNo": "200467",
-                "pageIndex": page,
-                "sdate": START_DATE,
-                "edate": END_DATE,
-                "searchCnd": "1",
-                "searchWrd": "",
-            },
-            timeout=10,
+def _finish(label, reason, kept, seen, start, end, max_page):
+    """Record why the board stopped; a capped multi-quarter window is an error."""
+    metrics.finish(reason, kept=kept, seen=seen)
+    if reason == "max_page" and _quarters(start, end) > 1:
+        raise PageCapReached(
+            f"[{label}] {start}~{end}: {max_page}페이지 상한 도달 — 이전 게시물이 누락될 수 있음"
         )
 
-        soup = BeautifulSoup(res.text, "html.parser")
-        rows = soup.select("table tbody tr")
-        print(f"  └ rows: {len(rows)}", flush=True)
 
-        if not rows:
+def fetch_list_page(base_url, menu_no, page, start=None, end=None, extra=None):
+    res = transport.get(
+        base_url,
+        params={
+            "menuNo": menu_no,
+            "pageIndex": page,
+            "sdate": start or START_DATE,
+            "edate": end or END_DATE,
+            "searchCnd": "1",
+            "searchWrd": "",
+            **(extra or {}),
+        },
+        hedge=True,
+    )
+    return res.text
+
+
+def _page_size(base_url, menu_no, count_rows, start, end):
+    """Page-size fields for one board (probed with page 1 of the period)."""
+    def probe(fields):
+        html = fetch_list_page(base_url, menu_no, 1, start, end, fields)
+        return count_rows(html), pagesize.reported_total(html)
+
+    return pagesize.params(f"fss:{menu_no}", PAGE_SIZE, probe)
+
+
+def parse_list_page(html, base_url, row_selector="table tbody tr"):
+    """Return (raw row count, [{dt, title, link}]) for one bbs list page."""
+    rows = parsing.select(html, row_selector)
+    items = []
+
+    for row in rows:
+        a = row.select_one("td.title a")
+        tds = row.find_all("td")
+        if not a or len(tds) < 4:
+            continue
+
+        try:
+            dt = datetime.strptime(tds[3].get_text(strip=True), "%Y-%m-%d")
+        except ValueError:
+            continue
+
+        items.append({
+            "dt": dt,
+            "title": a.get_text(strip=True),
+            "link": urljoin(base_url, a["href"]),
+        })
+
+    return len(rows), items
+
+
+def _crawl_list_board(label, base_url, menu_no, row_selector, max_page, start=None, end=None):
+    start, end, start_dt = _period(start, end)
+    max_page = max_page or max_pages(start, end)
+    results = []
+    extra = _page_size(
+        base_url, menu_no, lambda html: parse_list_page(html, base_url, row_selector)[0], start, end
+    )
+
+    pages = engine.crawl_pages(
+        lambda page: fetch_list_page(base_url, menu_no, page, start, end, extra),
+        lambda html: parse_list_page(html, base_url, row_selector),
+        range(1, max_page + 1),
+        until=lambda page, parsed: not parsed[0] or any(i["dt"] < start_dt for i in parsed[1]),
+    )
+
+    seen = 0
+    reason = "max_page"
+    for page, (n_rows, items) in pages:
+        print(f"[{label}] pageIndex={page}", flush=True)
+        print(f"  └ rows: {n_rows}", flush=True)
+
+        if not n_rows:
+            reason = "empty_page"
             break
 
-        for row in rows:
-            a = row.select_one("td.title a")
-            tds = row.find_all("td")
-            if not a or len(tds) < 4:
-                continue
+        seen += len(items)
+        if _take_until_start(items, start_dt, results):
+            print("  └ 시작일 이전 도달 → 종료", flush=True)
+            reason = "before_start"
+            break
 
-            try:
-                dt = datetime.strptime(tds[3].get_text(strip=True), "%Y-%m-%d")
-            except:
-                continue
+    _finish(label, reason, len(results), seen, start, end, max_page)
+    return results
 
-            if dt < start_dt:
-                print("  └ 시작일 이전 도달 → 종료", flush=True)
-                return results
 
-            results.append({
-                "date": dt.strftime("%y-%m-%d"),
-                "title": a.get_text(strip=True),
-                "link": urljoin(BASE_URL, a["href"]),
-            })
+def _take_until_start(items, start_dt, results):
+    """Append items to ``results`` until one predates ``start_dt``; True if one did."""
+    for item in items:
+        if item["dt"] < start_dt:
+            return True
 
-    return results
+        results.append({
+            "date": item["dt"].strftime("%y-%m-%d"),
+            "title": item["title"],
+            "link": item["link"],
+        })
+    return False
+
+
+# =====================================================
+# 1. 보도자료
+# =====================================================
+def fetch_press_release(max_page=None, start=None, end=None):
+    print("\n[START] 보도자료 수집", flush=True)
+    return _crawl_list_board(
+        "보도자료", PRESS_URL, "200218", "div.bd-list table tbody tr", max_page, start, end
+    )
+
+
+# =====================================================
+# 2. 회계감독 동향자료
+# =====================================================
+def fetch_accounting_trend(max_page=None, start=None, end=None):
+    print("\n[START] 회계감독 동향자료 수집", flush=True)
+    return _crawl_list_board("회계감독", TREND_URL, "200467", "table tbody tr", max_page, start, end)
 
 
 # =====================================================
 # 3. 세칙 재개정 (캡션 기반 테이블 고정)
 # =====================================================
-def fetch_rules_revision(max_page=50):
-    BASE_URL = "https://www.fss.or.kr/fss/job/lrgRegItnPrvntc/list.do"
-    results = []
-    seen_ids = set()
+def parse_rules_page(html):
+    """Return None when the 세칙 table is missing, else [{id, dt, title, link}].
+
+    ``dt`` is None for rows whose date cell cannot be parsed.
+    """
+    # 1️⃣ caption 기준으로 테이블 후보 선택
+    table = None
+    for t in parsing.select(html, "table"):
+        cap = t.find("caption")
+        if cap and "세칙" in cap.get_text():
+            table = t
+            break
 
-    print("\n[START] 세칙 재개정 수집 (최종 확정)", flush=True)
+    if not table:
+        return None
 
-    for page in range(1, max_page + 1):
-        print(f"[세칙] pageIndex={page}", flush=True)
+    items = []
 
-        res = session.get(
-            BASE_URL,
-            params={
-                "menuNo": "200489",
-                "pageIndex": page,
-                "sdate": START_DATE,
-                "edate": END_DATE,
-                "searchCnd": "1",
-                "searchWrd": "",
-            },
-            timeout=10,
-        )
+    # 2️⃣ 진짜 데이터 row만 필터링
+    for row in table.select("tbody tr"):
+        a = row.select_one("td.title a")
+        if not a:
+            continue
+        if "lrgSlno=" not in a.get("href", ""):
+            continue
 
-        soup = BeautifulSoup(res.text, "html.parser")
+        tds = row.find_all("td")
+        qs = parse_qs(urlparse(a["href"]).query)
 
-        # 1️⃣ caption 기준으로 테이블 후보 선택
-        table = None
-        for t in soup.find_all("table"):
-            cap = t.find("caption")
-            if cap and "세칙" in cap.get_text():
-                table = t
-                break
+        try:
+            dt = datetime.strptime(tds[2].get_text(strip=True), "%Y-%m-%d")
+        except (IndexError, ValueError):
+            dt = None
 
-        if not table:
-            print("  └ 세칙 테이블 없음 → 종료", flush=True)
-            break
+        items.append({
+            "id": qs.get("lrgSlno", [None])[0],
+            "dt": dt,
+            "title": a.get_text(strip=True),
+            "link": urljoin(RULES_URL, a["href"]),
+        })
 
-        rows = table.select("tbody tr")
-        print(f"  └ rows(raw): {len(rows)}", flush=True)
+    return items
 
-        valid_rows = []
 
-        # 2️⃣ 진짜 데이터 row만 필터링
-        for row in rows:
-            a = row.select_one("td.title a")
-            if not a:
-                continue
-            if "lrgSlno=" not in a.get("href", ""):
-                continue
-            valid_rows.append(row)
+def _rules_done(items, seen, start_dt):
+    if not items:
+        return True
+    for item in items:
+        if item["id"] in seen or (item["dt"] and item["dt"] < start_dt):
+            return True
+        seen.add(item["id"])
+    return False
 
-        print(f"  └ valid_rows: {len(valid_rows)}", flush=True)
+
+def fetch_rules_revision(max_page=None, start=None, end=None):
+    start, end, start_dt = _period(start, end)
+    max_page = max_page or max_pages(start, end)
+    results = []
+    seen_ids = set()
+    probe_ids = set()
+
+    print("\n[START] 세칙 재개정 수집 (최종 확정)", flush=True)
+    extra = _page_size(RULES_URL, "200489", lambda html: len(parse_rules_page(html) or []), start, end)
+
+    pages = engine.crawl_pages(
+        lambda page: fetch_list_page(RULES_URL, "200489", page, start, end, extra),
+        parse_rules_page,
+        range(1, max_page + 1),
+        until=lambda page, items: _rules_done(items, probe_ids, start_dt),
+    )
+
+    seen = 0
+    reason = "max_page"
+    for page, items in pages:
+        print(f"[세칙] pageIndex={page}", flush=True)
+
+        if items is None:
+            print("  └ 세칙 테이블 없음 → 종료", flush=True)
+            reason = "table_missing"
+            break
+
+        print(f"  └ valid_rows: {len(items)}", flush=True)
 
         # 🔴 핵심 종료 조건
-        if not valid_rows:
+        if not items:
             print("  └ 유효한 세칙 데이터 없음 → 종료", flush=True)
+            reason = "empty_page"
             break
 
         # 3️⃣ 수집
-        for row in valid_rows:
-            a = row.select_one("td.title a")
-            tds = row.find_all("td")
+        seen += len(items)
+        stopped = _take_rules(items, seen_ids, start_dt, results)
+        if stopped:
+            reason = stopped
+            break
 
-            qs = parse_qs(urlparse(a["href"]).query)
-            lrg_id = qs.get("lrgSlno", [None])[0]
+    _finish("세칙", reason, len(results), seen, start, end, max_page)
+    return results
 
-            if lrg_id in seen_ids:
-                print("  └ 이미 수집한 게시물 재등장 → 종료", flush=True)
-                return results
 
-            seen_ids.add(lrg_id)
+def _take_rules(items, seen_ids, start_dt, results):
+    """Append dated, unseen rules; return the stop reason when the page ends the crawl."""
+    for item in items:
+        if item["id"] in seen_ids:
+            print("  └ 이미 수집한 게시물 재등장 → 종료", flush=True)
+            return "repeated_post"
 
-            try:
-                dt = datetime.strptime(tds[2].get_text(strip=True), "%Y-%m-%d")
-            except:
-                continue
+        seen_ids.add(item["id"])
 
-            if dt < start_dt:
-                print("  └ 시작일 이전 도달 → 종료", flush=True)
-                return results
+        if item["dt"] is None:
+            continue
 
-            results.append({
-                "date": dt.strftime("%y-%m-%d"),
-                "title": a.get_text(strip=True),
-                "link": urljoin(BASE_URL, a["href"]),
-            })
+        if item["dt"] < start_dt:
+            print("  └ 시작일 이전 도달 → 종료", flush=True)
+            return "before_start"
 
-    return results
+        results.append({
+            "date": item["dt"].strftime("%y-%m-%d"),
+            "title": item["title"],
+            "link": item["link"],
+        })
+    return None
 
 
 # =====================================================
@@ -1,7 +1,7 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+from . import engine, metrics, pagesize, parsing, transport
+
 BOARDS = {
     "공지사항": {
         "list": "https://www.kasb.or.kr/front/board/comm010List.do",
@@ -22,11 +22,11 @@ SCHEDULE = {
     "view": "https://www.kasb.or.kr/front/board/calView.do",
 }
 
-SESSION_HEADERS = {
-    "User-Agent": "Mozilla/5.0",
-}
+# 목록 기본 10행; 행 수 필드는 pagesize 가 게시판별로 확인해 쓴다
+PAGE_SIZE = pagesize.PageSize(default=10, fields=("pageSize", "pageUnit", "recordCountPerPage"))
+
 
-def fetch_page(session, url, page, start, end):
+def fetch_page(url, page, start, end, extra=None):
     data = {
         "siteCd": "002000000000000",
         "searchfield": "ALL",
@@ -34,15 +34,15 @@ def fetch_page(session, url, page, start, end):
         "s_date_start": start,
         "s_date_end": end,
         "page": page,
+        **(extra or {}),
     }
-    res = session.post(url, data=data)
+    res = transport.post(url, data=data)
     res.raise_for_status()
     return res.text
 
 
 def parse_page(html, cfg):
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.select("table tbody tr")
+    rows = parsing.select(html, "table tbody tr")
     results = []
 
     for r in rows:
@@ -70,35 +70,43 @@ def parse_page(html, cfg):
     return results
 
 
+def _page_size(url, parse, start, end):
+    def probe(fields):
+        html = fetch_page(url, 1, start, end, fields)
+        return len(parse(html)), pagesize.reported_total(html)
+
+    return pagesize.params(f"kasb:{url.rsplit('/', 1)[-1]}", PAGE_SIZE, probe)
+
+
 def crawl_board(name, cfg, start, end):
-    session = requests.Session()
-    session.headers.update(SESSION_HEADERS)
-    session.get(cfg["list"])  # 세션 초기화
+    transport.prime(cfg["list"])  # 세션 초기화 (호스트당 1회)
 
-    page = 1
     items = []
 
     print(f"\n=== [{name}] 크롤링 시작 ===")
+    extra = _page_size(cfg["list"], lambda html: parse_page(html, cfg), start, end)
 
-    while True:
-        html = fetch_page(session, cfg["list"], page, start, end)
-        parsed = parse_page(html, cfg)
+    pages = engine.crawl_pages(
+        lambda page: fetch_page(cfg["list"], page, start, end, extra),
+        lambda html: parse_page(html, cfg),
+        until=lambda page, parsed: not parsed,
+    )
 
+    for _, parsed in pages:
         if not parsed:
             break
 
         items.extend(parsed)
-        page += 1
 
+    metrics.finish("empty_page", kept=len(items), seen=len(items))
     print(f"=== [{name}] 완료: {len(items)}건 ===")
     return items
 
 
 def parse_schedule_page(html):
-    soup = BeautifulSoup(html, "html.parser")
     results = []
 
-    for row in soup.select("table tbody tr"):
+    for row in parsing.select(html, "table tbody tr"):
         cols = row.find_all("td")
         if len(cols) != 5:
             continue
@@ -129,25 +137,26 @@ def parse_schedule_page(html):
 
 
 def crawl_schedule(start, end):
-    session = requests.Session()
-    session.headers.update(SESSION_HEADERS)
-    session.get(SCHEDULE["list"])
+    transport.prime(SCHEDULE["list"])
 
-    page = 1
     items = []
 
     print("\n=== [주요일정] 크롤링 시작 ===")
+    extra = _page_size(SCHEDULE["list"], parse_schedule_page, start, end)
 
-    while True:
-        html = fetch_page(session, SCHEDULE["list"], page, start, end)
-        parsed = parse_schedule_page(html)
+    pages = engine.crawl_pages(
+        lambda page: fetch_page(SCHEDULE["list"], page, start, end, extra),
+        parse_schedule_page,
+        until=lambda page, parsed: not parsed,
+    )
 
+    for _, parsed in pages:
         if not parsed:
             break
 
         items.extend(parsed)
-        page += 1
 
+    metrics.finish("empty_page", kept=len(items), seen=len(items))
     items.sort(key=lambda t: datetime.strptime(t[0], "%y-%m-%d"))
     print(f"=== [주요일정] 완료: {len(items)}건 ===")
     return items
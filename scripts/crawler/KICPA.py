@@ -1,21 +1,24 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+from . import engine, metrics, pagesize, parsing, transport
+from .locator import PageLocator
+
 BASE = "https://www.kicpa.or.kr"
 
+# 목록 기본 10행 (총 건수 표시 없음 → 요청한 행 수가 그대로 와야 인정)
+PAGE_SIZE = pagesize.PageSize(default=10, fields=("pageSize", "rows", "listCount"))
+
 
-def fetch_page(board_id, page):
+def fetch_page(board_id, page, extra=None):
     url = f"{BASE}/board/list.brd"
-    params = {"boardId": board_id, "cmpBrdId": board_id, "page": page}
-    r = requests.get(url, params=params)
+    params = {"boardId": board_id, "cmpBrdId": board_id, "page": page, **(extra or {})}
+    r = transport.get(url, params=params, hedge=True)
     r.raise_for_status()
     return r.text
 
 
 def parse_table(board_id, html):
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.select("table.table_st02 tbody tr")
+    rows = parsing.select(html, "table.table_st02 tbody tr")
 
     items = []
     for tr in rows:
@@ -51,94 +54,56 @@ def parse_table(board_id, html):
     return items
 
 
-def get_total_pages(board_id):
-    html = fetch_page(board_id, 1)
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.select_one("p.page").get_text()  # "1/438 페이지"
-    total = int(text.split("/")[1].split()[0])
-    return total
-
-
-# --------------------------------------------------------------------
-#                     START PAGE (>= start_date)
-# --------------------------------------------------------------------
-def find_start_page(board_id, start_date, total_pages):
-    print("[INFO] Finding start_page...")
-    low, high = 1, total_pages
-    candidate = total_pages
-
-    while low <= high:
-        mid = (low + high) // 2
-        html = fetch_page(board_id, mid)
-        items = parse_table(board_id, html)
-        if not items:
-            break
-
-        last_date = items[-1]["date"]  # 가장 오래된 날짜
+def parse_total_pages(html):
+    text = parsing.select_one(html, "p.page").get_text()  # "1/438 페이지"
+    return int(text.split("/")[1].split()[0])
 
-        if last_date > start_date:
-            low = mid + 1
-        else:
-            candidate = mid
-            high = mid - 1
 
-    print(f"[INFO] start_page = {candidate}")
-    return candidate
-
-
-# --------------------------------------------------------------------
-#                     END PAGE (<= end_date)
-# --------------------------------------------------------------------
-def find_end_page(board_id, end_date, total_pages):
-    print("[INFO] Finding end_page...")
-    low, high = 1, total_pages
-    candidate = 1
-
-    while low <= high:
-        mid = (low + high) // 2
-        html = fetch_page(board_id, mid)
-        items = parse_table(board_id, html)
-        if not items:
-            break
-
-        first_date = items[0]["date"]  # 가장 최신 날짜
-
-        if first_date > end_date:
-            low = mid + 1
-        else:
-            candidate = mid
-            high = mid - 1
-
-    print(f"[INFO] end_page = {candidate}")
-    return candidate
+def board_locator(board_id):
+    """Page locator for ``board_id``; page 1 is fetched once for the page count."""
+    extra = pagesize.params(
+        f"kicpa:{board_id}",
+        PAGE_SIZE,
+        lambda fields: (len(parse_table(board_id, fetch_page(board_id, 1, fields))), None),
+    )
+    html = fetch_page(board_id, 1, extra)
+    return PageLocator(
+        lambda page: parse_table(board_id, fetch_page(board_id, page, extra)),
+        parse_total_pages(html),
+        seed={1: parse_table(board_id, html)},
+    )
 
 
 # --------------------------------------------------------------------
 #                     MAIN CRAWLER
 # --------------------------------------------------------------------
-def crawl_period(board_id, start_date, end_date):
-    total_pages = get_total_pages(board_id)
-
-    start_page = find_start_page(board_id, start_date, total_pages)
-    end_page = find_end_page(board_id, end_date, total_pages)
+def crawl_period(board_id, start_date, end_date, locator=None):
+    locator = locator or board_locator(board_id)
 
-    # 보정: start_page ≤ end_page 보장
-    if start_page > end_page:
-        start_page, end_page = end_page, start_page
-
-    print(f"[INFO] Crawling pages {start_page} → {end_page}...")
+    first_page, last_page = locator.find_range(start_date, end_date)
+    print(
+        f"[INFO] Pages {first_page} → {last_page} of {locator.total_pages} "
+        f"({locator.fetched} probed)"
+    )
 
     collected = []
 
-    for page in range(start_page, end_page + 1):
-        print(f"[INFO] Fetching page {page}...")
-        html = fetch_page(board_id, page)
-        items = parse_table(board_id, html)
-
+    # 탐색 중 받은 페이지는 메모에서 바로 나오고, 나머지만 미리 받아 온다.
+    pages = engine.crawl_pages(
+        locator.page,
+        lambda items: items,
+        range(first_page, last_page + 1),
+    )
+
+    seen = 0
+    for page, items in pages:
+        print(f"[INFO] Fetched page {page}: {len(items)} rows")
+        seen += len(items)
         for item in items:
             if start_date <= item["date"] <= end_date:
                 collected.append(item)
 
+    metrics.finish("page_range_end", kept=len(collected), seen=seen)
     return collected
 
 
@@ -1,7 +1,7 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-import time
+
+from . import engine, metrics, pagesize, parsing, transport
+from .locator import PageLocator
 
 BASE = "https://www.kicpa.or.kr"
 LIST_URL = f"{BASE}/kicpa/sumBoard/list.face"
@@ -14,16 +14,20 @@ PARAMS_VALUE = (
     "acc1402/acc1403/acc1404/acc1405/acc1406/acc1407/acc1408"
 )
 
+# 목록 기본 10행 (총 건수 표시 없음 → 요청한 행 수가 그대로 와야 인정)
+PAGE_SIZE = pagesize.PageSize(default=10, fields=("pageSize", "rows", "listCount"))
+
 
 # -------------------------------------------------------------
 #  특정 페이지 요청
 # -------------------------------------------------------------
-def fetch_page(page: int):
+def fetch_page(page: int, extra=None):
     data = {
         "params": PARAMS_VALUE,
         "page": str(page),
+        **(extra or {}),
     }
-    resp = requests.post(LIST_URL, data=data)
+    resp = transport.post(LIST_URL, data=data)
     resp.raise_for_status()
     return resp.text
 
@@ -32,8 +36,7 @@ def fetch_page(page: int):
 #  목록 HTML 파싱
 # -------------------------------------------------------------
 def parse_list(html):
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.select("table.table_st02 tbody tr")
+    rows = parsing.select(html, "table.table_st02 tbody tr")
     items = []
 
     for tr in rows:
@@ -76,10 +79,8 @@ def parse_list(html):
 # -------------------------------------------------------------
 #  최신 페이지 번호 파악
 # -------------------------------------------------------------
-def get_total_pages():
-    html = fetch_page(1)
-    soup = BeautifulSoup(html, "html.parser")
-    page_tag = soup.select_one(".page strong")
+def parse_total_pages(html):
+    page_tag = parsing.select_one(html, ".page strong")
     if not page_tag:
         return 1
 
@@ -95,71 +96,58 @@ def get_total_pages():
     return total
 
 
-# -------------------------------------------------------------
-#  페이지 탐색 방식(B): 필요한 페이지 범위만 찾기
-# -------------------------------------------------------------
-def find_page_range(start_date, end_date):
-    total_pages = get_total_pages()
-    print(f"[INFO] Total pages = {total_pages}")
-
-    start_page = None
-    end_page = None
-
-    for page in range(1, total_pages + 1):
-        print(f"[INFO] Checking page {page}/{total_pages}...")
-        html = fetch_page(page)
-        items = parse_list(html)
-        if not items:
-            continue
-
-        # 이 페이지의 날짜 범위
-        page_dates = [item["date"] for item in items]
-        newest = max(page_dates)
-        oldest = min(page_dates)
+def board_locator():
+    """Page locator for the sumBoard list; page 1 doubles as the page-count probe."""
+    extra = pagesize.params(
+        "kicpa:sumBoard", PAGE_SIZE, lambda fields: (len(parse_list(fetch_page(1, fields))), None)
+    )
+    html = fetch_page(1, extra)
+    return PageLocator(
+        lambda page: parse_list(fetch_page(page, extra)),
+        parse_total_pages(html),
+        seed={1: parse_list(html)},
+    )
 
-        # 종료 범위 결정(end_page)
-        if end_page is None and newest <= end_date:
-            end_page = page
 
-        # 시작 범위 결정(start_page)
-        if start_page is None and oldest < start_date:
-            start_page = page - 1 if page > 1 else 1
-
-        if start_page and end_page:
-            break
-
-        time.sleep(0.2)
+# -------------------------------------------------------------
+#  필요한 페이지 범위만 찾기 (보간 탐색, 페이지 메모)
+# -------------------------------------------------------------
+def find_page_range(start_date, end_date, locator=None):
+    locator = locator or board_locator()
+    print(f"[INFO] Total pages = {locator.total_pages}")
 
-    if start_page is None:
-        start_page = 1
-    if end_page is None:
-        end_page = total_pages
+    start_page, end_page = locator.find_range(start_date, end_date)
 
-    print(f"[INFO] start_page = {start_page}, end_page = {end_page}")
+    print(f"[INFO] start_page = {start_page}, end_page = {end_page} ({locator.fetched} probed)")
     return start_page, end_page
 
 
 # -------------------------------------------------------------
 #  실제 크롤링
 # -------------------------------------------------------------
-def crawl_sumboard(start_date, end_date):
-    start_page, end_page = find_page_range(start_date, end_date)
+def crawl_sumboard(start_date, end_date, locator=None):
+    locator = locator or board_locator()
+    start_page, end_page = find_page_range(start_date, end_date, locator)
 
     print(f"\n[INFO] Crawling pages {start_page} → {end_page}\n")
 
     collected = []
 
-    for page in range(start_page, end_page + 1):
-        print(f"[INFO] Fetching page {page}/{end_page}")
-        html = fetch_page(page)
-        items = parse_list(html)
+    pages = engine.crawl_pages(
+        locator.page,
+        lambda items: items,
+        range(start_page, end_page + 1),
+    )
 
+    seen = 0
+    for page, items in pages:
+        print(f"[INFO] Fetched page {page}/{end_page}")
+        seen += len(items)
         for item in items:
             if start_date <= item["date"] <= end_date:
                 collected.append(item)
 
-        time.sleep(0.2)
-
+    metrics.finish("page_range_end", kept=len(collected), seen=seen)
     return collected
 
 
@@ -0,0 +1,145 @@
+"""On-disk HTTP cache for crawler list pages.
+
+Entries are keyed by method + URL + query params + form data. Each entry is a
+``<key>.json`` metadata file and a zlib-compressed ``<key>.z`` body, sharded by
+the first two hex digits of the key.
+
+Modes:
+
+- ``use``: serve entries younger than ``ttl`` without touching the network;
+  older entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+  when the server sent validators, otherwise refetched.
+- ``refresh``: always ask the network (conditionally when possible).
+- ``offline``: never touch the network; a miss raises :class:`CacheMiss`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MODES = ("use", "refresh", "offline")
+DEFAULT_TTL = 3600.0
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+
+class CacheMiss(requests.ConnectionError):
+    """Offline mode and no cached entry for the request."""
+
+
+def _canonical(fields) -> list[list[str]]:
+    if not fields:
+        return []
+    items = fields.items() if isinstance(fields, dict) else fields
+    return sorted([str(k), str(v)] for k, v in items)
+
+
+def cache_key(method: str, url: str, params=None, data=None) -> str:
+    payload = json.dumps(
+        [method.upper(), url, _canonical(params), _canonical(data)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    encoding: str | None
+    stored_at: float
+    body: bytes
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def validators(self) -> dict[str, str]:
+        out = {}
+        if self.headers.get("ETag"):
+            out["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            out["If-Modified-Since"] = self.headers["Last-Modified"]
+        return out
+
+    def to_response(self) -> requests.Response:
+        res = requests.Response()
+        res.status_code = self.status_code
+        res._content = self.body
+        res.headers = CaseInsensitiveDict(self.headers)
+        res.encoding = self.encoding
+        res.url = self.url
+        res.reason = "OK (cached)"
+        return res
+
+
+class HttpCache:
+    def __init__(self, root: Path, *, ttl: float = DEFAULT_TTL, mode: str = "use") -> None:
+        if mode not in MODES:
+            raise ValueError(f"cache mode must be one of {MODES}, got {mode!r}")
+        self.root = Path(root)
+        self.ttl = ttl
+        self.mode = mode
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        shard = self.root / key[:2]
+        return shard / f"{key}.json", shard / f"{key}.z"
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = zlib.decompress(body_path.read_bytes())
+        except (OSError, ValueError, zlib.error):
+            return None
+        return CacheEntry(key=key, body=body, **meta)
+
+    def store(self, key: str, res: requests.Response) -> CacheEntry:
+        headers = {h: res.headers[h] for h in KEPT_HEADERS if h in res.headers}
+        entry = CacheEntry(
+            key=key,
+            url=res.url,
+            status_code=res.status_code,
+            headers=headers,
+            encoding=res.encoding,
+            stored_at=time.time(),
+            body=res.content,
+        )
+        self._write(entry)
+        return entry
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Mark a revalidated (304) entry fresh again."""
+        entry.stored_at = time.time()
+        self._write(entry, body=False)
+
+    def _write(self, entry: CacheEntry, *, body: bool = True) -> None:
+        meta_path, body_path = self._paths(entry.key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        if body:
+            _atomic_write(body_path, zlib.compress(entry.body, 6))
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "encoding": entry.encoding,
+            "stored_at": entry.stored_at,
+        }
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
@@ -0,0 +1,164 @@
+"""Per-board crawl checkpoints for resumable runs.
+
+Every board of a run gets one JSON file per period under the run's checkpoint
+directory (``<start>_to_<end>/<board>.json``), so periods crawled together by
+one run never share a file. While a board crawls, :func:`~crawler.engine.crawl_pages`
+appends each consumed list page's parsed rows to the board's file; when the
+board returns, its final items are stored and the board is marked done.
+
+A resumed run returns done boards straight from their files and replays an
+interrupted board's saved pages through the engine, so the network picks up at
+the first page that was never saved. A board file written for a different
+period (an incremental run narrowed to another watermark) is ignored, and so
+are saved pages fetched with other page-size fields than the resumed run
+negotiates (:mod:`crawler.pagesize`): pages of different sizes do not splice.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from .replay import board_slug
+
+_active: ContextVar["BoardCheckpoint | None"] = ContextVar("crawler_checkpoint", default=None)
+
+
+def encode(value: Any) -> Any:
+    """JSON-safe form of parsed rows (tuples and datetimes survive the round trip)."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, tuple):
+        return {"__tuple__": [encode(v) for v in value]}
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, dict):
+        return {key: encode(v) for key, v in value.items()}
+    return value
+
+
+def decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode(v) for v in value]
+    if isinstance(value, dict):
+        if set(value) == {"__datetime__"}:
+            return datetime.fromisoformat(value["__datetime__"])
+        if set(value) == {"__tuple__"}:
+            return tuple(decode(v) for v in value["__tuple__"])
+        return {key: decode(v) for key, v in value.items()}
+    return value
+
+
+class BoardCheckpoint:
+    """Saved pages and (once finished) items of one board for one period."""
+
+    def __init__(self, path: Path, board: str, period: tuple[str, str]) -> None:
+        self.path = path
+        self.board = board
+        self.period = list(period)
+        self.done = False
+        self.items: list | None = None
+        self.page_size: dict[str, int] | None = None
+        self._pages: dict[int, Any] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("board") == board and raw.get("period") == self.period:
+                self.done = raw.get("done", False)
+                self.items = decode(raw["items"]) if self.done else None
+                self.page_size = raw.get("page_size")
+                self._pages = {int(page): decode(rows) for page, rows in raw.get("pages", {}).items()}
+
+    @property
+    def pages(self) -> list[int]:
+        with self._lock:
+            return sorted(self._pages)
+
+    def has_page(self, page: int) -> bool:
+        with self._lock:
+            return page in self._pages
+
+    def page(self, page: int) -> Any:
+        with self._lock:
+            return self._pages[page]
+
+    def save_page(self, page: int, parsed: Any) -> None:
+        with self._lock:
+            self._pages[page] = parsed
+            self._write()
+
+    def use_page_size(self, extra: dict[str, int]) -> None:
+        """Record the page-size fields the board pages with; drop pages saved with others."""
+        with self._lock:
+            if self.page_size == extra:
+                return
+            if self._pages:
+                print(f"  └ [checkpoint] {self.board}: 페이지 크기 변경 {self.page_size} → {extra}, 저장 페이지 폐기", flush=True)
+            self.page_size = dict(extra)
+            self._pages = {}
+            self._write()
+
+    def complete(self, items: list) -> None:
+        with self._lock:
+            self.done = True
+            self.items = items
+            self._write()
+
+    def _write(self) -> None:
+        # Caller holds _lock.
+        payload = {
+            "board": self.board,
+            "period": self.period,
+            "done": self.done,
+            "items": encode(self.items) if self.done else None,
+            "page_size": self.page_size,
+            "pages": {str(page): encode(rows) for page, rows in sorted(self._pages.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class Checkpoints:
+    """Board checkpoints of one run under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def board(self, label: str, period: tuple[str, str]) -> BoardCheckpoint:
+        start, end = period
+        return BoardCheckpoint(self.root / f"{start}_to_{end}" / f"{board_slug(label)}.json", label, period)
+
+    def completed(self) -> list[str]:
+        """Labels of boards marked done, once per period."""
+        done = []
+        for path in sorted(self.root.glob("*/*.json")):
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("done"):
+                done.append(raw["board"])
+        return done
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def current() -> BoardCheckpoint | None:
+    return _active.get()
+
+
+@contextmanager
+def active(cp: BoardCheckpoint | None) -> Iterator[None]:
+    """Make ``cp`` the checkpoint the engine saves pages to (follows the board's context)."""
+    token = _active.set(cp)
+    try:
+        yield
+    finally:
+        _active.reset(token)
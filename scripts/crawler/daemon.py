@@ -0,0 +1,284 @@
+"""Long-running crawler: poll every board on its own schedule and merge new items.
+
+Each board is polled every ``BoardSpec.poll_interval`` seconds (± ``jitter``),
+starting at a random offset so boards of one host do not line up. A poll is an
+incremental crawl of that one board for the current quarter: list pages go
+through the HTTP cache in ``refresh`` mode, so an unchanged board costs a few
+304s. New items are merged into the quarter file (created with a full crawl
+when the quarter rolls over), its watermarks are saved, and every new item is
+appended to a compact JSONL change feed (and to the raw item store, when given).
+
+A board is never polled twice at once; the quarter file and its watermarks are
+only read-merged-written under one lock, so boards fetch in parallel but merge
+one at a time. A new quarter's full crawl runs outside that lock and only once:
+polls arriving meanwhile return without waiting for it, and once the file is
+written those boards are polled again within ``AFTER_CREATE`` seconds instead of
+a full interval later. ``on_change`` (the corpus refresh) runs from the scheduler
+thread, at most every ``refresh_every`` seconds and once more on shutdown.
+:meth:`Daemon.stop` lets in-flight polls finish before :meth:`Daemon.run`
+returns.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from . import incremental, itemstore, pagesize, transport, unified
+
+DEFAULT_WORKERS = 4
+JITTER = 0.1
+REFRESH_EVERY = 300.0
+IDLE_WAIT = 60.0
+AFTER_CREATE = 30.0  # polls turned away by a new quarter's crawl rerun within this spread (or their interval)
+
+
+@dataclass(frozen=True)
+class Change:
+    """One new item, as a change feed line."""
+
+    at: str
+    board: str
+    date: str
+    title: str
+    url: str
+    file: str
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, separators=(",", ":"))
+
+
+class Daemon:
+    """Poll ``specs`` for the quarter returned by ``period()`` until stopped.
+
+    ``output_path(start, end)`` and ``watermark_path(start, end)`` locate the
+    quarter file and its watermarks; ``on_change(paths)`` is called with the
+    quarter files that changed since the last call.
+    """
+
+    def __init__(
+        self,
+        specs: list[unified.BoardSpec],
+        *,
+        period: Callable[[], tuple[str, str]],
+        output_path: Callable[[str, str], Path],
+        watermark_path: Callable[[str, str], Path],
+        feed_path: Path,
+        net: transport.Transport | None = None,
+        page_sizes: pagesize.Negotiator | None = None,
+        items: itemstore.ItemStore | None = None,
+        on_change: Callable[[list[Path]], None] | None = None,
+        interval: float | None = None,
+        jitter: float = JITTER,
+        workers: int = DEFAULT_WORKERS,
+        refresh_every: float = REFRESH_EVERY,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.specs = specs
+        self.period = period
+        self.output_path = output_path
+        self.watermark_path = watermark_path
+        self.feed_path = Path(feed_path)
+        self.net = net
+        self.page_sizes = page_sizes
+        self.items = items
+        self.on_change = on_change
+        self.interval = interval
+        self.jitter = jitter
+        self.workers = max(1, workers)
+        self.refresh_every = refresh_every
+        self.rng = rng or random.Random()
+        self.polls = 0
+        self.failures = 0
+        self.new_items = 0
+        self._merge = threading.Lock()
+        self._create = threading.Lock()
+        self._state = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._in_flight: set[str] = set()
+        self._next_at: dict[str, float] = {}
+        self._waiting: set[str] = set()  # turned away while the quarter file is created
+        self._soon: set[str] = set()  # rescheduled while still in flight
+        self._dirty: set[Path] = set()
+
+    # ── polling ─────────────────────────────────────────────────────────────
+
+    def _context(self, start: str, end: str) -> unified.CrawlContext:
+        return unified.CrawlContext(
+            start, end, transport=self.net, page_sizes=self.page_sizes, items=self.items
+        )
+
+    def _ensure_file(self, start: str, end: str, key: str) -> Path | None:
+        """The quarter file; a new quarter gets a full crawl first (returned as None).
+
+        Only one poll crawls a new quarter; others (``key``) return None at once
+        instead of parking a worker behind it and are polled again soon after
+        the file is written. ``_merge`` is held only to write.
+        """
+        path = self.output_path(start, end)
+        if path.exists():
+            return path
+        with self._state:
+            if not self._create.acquire(blocking=False):
+                self._waiting.add(key)
+                return None
+        try:
+            if path.exists():
+                return path
+            ctx = self._context(start, end)
+            content = unified.run_collection(ctx)
+            with self._merge:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(path.suffix + ".tmp")
+                tmp.write_text(content, encoding="utf-8")
+                os.replace(tmp, path)
+                incremental.save_watermarks(self.watermark_path(start, end), unified.current_watermarks(ctx))
+        finally:
+            with self._state:
+                self._create.release()
+                waiting, self._waiting = self._waiting, set()
+                # After a failed crawl they keep their interval: no retry storm.
+                if path.exists():
+                    self._poll_soon(waiting)
+        print(f"[daemon] 새 분기 파일 생성 → {path}", flush=True)
+        self._changed(path, [])
+        return None
+
+    def poll(self, spec: unified.BoardSpec) -> int:
+        """Poll one board once; returns the number of new items merged."""
+        start, end = self.period()
+        path = self._ensure_file(start, end, spec.key)
+        if path is None:
+            return 0
+        marks_path = self.watermark_path(start, end)
+        with self._merge:
+            text = path.read_text(encoding="utf-8")
+            periods, _ = unified.plan_incremental(
+                self._context(start, end), text, [spec], incremental.load_watermarks(marks_path)
+            )
+        results = unified.fetch_boards(self._context(start, end), [spec], periods=periods)
+        with self._merge:
+            # Other boards may have merged while this one was fetching.
+            before = path.read_text(encoding="utf-8")
+            marks = incremental.load_watermarks(marks_path)
+            text, fresh, marks = unified.merge_new_items(before, [spec], results, marks)
+            unified.store_merged(self._context(start, end), before, [spec], fresh)
+            items = fresh[spec.key]
+            if items:
+                tmp = path.with_suffix(path.suffix + ".tmp")
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, path)
+            incremental.save_watermarks(marks_path, marks)
+        if items:
+            self._changed(path, [(spec.key, unified.item_row(i)) for i in items])
+        return len(items)
+
+    def _changed(self, path: Path, rows: list[tuple[str, tuple[str, str, str] | None]]) -> None:
+        at = datetime.now().isoformat(timespec="seconds")
+        changes = [Change(at, board, *row, file=path.name) for board, row in rows if row]
+        if changes:
+            self.feed_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.feed_path.open("a", encoding="utf-8") as f:
+                f.writelines(c.to_json() + "\n" for c in changes)
+            for c in changes:
+                print(f"[feed] +{c.board} ({c.date}) {c.title}", flush=True)
+        with self._state:
+            self.new_items += len(changes)
+            self._dirty.add(path)
+
+    def _poll_safely(self, spec: unified.BoardSpec) -> None:
+        try:
+            self.poll(spec)
+        except Exception as exc:
+            with self._state:
+                self.failures += 1
+            print(f"[daemon] {spec.key} 실패: {type(exc).__name__}: {exc}", flush=True)
+        finally:
+            with self._state:
+                self.polls += 1
+                self._in_flight.discard(spec.key)
+                if spec.key in self._soon:
+                    self._soon.discard(spec.key)
+                    self._next_at[spec.key] = self._after_create(spec)
+                else:
+                    self._next_at[spec.key] = time.monotonic() + self._interval(spec)
+            self._wake.set()
+
+    def _poll_soon(self, keys: set[str]) -> None:
+        # Called with _state held; a poll still in flight is rescheduled as it ends.
+        specs = {spec.key: spec for spec in self.specs}
+        for key in keys:
+            if key in self._in_flight:
+                self._soon.add(key)
+            else:
+                self._next_at[key] = self._after_create(specs[key])
+        self._wake.set()
+
+    def _after_create(self, spec: unified.BoardSpec) -> float:
+        return time.monotonic() + self.rng.uniform(0, min(AFTER_CREATE, self._interval(spec)))
+
+    # ── scheduling ──────────────────────────────────────────────────────────
+
+    def _interval(self, spec: unified.BoardSpec) -> float:
+        base = self.interval if self.interval is not None else spec.poll_interval
+        return base * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def _refresh(self) -> None:
+        with self._state:
+            if not self._dirty:
+                return
+            paths, self._dirty = sorted(self._dirty), set()
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(paths)
+        except Exception as exc:
+            print(f"[daemon] corpus 갱신 실패: {type(exc).__name__}: {exc}", flush=True)
+            with self._state:
+                self._dirty.update(paths)
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return once in-flight polls have finished."""
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self) -> None:
+        now = time.monotonic()
+        specs = {spec.key: spec for spec in self.specs}
+        for key, spec in specs.items():
+            base = self.interval if self.interval is not None else spec.poll_interval
+            self._next_at[key] = now + self.rng.uniform(0, self.jitter * base)
+        last_refresh = now
+        print(f"[daemon] 시작: {len(specs)} boards, workers={self.workers}", flush=True)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="daemon") as pool:
+            while not self._stopping.is_set():
+                self._wake.clear()
+                now = time.monotonic()
+                with self._state:
+                    due = [k for k, at in self._next_at.items() if at <= now and k not in self._in_flight]
+                    self._in_flight.update(due)
+                for key in due:
+                    pool.submit(self._poll_safely, specs[key])
+                if now - last_refresh >= self.refresh_every:
+                    self._refresh()
+                    last_refresh = now
+                with self._state:
+                    waiting = [at for k, at in self._next_at.items() if k not in self._in_flight]
+                timeout = min([IDLE_WAIT, *(at - now for at in waiting)])
+                self._wake.wait(max(0.0, timeout))
+            print("[daemon] 종료 중: 진행 중인 poll 대기", flush=True)
+            pool.shutdown(wait=True, cancel_futures=True)
+        self._refresh()
+        print(
+            f"[daemon] 종료: {self.polls} polls, +{self.new_items} items, {self.failures} failed",
+            flush=True,
+        )
@@ -0,0 +1,205 @@
+"""Near-duplicate items across boards — MinHash signatures and an LSH index.
+
+The same announcement is often posted on several boards (an FSC press release
+mirrored on FSS, a KICPA notice repeating a KASB one). Titles are normalized
+(NFKC, lower case, ``[보도자료]``-style tags and punctuation dropped), cut into
+character 3-grams and reduced to a MinHash signature. Signatures are banded
+into an LSH index, so only items sharing a band are compared: the pass is
+linear in the number of items rather than quadratic. Candidates are confirmed
+by the exact shingle Jaccard similarity and a posting-date window, and only
+items on different boards count. A board's nearest copy wins: an item whose
+same-day twin sits on another board is never also paired with an older post
+there, and titles a board repeats within the window (the biweekly
+"조사·감리결과 조치" notices) only match copies posted within
+``RECURRING_WINDOW_DAYS``.
+
+In a quarter file each later copy gets an inline marker after its link,
+``<!-- duplicate: <url of the earlier copy> -->``. MkDocs does not render it; the
+editor reads it to skip duplicates in bulk.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import unicodedata
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Collection
+
+from .incremental import APPENDIX_RE, HEADER_RE, item_key
+
+SHINGLE = 3
+BANDS = 8
+ROWS = 4
+THRESHOLD = 0.7
+WINDOW_DAYS = 14
+RECURRING_WINDOW_DAYS = 2
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20260101)  # fixed seed: signatures are stable across runs
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(BANDS * ROWS)]
+
+TAG_RE = re.compile(r"^\s*(?:[\[［(（【<〈][^\]］)）】>〉]{1,12}[\]］)）】>〉]\s*)+")
+NON_WORD_RE = re.compile(r"[\W_]+")
+ITEM_LINE_RE = re.compile(
+    r"^(- \((\d{2}-\d{2}-\d{2})\) \[(.+)\]\((https?://[^\s)]+)\))(?: <!-- duplicate: (\S+) -->)?\s*$"
+)
+MARKER = "<!-- duplicate: {url} -->"
+
+
+def normalize_title(title: str) -> str:
+    """Comparable form of a title: NFKC, lower case, no leading tags, letters and digits only."""
+    text = unicodedata.normalize("NFKC", title).lower()
+    return NON_WORD_RE.sub("", TAG_RE.sub("", text))
+
+
+@lru_cache(maxsize=65536)
+def shingles(title: str) -> frozenset[str]:
+    norm = normalize_title(title)
+    if len(norm) <= SHINGLE:
+        return frozenset([norm]) if norm else frozenset()
+    return frozenset(norm[i : i + SHINGLE] for i in range(len(norm) - SHINGLE + 1))
+
+
+@lru_cache(maxsize=65536)
+def signature(title: str) -> tuple[int, ...]:
+    """MinHash signature of the title's shingles (``BANDS * ROWS`` values)."""
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles(title)]
+    if not hashes:
+        return ()
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def jaccard(a: str, b: str) -> float:
+    sa, sb = shingles(a), shingles(b)
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+@dataclass(frozen=True)
+class Item:
+    board: str
+    date: str  # yy-mm-dd
+    title: str
+    url: str
+
+
+def _day(yymmdd: str) -> date | None:
+    try:
+        yy, mm, dd = (int(x) for x in yymmdd.split("-"))
+        return date(2000 + yy, mm, dd)
+    except ValueError:
+        return None
+
+
+def find_duplicates(
+    items: list[Item],
+    *,
+    threshold: float = THRESHOLD,
+    window_days: int = WINDOW_DAYS,
+) -> dict[int, int]:
+    """Map index of each later copy → index of the earlier copy it repeats.
+
+    Items are indexed in posting order (document order breaks ties) and every
+    pair within the window is a candidate, same-day items in both directions.
+    A pair is dropped when either item has a nearer match on the other item's
+    board, so a same-day mirror beats last meeting's notice; each copy then
+    points at its nearest earlier match. Matches are not chained, and LSH
+    buckets drop items older than the window, which keeps multi-year backfills
+    linear.
+    """
+    days = [_day(item.date) for item in items]
+    ordinals = [d.toordinal() if d else None for d in days]
+    keys = [item_key(item.url) for item in items]
+    order = sorted(range(len(items)), key=lambda i: (days[i] or date.max, i))
+    rank = {i: r for r, i in enumerate(order)}
+    buckets: dict[tuple[int, tuple[int, ...]], deque[int]] = {}
+
+    def gap(i: int, j: int) -> int:
+        return 0 if ordinals[i] is None or ordinals[j] is None else abs(ordinals[i] - ordinals[j])
+
+    pairs: list[tuple[int, int]] = []  # (earlier, later) in posting order, different boards
+    recurring: set[int] = set()  # items whose title the same board repeats within the window
+    for i in order:
+        item = items[i]
+        sig = signature(item.title)
+        if not sig:
+            continue
+        bands = [(band, sig[band * ROWS : (band + 1) * ROWS]) for band in range(BANDS)]
+        candidates = set()
+        for band in bands:
+            bucket = buckets.setdefault(band, deque())
+            # Posting order: anything older than the window never matches again.
+            while bucket and ordinals[bucket[0]] is not None and gap(i, bucket[0]) > window_days:
+                bucket.popleft()
+            candidates.update(bucket)
+        for j in candidates:
+            if gap(i, j) > window_days or keys[j] == keys[i] or jaccard(items[j].title, item.title) < threshold:
+                continue
+            if items[j].board == item.board:
+                recurring.update((i, j))
+            else:
+                pairs.append((j, i))
+        for band in bands:
+            buckets[band].append(i)
+
+    pairs = [
+        (j, i)
+        for j, i in pairs
+        if gap(i, j) <= RECURRING_WINDOW_DAYS or (i not in recurring and j not in recurring)
+    ]
+    nearest: dict[tuple[int, str], int] = {}  # (item, other board) -> smallest gap
+    for j, i in pairs:
+        g = gap(i, j)
+        for a, b in ((i, j), (j, i)):
+            key = (a, items[b].board)
+            nearest[key] = min(nearest.get(key, g), g)
+
+    out: dict[int, int] = {}
+    for j, i in sorted(pairs, key=lambda p: (gap(*p), rank[p[1]], p[0])):
+        g = gap(i, j)
+        if i in out or nearest[(i, items[j].board)] < g or nearest[(j, items[i].board)] < g:
+            continue
+        out[i] = j
+    return out
+
+
+def annotate(text: str, only: Collection[str] | None = None) -> tuple[str, int]:
+    """Mark near-duplicate link lines in the body of a quarter file.
+
+    Lines already marked keep their marker; returns (text, newly marked count).
+    With ``only`` (link URLs), just those lines may get a marker — every line
+    still counts as an earlier copy — so a merge leaves reviewed lines alone.
+    The Appendix is left untouched.
+    """
+    lines = text.split("\n")
+    agency = board = ""
+    found: list[tuple[int, Item, bool]] = []
+    for n, line in enumerate(lines):
+        if APPENDIX_RE.match(line):
+            break
+        header = HEADER_RE.match(line)
+        if header:
+            if len(header.group(1)) == 3:
+                agency, board = header.group(2), ""
+            elif len(header.group(1)) == 4:
+                board = header.group(2)
+            continue
+        m = ITEM_LINE_RE.match(line)
+        if m:
+            found.append((n, Item(f"{agency}/{board}", m.group(2), m.group(3), m.group(4)), bool(m.group(5))))
+
+    items = [item for _, item, _ in found]
+    marked = 0
+    for i, first in find_duplicates(items).items():
+        n, item, already = found[i]
+        if already or (only is not None and item.url not in only):
+            continue
+        lines[n] = f"{lines[n].rstrip()} {MARKER.format(url=items[first].url)}"
+        marked += 1
+    return "\n".join(lines), marked
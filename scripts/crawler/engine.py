@@ -0,0 +1,124 @@
+"""Async page pipeline for board crawlers.
+
+Board list pages are fetched ahead of the page being consumed, and each page is
+parsed in a worker thread, so network waits for pages N+1..N+k overlap with
+BeautifulSoup work on page N. Boards plug in their existing ``fetch_page`` and
+``parse_*`` functions; the stop condition is evaluated on pages in order.
+
+Inside a board with an active :mod:`crawler.checkpoint`, each consumed page is
+saved, and pages saved by an interrupted run are served without fetching.
+
+    pages = engine.crawl_pages(
+        lambda p: fetch_page(url, p),
+        parse_page,
+        itertools.count(1),
+        until=lambda page, items: not items,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from . import checkpoint, metrics
+
+DEFAULT_PREFETCH = 3
+
+
+def _capture(fn: Callable, *args) -> tuple[bool, Any]:
+    # Errors on speculative pages past the stop point must not surface, so
+    # results travel as (ok, value) and are only raised when consumed.
+    try:
+        return True, fn(*args)
+    except Exception as exc:  # noqa: BLE001
+        return False, exc
+
+
+async def crawl_pages_async(
+    fetch: Callable[[int], Any],
+    parse: Callable[[Any], Any],
+    pages: Iterable[int],
+    *,
+    until: Callable[[int, Any], bool] | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> list[tuple[int, Any]]:
+    """Return ``[(page, parsed), ...]`` in page order.
+
+    Up to ``prefetch`` pages beyond the one being consumed are in flight. The
+    first page for which ``until(page, parsed)`` is true is included and ends
+    the crawl; outstanding pages are cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    saved = checkpoint.current()
+    window = max(0, prefetch) + 1
+    executor = ThreadPoolExecutor(max_workers=window + 1, thread_name_prefix="crawl-page")
+
+    def in_thread(fn: Callable, *args):
+        ctx = contextvars.copy_context()
+        return loop.run_in_executor(executor, ctx.run, _capture, fn, *args)
+
+    async def fetch_and_parse(page: int) -> tuple[bool, Any]:
+        if saved is not None and saved.has_page(page):
+            metrics.response("checkpoint", 0)
+            return True, saved.page(page)
+        ok, raw = await in_thread(fetch, page)
+        if not ok:
+            return ok, raw
+        return await in_thread(parse, raw)
+
+    todo = iter(pages)
+    inflight: deque[tuple[int, asyncio.Task]] = deque()
+    results: list[tuple[int, Any]] = []
+
+    def fill() -> None:
+        while len(inflight) < window:
+            page = next(todo, None)
+            if page is None:
+                return
+            inflight.append((page, asyncio.ensure_future(fetch_and_parse(page))))
+
+    try:
+        fill()
+        while inflight:
+            page, task = inflight.popleft()
+            ok, value = await task
+            if not ok:
+                raise value
+            results.append((page, value))
+            if saved is not None and not saved.has_page(page):
+                saved.save_page(page, value)
+            if until is not None and until(page, value):
+                break
+            fill()
+    finally:
+        for _, task in inflight:
+            task.cancel()
+        if inflight:
+            await asyncio.gather(*(t for _, t in inflight), return_exceptions=True)
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def crawl_pages(
+    fetch: Callable[[int], Any],
+    parse: Callable[[Any], Any],
+    pages: Iterable[int] | None = None,
+    *,
+    until: Callable[[int, Any], bool] | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> list[tuple[int, Any]]:
+    """Synchronous entry point; runs the pipeline on a private event loop."""
+    return asyncio.run(
+        crawl_pages_async(
+            fetch,
+            parse,
+            itertools.count(1) if pages is None else pages,
+            until=until,
+            prefetch=prefetch,
+        )
+    )
@@ -0,0 +1,237 @@
+"""Incremental crawl — per-board watermarks and merge into an existing quarter file.
+
+A watermark is the newest post id (FSS ``nttId``/``lrgSlno``, FSC article id,
+KICPA ``bltnNo``, KASB ``seq``) and date seen on a board. Incremental runs start
+each board at its watermark date, keep only items newer than the watermark and
+not already in the file (by :func:`item_key`), and splice their link lines into the matching
+``####`` subsection and Appendix block without touching curation markers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .urls import canonical_url
+
+ID_PARAM_RE = re.compile(r"[?&](?:nttId|lrgSlno|seq|bltnNo)=(\d+)")
+FSC_ID_RE = re.compile(r"fsc\.go\.kr/[a-z]{2}\d+/(\d+)")
+LINK_RE = re.compile(r"^\s*- \((\d{2}-\d{2}-\d{2})\) \[(.+)\]\((https?://[^\s)]+)\)")
+APPENDIX_RE = re.compile(r"^## Appendix")
+HEADER_RE = re.compile(r"^(#{1,4})\s+(.+?)\s*$")
+APPENDIX_ORG_RE = re.compile(r'^    \?\?\? info "(.+)"\s*$')
+APPENDIX_SECTION_RE = re.compile(r"^        \*\*(.+)\*\*\s*$")
+
+
+def item_id(url: str) -> str | None:
+    m = ID_PARAM_RE.search(url) or FSC_ID_RE.search(url)
+    return m.group(1) if m else None
+
+
+def item_key(url: str) -> str:
+    """Identity of a post: host, path and its id parameter (``canonical_url`` otherwise).
+
+    Ids are only unique per board (KASB ``seq=1860`` and FSS ``lrgSlno=1860``
+    are different posts), so the board's host and path are part of the key,
+    while list-state params such as ``menuNo`` or ``curPage`` are not.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").removeprefix("www.")
+    m = ID_PARAM_RE.search(url)
+    if m:
+        return f"{host}{parts.path}?{m.group(0)[1:]}"
+    if FSC_ID_RE.search(url):
+        return f"{host}{parts.path}"
+    return canonical_url(url)
+
+
+@dataclass
+class Watermark:
+    id: str | None = None
+    date: str | None = None  # yy-mm-dd
+
+    def advance(self, rows) -> "Watermark":
+        best_id, best_date = self.id, self.date
+        for date, _title, url in rows:
+            rid = item_id(url)
+            if rid and (best_id is None or int(rid) > int(best_id)):
+                best_id = rid
+            if best_date is None or date > best_date:
+                best_date = date
+        return Watermark(best_id, best_date)
+
+    def is_newer(self, url: str) -> bool:
+        rid = item_id(url)
+        return self.id is None or rid is None or int(rid) > int(self.id)
+
+
+def board_period(mark: Watermark | None, start: str, end: str, narrow: bool) -> tuple[str, str]:
+    """Period to crawl a board: from its watermark date when ``narrow``."""
+    if not narrow or mark is None or not mark.date:
+        return start, end
+    since = "20" + mark.date
+    return max(start, min(since, end)), end
+
+
+def load_watermarks(path: Path) -> dict[str, Watermark]:
+    if not path.exists():
+        return {}
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return {key: Watermark(**val) for key, val in raw.items()}
+
+
+def save_watermarks(path: Path, marks: dict[str, Watermark]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    payload = {key: asdict(mark) for key, mark in sorted(marks.items())}
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def appendix_rows(text: str) -> dict[tuple[str, str], list[tuple[str, str, str]]]:
+    """Link rows per (agency, section) from the Appendix A block."""
+    out: dict[tuple[str, str], list[tuple[str, str, str]]] = {}
+    in_appendix = False
+    org = section = None
+    for line in text.splitlines():
+        if APPENDIX_RE.match(line):
+            in_appendix = True
+            continue
+        if not in_appendix:
+            continue
+        m = APPENDIX_ORG_RE.match(line)
+        if m:
+            org, section = m.group(1), None
+            continue
+        m = APPENDIX_SECTION_RE.match(line)
+        if m:
+            section = m.group(1)
+            continue
+        m = LINK_RE.match(line)
+        if m and org and section:
+            out.setdefault((org, section), []).append(m.groups())
+    return out
+
+
+def derive_watermarks(text: str) -> dict[tuple[str, str], Watermark]:
+    return {key: Watermark().advance(rows) for key, rows in appendix_rows(text).items()}
+
+
+def known_keys(text: str) -> set[str]:
+    """Item keys of every link already in the file (body and Appendix)."""
+    keys = set()
+    for line in text.splitlines():
+        m = LINK_RE.match(line)
+        if m:
+            keys.add(item_key(m.group(3)))
+    return keys
+
+
+def _last_content(lines: list[str], lo: int, hi: int) -> int:
+    """Index of the last non-blank line in ``lines[lo:hi]``, or ``lo - 1``."""
+    i = hi - 1
+    while i >= lo and not lines[i].strip():
+        i -= 1
+    return i
+
+
+def _merge_body(lines: list[str], agency: str, heading: str, new_lines: list[str]) -> None:
+    appendix = next((i for i, l in enumerate(lines) if APPENDIX_RE.match(l)), len(lines))
+    body_end = appendix
+    last = _last_content(lines, 0, appendix)
+    if last >= 0 and lines[last].strip() == "---":
+        body_end = last
+
+    agency_at = None
+    for i in range(body_end):
+        m = HEADER_RE.match(lines[i])
+        if m and len(m.group(1)) <= 3 and agency in m.group(2):
+            agency_at = i
+            break
+    if agency_at is None:
+        return
+    agency_end = next(
+        (i for i in range(agency_at + 1, body_end) if (m := HEADER_RE.match(lines[i])) and len(m.group(1)) <= 3),
+        body_end,
+    )
+
+    sub_at = next(
+        (i for i in range(agency_at + 1, agency_end) if lines[i].strip() == f"#### {heading}"),
+        None,
+    )
+    if sub_at is None:
+        at = _last_content(lines, agency_at, agency_end) + 1
+        lines[at:at] = ["", f"#### {heading}", "", *new_lines]
+        return
+
+    sub_end = next((i for i in range(sub_at + 1, agency_end) if HEADER_RE.match(lines[i])), agency_end)
+    last = _last_content(lines, sub_at + 1, sub_end)
+    if last <= sub_at:
+        lines[sub_at + 1 : sub_at + 1] = ["", *new_lines]
+    elif lines[last].startswith(" "):
+        lines[last + 1 : last + 1] = ["", *new_lines]
+    else:
+        lines[last + 1 : last + 1] = new_lines
+
+
+def _merge_appendix(
+    lines: list[str], agency: str, section: str, new_lines: list[str], newest_first: bool
+) -> None:
+    appendix = next((i for i, l in enumerate(lines) if APPENDIX_RE.match(l)), None)
+    if appendix is None:
+        return
+    indented = [" " * 8 + l if l.strip() else "" for l in new_lines]
+
+    org_at = next(
+        (i for i in range(appendix, len(lines)) if (m := APPENDIX_ORG_RE.match(lines[i])) and m.group(1) == agency),
+        None,
+    )
+    if org_at is None:
+        at = _last_content(lines, appendix, len(lines)) + 1
+        lines[at:at] = ["", f'    ??? info "{agency}"', "", f"        **{section}**", "", *indented]
+        return
+    org_end = next(
+        (i for i in range(org_at + 1, len(lines)) if lines[i].strip() and not lines[i].startswith(" " * 5)),
+        len(lines),
+    )
+
+    sec_at = next(
+        (i for i in range(org_at + 1, org_end) if (m := APPENDIX_SECTION_RE.match(lines[i])) and m.group(1) == section),
+        None,
+    )
+    if sec_at is None:
+        at = _last_content(lines, org_at, org_end) + 1
+        lines[at:at] = ["", f"        **{section}**", "", *indented]
+        return
+
+    first = sec_at + 1
+    while first < org_end and not lines[first].strip():
+        first += 1
+    last = first
+    while last < org_end and LINK_RE.match(lines[last]):
+        last += 1
+    at = first if newest_first else last
+    lines[at:at] = indented
+
+
+def merge_items(
+    text: str,
+    *,
+    agency: str,
+    heading: str,
+    section: str,
+    body_lines: list[str],
+    appendix_lines: list[str],
+    newest_first: bool = True,
+) -> str:
+    """Insert new link lines into the body subsection and Appendix block."""
+    lines = text.split("\n")
+    if body_lines:
+        _merge_body(lines, agency, heading, body_lines)
+    if appendix_lines:
+        _merge_appendix(lines, agency, section, appendix_lines, newest_first)
+    return "\n".join(lines)
@@ -0,0 +1,94 @@
+"""Raw crawl items, one JSONL file per period and board.
+
+Board adapters return items in their own shapes (FSS dicts, FSC markdown
+lines, KICPA dicts with datetimes, KASB tuples). :func:`~crawler.unified`
+normalizes them to :class:`RawItem` right after fetching, stores them here and
+renders the quarter file from the normalized items, so a change to the layout,
+sorting or Appendix format is a re-render of the store rather than a re-crawl::
+
+    .cache/crawler/items/2026-01-01_to_2026-03-31/금융감독원_보도자료.jsonl
+
+Lines keep the board's crawl order (the Appendix order). A full crawl replaces
+a board's file; incremental runs and the daemon add the items they merge
+(ahead of older ones on newest-first boards).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .replay import board_slug
+
+YYMMDD_RE = re.compile(r"\d{2}-\d{2}-\d{2}")
+
+
+@dataclass(frozen=True)
+class RawItem:
+    """One crawled item: board key, ISO date, title, URL, when and where it was listed."""
+
+    board: str
+    date: str  # YYYY-MM-DD (or the board's raw date text when it is not a date)
+    title: str
+    url: str
+    fetched_at: str | None = None
+    source: str | None = None
+
+    @classmethod
+    def from_row(
+        cls,
+        board: str,
+        row: tuple[str, str, str],
+        *,
+        fetched_at: str | None = None,
+        source: str | None = None,
+    ) -> "RawItem":
+        d, title, url = row
+        return cls(board, "20" + d if YYMMDD_RE.fullmatch(d) else d, title, url, fetched_at, source)
+
+    def row(self) -> tuple[str, str, str]:
+        """(yy-mm-dd, title, url), the shape every renderer takes."""
+        d = self.date[2:] if re.fullmatch(r"\d{4}-\d{2}-\d{2}", self.date) else self.date
+        return (d, self.title, self.url)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, separators=(",", ":"))
+
+
+class ItemStore:
+    """Raw items under ``root``, one directory per period and one file per board."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def path(self, start: str, end: str, board: str) -> Path:
+        return self.root / f"{start}_to_{end}" / f"{board_slug(board)}.jsonl"
+
+    def has(self, start: str, end: str, board: str) -> bool:
+        return self.path(start, end, board).exists()
+
+    def read(self, start: str, end: str, board: str) -> list[RawItem]:
+        """The board's items for the period in crawl order (FileNotFoundError if never stored)."""
+        with self.path(start, end, board).open(encoding="utf-8") as f:
+            return [RawItem(**json.loads(line)) for line in f if line.strip()]
+
+    def write(self, start: str, end: str, board: str, items: list[RawItem]) -> Path:
+        """Replace the board's items for the period."""
+        dest = self.path(start, end, board)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_suffix(".jsonl.tmp")
+        tmp.write_text("".join(i.to_json() + "\n" for i in items), encoding="utf-8")
+        os.replace(tmp, dest)
+        return dest
+
+    def add(self, start: str, end: str, board: str, items: list[RawItem]) -> None:
+        """Append items to the end of the board's file."""
+        if not items:
+            return
+        dest = self.path(start, end, board)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with dest.open("a", encoding="utf-8") as f:
+            f.writelines(i.to_json() + "\n" for i in items)
@@ -0,0 +1,161 @@
+"""Date-indexed page locator for newest-first boards with a known page count.
+
+KICPA boards have no server-side date filter, so a period has to be located by
+probing list pages. :class:`PageLocator` memoizes every page it loads (no page
+is fetched twice in a run), picks probes by interpolating on the observed
+date-per-page density (falling back to bisection when that stops shrinking the
+bracket), and runs the two boundary searches side by side over the shared memo.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable
+
+
+def _ordinal(d: datetime) -> float:
+    return d.toordinal() + (d.hour * 3600 + d.minute * 60 + d.second) / 86400
+
+
+class PageLocator:
+    def __init__(
+        self,
+        load: Callable[[int], list[dict]],
+        total_pages: int,
+        *,
+        seed: dict[int, list[dict]] | None = None,
+    ) -> None:
+        """``load(page)`` returns parsed items (each with a ``date`` datetime)."""
+        self._load = load
+        self.total_pages = max(1, total_pages)
+        self._pages: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self.fetched = 0
+        for page, items in (seed or {}).items():
+            done: Future = Future()
+            done.set_result(items)
+            self._pages[page] = done
+
+    # -- memo ---------------------------------------------------------------
+
+    def page(self, n: int) -> list[dict]:
+        with self._lock:
+            fut = self._pages.get(n)
+            owner = fut is None
+            if owner:
+                fut = self._pages[n] = Future()
+        if owner:
+            try:
+                items = self._load(n)
+            except BaseException as exc:
+                with self._lock:
+                    del self._pages[n]
+                fut.set_exception(exc)
+                raise
+            with self._lock:
+                self.fetched += 1
+            fut.set_result(items)
+        return fut.result()
+
+    def _known(self) -> dict[int, list[dict]]:
+        with self._lock:
+            done = {p: f for p, f in self._pages.items() if f.done() and not f.exception()}
+        return {p: f.result() for p, f in done.items()}
+
+    # -- search -------------------------------------------------------------
+
+    def first_page(
+        self,
+        key: Callable[[list[dict]], datetime],
+        pred: Callable[[datetime], bool],
+        target: datetime,
+    ) -> int:
+        """Smallest page whose ``key`` satisfies ``pred`` (``total_pages + 1`` if none).
+
+        ``key`` must be non-increasing in page number, ``pred`` monotone, and
+        ``target`` the date where ``pred`` flips (used to interpolate probes).
+        Empty pages count as satisfying ``pred`` (past the end of the board).
+        """
+
+        def holds(items: list[dict]) -> bool:
+            return not items or pred(key(items))
+
+        goal = _ordinal(target)
+        lo, hi = 0, self.total_pages + 1
+        interpolate = True
+        while True:
+            known = self._known()
+            for p, items in known.items():
+                if lo < p < hi:
+                    if holds(items):
+                        hi = p
+                    else:
+                        lo = p
+            if hi - lo <= 1:
+                return hi
+            width = hi - lo
+            probe = _interpolate(known, key, lo, hi, goal) if interpolate else None
+            if probe is None:
+                probe = (lo + hi) // 2
+            if holds(self.page(probe)):
+                hi = probe
+            else:
+                lo = probe
+            # Skewed density (a burst of posts, a quiet month) can make the
+            # estimate creep; take a bisection step whenever it failed to halve.
+            interpolate = (hi - lo) * 2 <= width
+
+    def find_range(self, start: datetime, end: datetime) -> tuple[int, int]:
+        """Pages ``(first, last)`` that can hold items dated within [start, end].
+
+        Both boundaries are searched concurrently over the shared memo, so a
+        probe made by one search also narrows the other. ``last < first``
+        means the period has no items on this board.
+        """
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="locate") as pool:
+            first = pool.submit(self.first_page, _oldest, lambda d: d <= end, end)
+            after = pool.submit(self.first_page, _newest, lambda d: d < start, start)
+            return first.result(), after.result() - 1
+
+    def items(self, first: int, last: int) -> list[dict]:
+        """All items on pages ``first..last`` (memoized pages are not refetched)."""
+        out: list[dict] = []
+        for n in range(first, last + 1):
+            out.extend(self.page(n))
+        return out
+
+
+def _oldest(items: list[dict]) -> datetime:
+    return min(item["date"] for item in items)
+
+
+def _newest(items: list[dict]) -> datetime:
+    return max(item["date"] for item in items)
+
+
+def _interpolate(
+    known: dict[int, list[dict]],
+    key: Callable[[list[dict]], datetime],
+    lo: int,
+    hi: int,
+    goal: float,
+) -> int | None:
+    """Estimate the page where ``key`` reaches ``goal`` from the loaded pages."""
+    points = sorted((p, _ordinal(key(items))) for p, items in known.items() if items)
+    if len(points) < 2:
+        return None
+    left = max((pt for pt in points if pt[0] <= lo), default=None)
+    right = min((pt for pt in points if pt[0] >= hi), default=None)
+    if left is not None and right is not None and left[1] != right[1]:
+        frac = (left[1] - goal) / (left[1] - right[1])
+        guess = left[0] + frac * (right[0] - left[0])
+    else:
+        # Extrapolate from the nearest side with the overall date-per-page density.
+        (p0, d0), (p1, d1) = points[0], points[-1]
+        anchor = left or right
+        if anchor is None or p1 == p0 or d0 == d1:
+            return None
+        guess = anchor[0] + (anchor[1] - goal) * (p1 - p0) / (d0 - d1)
+    return min(hi - 1, max(lo + 1, round(guess)))
@@ -0,0 +1,220 @@
+"""Per-board crawl telemetry.
+
+:func:`~crawler.unified.fetch_boards` runs each board inside :func:`board`,
+which sets a context variable that follows the board into transport calls and
+engine worker threads (the engine copies the context). The transport and the
+parser backend then attribute responses, status codes, latency, bytes and
+parse time to the board without any board code passing labels around; boards
+report their date filtering and why they stopped with :func:`finish`.
+
+:func:`report` summarizes a run (latency percentiles included) for the JSON
+report written next to the output file; :class:`LiveSummary` prints a one-line
+progress summary while a crawl runs.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Iterator
+
+_board: ContextVar[str | None] = ContextVar("crawler_board", default=None)
+
+
+@dataclass
+class BoardMetrics:
+    requests: int = 0
+    bytes: int = 0
+    items: int = 0
+    kept: int = 0
+    filtered: int = 0
+    seconds: float = 0.0
+    parse_seconds: float = 0.0
+    status: dict[str, int] = field(default_factory=dict)
+    latencies: list[float] = field(default_factory=list)
+    stop_reason: str | None = None
+    page_size: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+
+_boards: dict[str, BoardMetrics] = {}
+_lock = threading.Lock()
+
+
+def current_board() -> str | None:
+    return _board.get()
+
+
+@contextmanager
+def board(label: str) -> Iterator[None]:
+    token = _board.set(label)
+    try:
+        yield
+    finally:
+        _board.reset(token)
+
+
+def _current() -> BoardMetrics | None:
+    # Caller holds _lock.
+    label = _board.get()
+    if label is None:
+        return None
+    return _boards.setdefault(label, BoardMetrics())
+
+
+def record(**deltas: float) -> None:
+    """Add ``deltas`` to the current board's counters (no-op outside a board)."""
+    with _lock:
+        m = _current()
+        if m is None:
+            return
+        for name, delta in deltas.items():
+            setattr(m, name, getattr(m, name) + delta)
+
+
+def response(status: int | str, nbytes: int, seconds: float | None = None) -> None:
+    """One page served to the current board: HTTP status (or ``cache``/error name)."""
+    with _lock:
+        m = _current()
+        if m is None:
+            return
+        m.requests += 1
+        m.bytes += nbytes
+        m.status[str(status)] = m.status.get(str(status), 0) + 1
+        if seconds is not None:
+            m.latencies.append(seconds)
+
+
+def failure(kind: str, seconds: float) -> None:
+    """A request that produced no response (timeout, connection reset)."""
+    with _lock:
+        m = _current()
+        if m is None:
+            return
+        m.status[kind] = m.status.get(kind, 0) + 1
+        m.latencies.append(seconds)
+
+
+def finish(reason: str, *, kept: int, seen: int) -> None:
+    """Why the current board stopped and how many parsed items the date filter kept."""
+    with _lock:
+        m = _current()
+        if m is None:
+            return
+        m.stop_reason = reason
+        m.kept += kept
+        m.filtered += max(0, seen - kept)
+
+
+def stop(reason: str) -> None:
+    with _lock:
+        m = _current()
+        if m is not None:
+            m.stop_reason = reason
+
+
+def snapshot() -> dict[str, dict]:
+    with _lock:
+        return {label: asdict(m) for label, m in _boards.items()}
+
+
+def reset() -> None:
+    with _lock:
+        _boards.clear()
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile (``q`` in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(m: dict) -> dict:
+    lat = m["latencies"]
+
+    def ms(value: float | None) -> float | None:
+        return None if value is None else round(value * 1000, 1)
+
+    return {
+        "pages": m["requests"],
+        "page_size": m.get("page_size") or None,
+        "status": dict(sorted(m["status"].items())),
+        "bytes": m["bytes"],
+        "latency_ms": {
+            "p50": ms(percentile(lat, 50)),
+            "p90": ms(percentile(lat, 90)),
+            "p99": ms(percentile(lat, 99)),
+            "max": ms(max(lat) if lat else None),
+        },
+        "hedged": m.get("hedged", 0),
+        "hedge_wins": m.get("hedge_wins", 0),
+        "parse_ms": ms(m["parse_seconds"]),
+        "seconds": round(m["seconds"], 3),
+        "items": m["items"],
+        "kept": m["kept"],
+        "filtered": m["filtered"],
+        "stop_reason": m["stop_reason"],
+    }
+
+
+def report(**run: object) -> dict:
+    """Run-level fields plus a summary per board (slowest first)."""
+    boards = {label: summarize(m) for label, m in snapshot().items()}
+    ordered = dict(sorted(boards.items(), key=lambda kv: -kv[1]["seconds"]))
+    return {**run, "boards": ordered}
+
+
+def format_table(boards: dict[str, dict]) -> str:
+    lines = [f"{'board':<24} {'sec':>6} {'pages':>5} {'KB':>6} {'p50ms':>6} {'p90ms':>6} {'parse':>7} {'kept':>5} {'filt':>5}  stop"]
+    for label, b in boards.items():
+        lat = b["latency_ms"]
+        lines.append(
+            f"{label:<24} {b['seconds']:>6.1f} {b['pages']:>5} {b['bytes'] / 1024:>6.0f} "
+            f"{lat['p50'] or 0:>6.0f} {lat['p90'] or 0:>6.0f} {b['parse_ms'] or 0:>6.0f}ms "
+            f"{b['kept']:>5} {b['filtered']:>5}  {b['stop_reason'] or '-'}"
+        )
+    return "\n".join(lines)
+
+
+class LiveSummary:
+    """Background thread printing one progress line every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 2.0) -> None:
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._t0 = 0.0
+
+    def line(self) -> str:
+        snap = snapshot()
+        pages = sum(m["requests"] for m in snap.values())
+        kb = sum(m["bytes"] for m in snap.values()) / 1024
+        running = [label for label, m in snap.items() if not m["seconds"]]
+        done = len(snap) - len(running)
+        return (
+            f"[live] {time.monotonic() - self._t0:5.1f}s · {pages} pages · {kb:.0f} KB · "
+            f"{done} boards done · running: {', '.join(running) or '-'}"
+        )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            print(self.line(), flush=True)
+
+    def __enter__(self) -> "LiveSummary":
+        self._t0 = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="crawl-live", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,178 @@
+"""Per-board page-size negotiation.
+
+Every board adapter declares a :class:`PageSize`: the rows a list page holds by
+default and the request fields eGov-style boards commonly accept for a larger
+page (``pageUnit``, ``pageSize``, ``recordCountPerPage``, ...). When a
+:class:`Negotiator` is active (:func:`using`, bound per board like the
+transport), the adapter calls :func:`params` before paging. Each (field, size)
+candidate is probed with page 1, largest first. The first one the server
+verifiably honours wins:
+
+- the page holds more rows than the default, and
+- it holds exactly ``size`` rows, and the page reports a larger total
+  (``총 123건``) or no total at all.
+
+A probe that cannot prove anything never wins: the whole period fits on one
+default page, or on one page of ``size`` rows (45 rows at ``size=100`` shows
+only that the server allows 45). The outcome, the winning size or the default
+when none was proven, is kept per board in a small JSON file and reused for
+``ttl`` seconds, so probing costs a few requests per board per week whatever
+it found. Only a board whose probes all failed is probed again next run. Page
+size only changes how many list pages a crawl requests, never which items it
+sees: every board still pages until its own stop condition.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from . import checkpoint, metrics
+
+DEFAULT_TTL = 7 * 24 * 3600.0
+TOTAL_RE = re.compile(
+    r"(?:총|전체|Total)\s*[:：]?\s*(?:<[^>]*>\s*)*([\d,]+)\s*(?:<[^>]*>\s*)*(?:건|개|records)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class PageSize:
+    """A board's default rows per page and the page-size fields worth probing."""
+
+    default: int
+    fields: tuple[str, ...]
+    sizes: tuple[int, ...] = (100, 50, 30)
+
+
+def reported_total(html: str) -> int | None:
+    """Total item count printed on a list page (``총 1,234건``), if any."""
+    m = TOTAL_RE.search(html)
+    return int(m.group(1).replace(",", "")) if m else None
+
+
+def honoured(size: int, rows: int, total: int | None, default: int) -> bool | None:
+    """Whether the server serves ``size`` rows per page (None: the probe cannot tell)."""
+    if total is not None and total <= size and rows == total:
+        return None
+    return rows > default and rows == size
+
+
+class Negotiator:
+    """Probes and remembers each board's largest honoured page size.
+
+    ``path`` (optional) persists results between runs; entries older than
+    ``ttl`` are probed again.
+    """
+
+    def __init__(self, path: Path | None = None, *, ttl: float = DEFAULT_TTL) -> None:
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._board_locks: dict[str, threading.Lock] = {}
+        self._known: dict[str, dict] = {}
+        if self.path and self.path.exists():
+            self._known = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def _board_lock(self, board: str) -> threading.Lock:
+        with self._lock:
+            return self._board_locks.setdefault(board, threading.Lock())
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            payload = json.dumps(self._known, ensure_ascii=False, indent=2, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(payload + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def negotiate(
+        self,
+        board: str,
+        spec: PageSize,
+        probe: Callable[[dict[str, int]], tuple[int, int | None]],
+    ) -> dict[str, int]:
+        """Extra request fields for ``board`` ({} = the default page size).
+
+        ``probe(fields)`` fetches page 1 with ``fields`` added and returns
+        (rows parsed, reported total or None).
+        """
+        with self._board_lock(board):
+            with self._lock:
+                known = self._known.get(board)
+            if known and time.time() - known["checked"] < self.ttl:
+                return {known["field"]: known["size"]} if known["field"] else {}
+
+            result, answered = None, False
+            for size in sorted(spec.sizes, reverse=True):
+                for name in spec.fields:
+                    try:
+                        rows, total = probe({name: size})
+                    except Exception as exc:
+                        print(f"  └ [page-size] {board} {name}={size} 실패: {type(exc).__name__}", flush=True)
+                        continue
+                    answered = True
+                    if total is not None and total <= spec.default:
+                        break  # the whole period fits one default page: nothing to learn
+                    if honoured(size, rows, total, spec.default):
+                        result = (name, size)
+                        break
+                else:
+                    continue
+                break
+            if not answered:
+                return {}
+            name, size = result or (None, spec.default)
+            with self._lock:
+                self._known[board] = {"field": name, "size": size, "checked": time.time()}
+            print(f"  └ [page-size] {board}: {f'{name}={size}' if name else f'기본 {spec.default}행'}", flush=True)
+        self._save()
+        return {name: size} if name else {}
+
+
+_active: ContextVar[Negotiator | None] = ContextVar("crawler_page_sizes", default=None)
+
+
+def current() -> Negotiator | None:
+    return _active.get()
+
+
+@contextmanager
+def using(negotiator: Negotiator | None) -> Iterator[None]:
+    """Let boards in this context negotiate page sizes through ``negotiator``."""
+    token = _active.set(negotiator)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def params(
+    board: str,
+    spec: PageSize,
+    probe: Callable[[dict[str, int]], tuple[int, int | None]],
+) -> dict[str, int]:
+    """Page-size fields for ``board`` from the active negotiator ({} when none).
+
+    The board's checkpoint records them, so a resume never mixes pages of
+    different sizes.
+    """
+    negotiator = current()
+    extra: dict[str, int] = {}
+    if negotiator is not None:
+        extra = negotiator.negotiate(board, spec, probe)
+        metrics.record(page_size=next(iter(extra.values()), spec.default))
+    cp = checkpoint.current()
+    if cp is not None:
+        cp.use_page_size(extra)
+    return extra
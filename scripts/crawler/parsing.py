@@ -0,0 +1,92 @@
+"""Pluggable HTML parser backend for the board list parsers.
+
+Backends:
+
+- ``strained`` (default): lxml, building only the subtree named by the first
+  step of the row selector (``table.table_st02`` for ``table.table_st02 tbody
+  tr``) via :class:`~bs4.SoupStrainer`; navigation, scripts and footers are
+  never turned into Python objects.
+- ``lxml``: lxml over the whole page.
+- ``html.parser``: the stdlib parser over the whole page (previous behaviour).
+
+Without lxml installed, ``strained`` and ``lxml`` use ``html.parser``. When a
+restricted parse lost the selector's container element itself (the first
+step, e.g. ``table.table_st02``), :func:`select` reparses the full page with
+``html.parser`` so a markup change degrades to the old behaviour instead of an
+empty board. A container without rows is an empty page (a board's last page,
+or an empty board) and is returned as is.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from . import metrics
+
+BACKENDS = ("strained", "lxml", "html.parser")
+DEFAULT_BACKEND = "strained"
+
+try:
+    import lxml  # noqa: F401
+
+    _FAST = "lxml"
+except ImportError:  # pragma: no cover - lxml is in requirements.txt
+    _FAST = "html.parser"
+
+_STEP_RE = re.compile(r"^([a-zA-Z][\w-]*)?(?:\.([\w-]+))?$")
+
+_backend = os.environ.get("CRAWLER_PARSER", DEFAULT_BACKEND)
+
+
+def set_backend(name: str) -> None:
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"parser backend must be one of {BACKENDS}, got {name!r}")
+    _backend = name
+
+
+def backend() -> str:
+    return _backend
+
+
+def _first_step(selector: str) -> str:
+    return selector.split()[0].split(">")[0]
+
+
+def strainer(selector: str) -> SoupStrainer | None:
+    """SoupStrainer for the first ``tag``/``.class``/``tag.class`` step of ``selector``."""
+    m = _STEP_RE.match(_first_step(selector))
+    if not m or not any(m.groups()):
+        return None
+    tag, cls = m.groups()
+    return SoupStrainer(tag, class_=cls) if cls else SoupStrainer(tag)
+
+
+def parse(html: str, only: str | None = None, *, backend: str | None = None) -> BeautifulSoup:
+    """Parse ``html``; with the ``strained`` backend, keep only ``only`` subtrees."""
+    name = backend or _backend
+    if name == "html.parser":
+        return BeautifulSoup(html, "html.parser")
+    if name == "lxml" or only is None:
+        return BeautifulSoup(html, _FAST)
+    return BeautifulSoup(html, _FAST, parse_only=strainer(only))
+
+
+def select(html: str, selector: str, *, backend: str | None = None) -> list:
+    """``soup.select(selector)`` over the smallest tree the backend allows."""
+    t0 = time.perf_counter()
+    soup = parse(html, selector, backend=backend)
+    rows = soup.select(selector)
+    if not rows and (backend or _backend) != "html.parser" and soup.select_one(_first_step(selector)) is None:
+        rows = BeautifulSoup(html, "html.parser").select(selector)
+    metrics.record(parse_seconds=time.perf_counter() - t0)
+    return rows
+
+
+def select_one(html: str, selector: str, *, backend: str | None = None):
+    found = select(html, selector, backend=backend)
+    return found[0] if found else None
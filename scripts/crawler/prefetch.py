@@ -0,0 +1,188 @@
+"""Optional crawl stage: prefetch detail pages and attachments for the editor.
+
+For every link in a quarter file a bounded pool fetches the detail page, finds
+its attachments — FSS/FSC/KICPA file-list anchors and KASB
+``fileDownload(fileNo, fileSeq)`` buttons (a POST to ``fileDownload.do``) —
+and stores every body in a :class:`~crawler.store.ContentStore`. The editor's
+preview, proxy and save routes read that store before going to the network.
+
+Items already in the store are skipped, so rerunning after an incremental
+crawl only fetches what is new. Failures are counted and logged, never fatal:
+the editor can still fetch those links live.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+from . import parsing, transport
+from .incremental import LINK_RE
+from .store import ContentStore, request_key
+
+DEFAULT_JOBS = 4
+MAX_BYTES = 30 * 1024 * 1024
+ALLOWED_HOSTS = ("fss.or.kr", "fsc.go.kr", "kicpa.or.kr", "kasb.or.kr")
+KASB_FILE_URL = "https://www.kasb.or.kr/commonFile/fileDownload.do"
+KASB_FILE_RE = re.compile(r"fileDownload\s*\(\s*['\"]?(-?\d+)['\"]?\s*,\s*['\"]?(\d+)['\"]?\s*\)")
+FILE_HREF_RE = re.compile(r"fileDown|download|getFile|\.(?:pdf|hwpx?|docx?|xlsx?|zip)(?:$|[?#])", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Fetch:
+    method: str
+    url: str
+    data: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def key(self) -> str:
+        return request_key(self.url, dict(self.data))
+
+
+@dataclass
+class PrefetchStats:
+    pages: int = 0
+    attachments: int = 0
+    bytes: int = 0
+    skipped: int = 0
+    failed: int = 0
+    failures: list[str] = field(default_factory=list)
+
+
+def allowed(url: str) -> bool:
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in ALLOWED_HOSTS)
+
+
+def links_in(text: str) -> list[str]:
+    """Item links of a quarter file (body and Appendix), first occurrence order."""
+    seen: dict[str, None] = {}
+    for line in text.splitlines():
+        m = LINK_RE.match(line)
+        if m:
+            seen.setdefault(m.group(3), None)
+    return list(seen)
+
+
+def attachments(page_url: str, html: str) -> list[Fetch]:
+    """Attachment requests found on a detail page."""
+    found: dict[str, Fetch] = {}
+    for a in parsing.select(html, "a"):
+        onclick = a.get("onclick") or ""
+        href = a.get("href") or ""
+        m = KASB_FILE_RE.search(onclick) or KASB_FILE_RE.search(href)
+        if m:
+            req = Fetch("POST", KASB_FILE_URL, (("fileNo", m.group(1)), ("fileSeq", m.group(2))))
+        elif href and not href.startswith(("#", "javascript:")) and FILE_HREF_RE.search(href):
+            req = Fetch("GET", urljoin(page_url, href))
+        else:
+            continue
+        if allowed(req.url):
+            found.setdefault(req.key, req)
+    return list(found.values())
+
+
+class Prefetcher:
+    def __init__(self, store: ContentStore, *, net: transport.Transport | None = None, max_bytes: int = MAX_BYTES) -> None:
+        self.store = store
+        self._owns_net = net is None
+        self.net = net or transport.Transport()
+        self.max_bytes = max_bytes
+        self.stats = PrefetchStats()
+        self._lock = threading.Lock()
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    def _fail(self, req: Fetch, reason: str) -> None:
+        with self._lock:
+            self.stats.failed += 1
+            self.stats.failures.append(f"{req.key}: {reason}")
+        print(f"  └ [prefetch] {req.key} 실패: {reason}", flush=True)
+
+    def fetch(self, req: Fetch) -> bytes | None:
+        """Body of ``req`` (from the store if already there); None on failure."""
+        hit = self.store.read(req.key)
+        if hit is not None:
+            self._count(skipped=1)
+            return hit[1]
+        try:
+            if req.method == "POST":
+                res = self.net.post(req.url, data=dict(req.data))
+            else:
+                res = self.net.get(req.url)
+        except requests.RequestException as exc:
+            self._fail(req, type(exc).__name__)
+            return None
+        if not 200 <= res.status_code < 300:
+            self._fail(req, f"HTTP {res.status_code}")
+            return None
+        body = res.content
+        if not body or len(body) > self.max_bytes:
+            self._fail(req, "empty body" if not body else "too large")
+            return None
+        self.store.put(
+            req.key,
+            body,
+            content_type=res.headers.get("Content-Type"),
+            content_disposition=res.headers.get("Content-Disposition"),
+            final_url=res.url,
+        )
+        self._count(bytes=len(body))
+        return body
+
+    def item(self, url: str) -> None:
+        page = Fetch("GET", url)
+        fresh = page.key not in self.store
+        body = self.fetch(page)
+        if body is None:
+            return
+        if fresh:
+            self._count(pages=1)
+        html = body.decode("utf-8", errors="replace")
+        for req in attachments(url, html):
+            fresh = req.key not in self.store
+            if self.fetch(req) is not None and fresh:
+                self._count(attachments=1)
+
+    def run(self, links: list[str], jobs: int = DEFAULT_JOBS) -> PrefetchStats:
+        links = [u for u in links if allowed(u)]
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="prefetch") as pool:
+                list(pool.map(self.item, links))
+        finally:
+            self.store.save()
+            if self._owns_net:
+                self.net.close()
+        return self.stats
+
+
+def prefetch_files(
+    paths: list[Path],
+    store: ContentStore,
+    *,
+    jobs: int = DEFAULT_JOBS,
+    net: transport.Transport | None = None,
+) -> PrefetchStats:
+    """Prefetch every item linked from the given quarter files into ``store``."""
+    links: dict[str, None] = {}
+    for path in paths:
+        for url in links_in(path.read_text(encoding="utf-8")):
+            links.setdefault(url, None)
+    return Prefetcher(store, net=net).run(list(links), jobs=jobs)
+
+
+def format_stats(stats: PrefetchStats) -> str:
+    s = asdict(stats)
+    return (
+        f"{s['pages']} pages, {s['attachments']} attachments, {s['bytes'] / 1024:.0f} KB stored, "
+        f"{s['skipped']} already stored, {s['failed']} failed"
+    )
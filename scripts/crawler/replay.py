@@ -0,0 +1,197 @@
+"""Record/replay of crawler HTTP traffic.
+
+Record mode wraps each host's real adapter and saves every request→response
+pair under the board that made it (:func:`crawler.metrics.current_board`), one
+cassette file per board::
+
+    <root>/meta.json                 {"start": ..., "end": ...}
+    <root>/<board slug>.json         {"board": ..., "entries": [...]}
+
+Replay mode serves the cassettes from a stand-in adapter with a configurable
+latency and jitter per response, so boards can be benchmarked and regression
+tested without touching the agency sites. Entries are keyed by method, full
+URL (query included) and request body.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from . import metrics
+from .cache import KEPT_HEADERS
+from .transport import Transport
+
+SHARED = "_shared"
+
+
+class ReplayMiss(requests.ConnectionError):
+    """No recorded response for the request."""
+
+
+def request_key(request: requests.PreparedRequest) -> str:
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256(f"{request.method.upper()} {request.url}\n".encode("utf-8"))
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def board_slug(label: str) -> str:
+    return re.sub(r"[^\w]+", "_", label).strip("_") or SHARED
+
+
+class Cassettes:
+    """Recorded entries for every board under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._boards: dict[str, dict[str, dict]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, label: str, request: requests.PreparedRequest, res: requests.Response) -> None:
+        entry = {
+            "method": request.method,
+            "url": request.url,
+            "status_code": res.status_code,
+            "headers": {h: res.headers[h] for h in KEPT_HEADERS if h in res.headers},
+            "encoding": res.encoding,
+            "body": base64.b64encode(zlib.compress(res.content, 6)).decode("ascii"),
+        }
+        with self._lock:
+            self._boards.setdefault(label, {})[request_key(request)] = entry
+
+    def save(self, meta: dict | None = None) -> list[Path]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        if meta is not None:
+            (self.root / "meta.json").write_text(
+                json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+            )
+        written = []
+        with self._lock:
+            boards = {label: dict(entries) for label, entries in self._boards.items()}
+        for label, entries in sorted(boards.items()):
+            path = self.root / f"{board_slug(label)}.json"
+            payload = {"board": label, "entries": [{"key": k, **v} for k, v in sorted(entries.items())]}
+            path.write_text(json.dumps(payload, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+            written.append(path)
+        return written
+
+    @classmethod
+    def load(cls, root: Path) -> "Cassettes":
+        self = cls(root)
+        for path in sorted(self.root.glob("*.json")):
+            if path.name == "meta.json":
+                continue
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            self._boards[payload["board"]] = {e.pop("key"): e for e in payload["entries"]}
+        return self
+
+    def meta(self) -> dict:
+        path = self.root / "meta.json"
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+    def boards(self) -> list[str]:
+        return sorted(self._boards)
+
+    def lookup(self, key: str) -> dict | None:
+        with self._lock:
+            for entries in self._boards.values():
+                if key in entries:
+                    return entries[key]
+        return None
+
+
+class RecordingAdapter(BaseAdapter):
+    """Pass requests to ``inner`` and record each response under the current board."""
+
+    def __init__(self, cassettes: Cassettes, inner: BaseAdapter) -> None:
+        super().__init__()
+        self.cassettes = cassettes
+        self.inner = inner
+        self.poolmanager = getattr(inner, "poolmanager", None)
+
+    def send(self, request, **kwargs):
+        res = self.inner.send(request, **kwargs)
+        self.cassettes.add(metrics.current_board() or SHARED, request, res)
+        return res
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serve recorded responses after ``latency ± jitter`` seconds."""
+
+    def __init__(
+        self,
+        cassettes: Cassettes,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.cassettes = cassettes
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self._lock:
+            noise = self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + noise)
+
+    def send(self, request, **kwargs):
+        entry = self.cassettes.lookup(request_key(request))
+        if entry is None:
+            raise ReplayMiss(f"no recording for {request.method} {request.url}", request=request)
+        wait = self.delay()
+        if wait:
+            time.sleep(wait)
+        res = requests.Response()
+        res.status_code = entry["status_code"]
+        res.headers = CaseInsensitiveDict(entry["headers"])
+        res.encoding = entry["encoding"]
+        res._content = zlib.decompress(base64.b64decode(entry["body"]))
+        res.url = request.url
+        res.request = request
+        res.reason = "OK (replay)"
+        res.connection = self
+        return res
+
+    def close(self) -> None:
+        pass
+
+
+def recording_transport(cassettes: Cassettes, **kwargs) -> Transport:
+    return Transport(
+        adapter=lambda size: RecordingAdapter(cassettes, HTTPAdapter(pool_connections=1, pool_maxsize=size)),
+        **kwargs,
+    )
+
+
+def replay_transport(
+    cassettes: Cassettes,
+    *,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    seed: int | None = None,
+    **kwargs,
+) -> Transport:
+    adapter = ReplayAdapter(cassettes, latency=latency, jitter=jitter, seed=seed)
+    kwargs.setdefault("retries", 0)
+    return Transport(adapter=lambda size: adapter, **kwargs)
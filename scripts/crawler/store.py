@@ -0,0 +1,125 @@
+"""Content-addressed store for prefetched detail pages and attachments.
+
+Bodies live once under ``objects/<sha256[:2]>/<sha256>``; ``index.json`` maps
+each request key to its hash plus the response headers the editor needs
+(content type, content disposition, final URL). A GET is keyed by its
+canonical URL (:mod:`crawler.urls`), a POST (KASB ``fileDownload.do``) by its
+URL with the sorted form fields as a query string, so the editor can look up
+either without refetching, whatever list page the link was copied from.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlencode
+
+from .urls import canonical_url
+
+INDEX_NAME = "index.json"
+
+
+def request_key(url: str, data: dict[str, str] | None = None) -> str:
+    if not data:
+        return canonical_url(url)
+    return f"{url}?{urlencode(sorted(data.items()))}"
+
+
+@dataclass(frozen=True)
+class Entry:
+    sha256: str
+    size: int
+    content_type: str | None = None
+    content_disposition: str | None = None
+    final_url: str | None = None
+
+
+class ContentStore:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._index: dict[str, Entry] = {}
+        path = self.root / INDEX_NAME
+        if path.exists():
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            self._index = {key: Entry(**val) for key, val in raw.items()}
+
+    def object_path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / sha256
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._index.get(key)
+        return entry is not None and self.object_path(entry.sha256).exists()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def entry(self, key: str) -> Entry | None:
+        with self._lock:
+            return self._index.get(key)
+
+    def read(self, key: str) -> tuple[Entry, bytes] | None:
+        entry = self.entry(key)
+        if entry is None:
+            return None
+        try:
+            return entry, self.object_path(entry.sha256).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        *,
+        content_type: str | None = None,
+        content_disposition: str | None = None,
+        final_url: str | None = None,
+    ) -> Entry:
+        """Store ``body`` (once per hash) and point ``key`` at it."""
+        sha = hashlib.sha256(body).hexdigest()
+        path = self.object_path(sha)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{sha}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        entry = Entry(sha, len(body), content_type, content_disposition, final_url)
+        with self._lock:
+            self._index[key] = entry
+        return entry
+
+    def save(self) -> Path:
+        """Write the URL → hash index atomically."""
+        with self._lock:
+            payload = {key: asdict(entry) for key, entry in sorted(self._index.items())}
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / INDEX_NAME
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+_opened: dict[Path, tuple[int, ContentStore]] = {}
+_opened_lock = threading.Lock()
+
+
+def open_store(root: Path) -> ContentStore | None:
+    """Read-side store for ``root``, reloaded when its index changes; None if absent."""
+    path = Path(root) / INDEX_NAME
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _opened_lock:
+        cached = _opened.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = _opened[path] = (mtime, ContentStore(root))
+        return cached[1]
@@ -0,0 +1,160 @@
+"""Per-host adaptive rate control (AIMD) for the shared transport.
+
+Each host has a concurrency limit and a minimum spacing between request
+starts. Healthy responses — not 429/5xx and no latency blow-up — raise the
+limit additively (about +1 per limit's worth of requests) and shrink the
+spacing toward ``min_interval``. A 429, a 5xx or a connection reset halves the
+limit and doubles the spacing; a ``Retry-After`` puts the whole host on hold,
+not just the request that saw it. Latency counts as unhealthy once its moving
+average exceeds ``slow_factor`` times the fastest response seen on the host.
+
+Hedged duplicates (see :mod:`crawler.transport`) take a reserved per-host
+slot instead of a regular one: the request they duplicate is usually the one
+holding the host's last slot, so waiting behind it would defeat the hedge.
+They still honour a ``Retry-After`` hold.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+DEFAULT_MIN_INTERVAL = 0.1
+DEFAULT_INITIAL_LIMIT = 2.0
+DEFAULT_MAX_LIMIT = 4
+MAX_INTERVAL = 10.0
+SLOW_FACTOR = 3.0
+EWMA_WEIGHT = 0.2
+HEDGE_SLOTS = 1  # per host, outside the concurrency limit and spacing
+
+
+@dataclass
+class HostState:
+    limit: float
+    interval: float
+    inflight: int = 0
+    hedging: int = 0
+    next_start: float = 0.0
+    hold_until: float = 0.0
+    fastest: float | None = None
+    ewma: float | None = None
+    increases: int = 0
+    backoffs: int = 0
+
+
+class HostThrottle:
+    def __init__(
+        self,
+        *,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        initial_limit: float = DEFAULT_INITIAL_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        max_interval: float = MAX_INTERVAL,
+        slow_factor: float = SLOW_FACTOR,
+    ) -> None:
+        self.min_interval = max(0.0, min_interval)
+        self.initial_limit = max(1.0, min(initial_limit, max_limit))
+        self.max_limit = max(1, max_limit)
+        self.max_interval = max_interval
+        self.slow_factor = slow_factor
+        self._hosts: dict[str, HostState] = {}
+        self._cond = threading.Condition()
+
+    def _state(self, host: str) -> HostState:
+        st = self._hosts.get(host)
+        if st is None:
+            st = self._hosts[host] = HostState(limit=self.initial_limit, interval=self.min_interval)
+        return st
+
+    def acquire(self, host: str, timeout: float | None = None, *, hedge: bool = False) -> bool:
+        """Block until ``host`` has a free slot, its spacing elapsed and no hold.
+
+        Returns False if that takes longer than ``timeout`` seconds (None = no
+        limit). ``hedge`` waits for the host's reserved hedge slot and its hold
+        only.
+        """
+        with self._cond:
+            st = self._state(host)
+            end = None if timeout is None else time.monotonic() + timeout
+            while True:
+                now = time.monotonic()
+                if hedge:
+                    wait = max(st.hold_until - now, 0.0)
+                    free = st.hedging < HEDGE_SLOTS
+                else:
+                    wait = max(st.next_start - now, st.hold_until - now, 0.0)
+                    free = st.inflight < int(st.limit)
+                if free and wait <= 0:
+                    if hedge:
+                        st.hedging += 1
+                    else:
+                        st.inflight += 1
+                        st.next_start = now + st.interval
+                    return True
+                if end is not None:
+                    left = end - now
+                    if left <= 0:
+                        return False
+                    wait = min(wait, left) if wait > 0 else left
+                self._cond.wait(wait if wait > 0 else None)
+
+    def cancel(self, host: str, *, hedge: bool = False) -> None:
+        """Give back a slot from :meth:`acquire` whose request was never sent."""
+        with self._cond:
+            _free(self._state(host), hedge)
+            self._cond.notify_all()
+
+    def release(
+        self,
+        host: str,
+        latency: float,
+        *,
+        failed: bool = False,
+        retry_after: float | None = None,
+        hedge: bool = False,
+    ) -> None:
+        """Report the outcome of a request started with :meth:`acquire`."""
+        with self._cond:
+            st = self._state(host)
+            _free(st, hedge)
+            now = time.monotonic()
+            if failed:
+                st.limit = max(1.0, st.limit / 2)
+                st.interval = min(self.max_interval, max(st.interval * 2, self.min_interval, 0.05))
+                st.backoffs += 1
+                if retry_after:
+                    st.hold_until = max(st.hold_until, now + retry_after)
+            else:
+                st.fastest = latency if st.fastest is None else min(st.fastest, latency)
+                st.ewma = latency if st.ewma is None else (1 - EWMA_WEIGHT) * st.ewma + EWMA_WEIGHT * latency
+                if st.ewma <= self.slow_factor * max(st.fastest, 1e-3):
+                    if st.limit < self.max_limit:
+                        st.limit = min(float(self.max_limit), st.limit + 1 / st.limit)
+                        st.increases += 1
+                    st.interval = max(self.min_interval, st.interval * 0.9)
+            self._cond.notify_all()
+
+    def hold(self, host: str, seconds: float) -> None:
+        """Pause new requests to ``host`` for ``seconds``."""
+        with self._cond:
+            st = self._state(host)
+            st.hold_until = max(st.hold_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._cond:
+            out = {}
+            for host, st in self._hosts.items():
+                state = asdict(st)
+                for name in ("next_start", "hold_until", "inflight", "hedging"):
+                    state.pop(name)
+                out[host] = state
+            return out
+
+
+def _free(st: HostState, hedge: bool) -> None:
+    if hedge:
+        st.hedging = max(0, st.hedging - 1)
+    else:
+        st.inflight = max(0, st.inflight - 1)
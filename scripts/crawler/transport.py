@@ -0,0 +1,512 @@
+"""Shared HTTP transport for the agency crawlers.
+
+One pooled ``requests.Session`` per host (keep-alive, gzip), connect/read
+timeouts on every call, retry with exponential backoff, per-host adaptive
+pacing (:class:`~crawler.throttle.HostThrottle`), an optional on-disk :class:`~crawler.cache.HttpCache`,
+and counters for requests/bytes/reused connections/cache hits. Every page
+served (status, bytes, latency) is also attributed to the running board via
+:mod:`crawler.metrics`.
+
+Tail latency: a crawl may run under a deadline (:func:`deadline`, bound per
+board like the transport). Every request's connect/read timeouts are capped by
+the time left, retries stop when it runs out, and :class:`DeadlineExceeded` is
+raised instead; that includes waiting for the host's throttle (spacing or a
+``Retry-After`` hold). List-page GETs ask for ``hedge=True``: when the first
+attempt has not answered after the host's p95 latency, an identical request is
+sent on the host's reserved hedge slot and whichever answers first is used.
+:meth:`Transport.hedge_summary` lists the hosts and URLs that needed a hedge.
+
+Agency modules call the module-level :func:`get` / :func:`post` / :func:`prime`,
+which route through the transport bound to the running board with
+:func:`using` (a crawl context's own transport) or else :func:`default_transport`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from . import metrics
+from .cache import CacheMiss, HttpCache, cache_key
+from .throttle import DEFAULT_MIN_INTERVAL, HostThrottle
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+}
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_POOL_SIZE = 4
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 60.0
+HEDGE_QUANTILE = 95
+HEDGE_INITIAL_DELAY = 3.0  # until a host has HEDGE_MIN_SAMPLES latencies
+HEDGE_MIN_SAMPLES = 10
+HEDGE_MIN_DELAY = 0.05
+HEDGE_MAX_DELAY = 10.0
+LATENCY_WINDOW = 200
+HEDGE_URLS_KEPT = 5
+HEDGE_WORKERS = 32
+
+
+class DeadlineExceeded(requests.Timeout):
+    """The crawl's time budget ran out before (or while) this request was made."""
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    bytes_wire: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    cache_hits: int = 0
+    cache_revalidated: int = 0
+    cache_misses: int = 0
+    throttle_backoffs: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+
+@dataclass
+class HedgeRecord:
+    """Hedged requests to one host: how many fired, how many the hedge won."""
+
+    fired: int = 0
+    won: int = 0
+    urls: list[str] = field(default_factory=list)
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class Transport:
+    def __init__(
+        self,
+        *,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        headers: dict[str, str] | None = None,
+        cache: HttpCache | None = None,
+        adapter: Callable[[int], BaseAdapter] | None = None,
+        throttle: HostThrottle | None = None,
+        hedge: bool = True,
+        hedge_after: float = HEDGE_INITIAL_DELAY,
+    ) -> None:
+        """``adapter(pool_size)`` builds each host's adapter (record/replay hook).
+
+        The default throttle paces each host from ``min_interval`` and lets it
+        grow to ``pool_size`` requests in flight. ``hedge=False`` ignores
+        ``hedge=True`` requests; ``hedge_after`` is the hedge delay for a host
+        whose p95 latency is not known yet.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self.throttle = throttle or HostThrottle(min_interval=min_interval, max_limit=pool_size)
+        self.cache = cache
+        self.adapter = adapter or (lambda size: HTTPAdapter(pool_connections=1, pool_maxsize=size))
+        self._sessions: dict[str, requests.Session] = {}
+        self._prime_urls: dict[str, str] = {}
+        self._primed: set[str] = set()
+        self._stats = TransportStats()
+        self._lock = threading.Lock()
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+        self._latencies: dict[str, deque[float]] = {}
+        self._hedge_records: dict[str, HedgeRecord] = {}
+        self._hedge_pool: ThreadPoolExecutor | None = None
+
+    # -- sessions -----------------------------------------------------------
+
+    def session(self, host: str) -> requests.Session:
+        with self._lock:
+            sess = self._sessions.get(host)
+            if sess is None:
+                sess = requests.Session()
+                sess.headers.update(self.headers)
+                adapter = self.adapter(self.pool_size)
+                sess.mount("http://", adapter)
+                sess.mount("https://", adapter)
+                self._sessions[host] = sess
+            return sess
+
+    def prime(self, url: str) -> None:
+        """Register ``url`` to be fetched once per host for session cookies.
+
+        The GET is deferred until the first request to that host that actually
+        goes to the network, so a fully cached run stays offline.
+        """
+        with self._lock:
+            self._prime_urls.setdefault(host_of(url), url)
+
+    def _ensure_primed(self, host: str) -> None:
+        with self._lock:
+            url = self._prime_urls.get(host)
+            if url is None or host in self._primed:
+                return
+            self._primed.add(host)
+        try:
+            self._send("GET", url, host, {})
+        except requests.RequestException:
+            with self._lock:
+                self._primed.discard(host)
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._prime_urls.clear()
+            self._primed.clear()
+            pool, self._hedge_pool = self._hedge_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        for sess in sessions:
+            sess.close()
+
+    # -- requests -----------------------------------------------------------
+
+    def request(self, method: str, url: str, *, hedge: bool = False, **kwargs) -> requests.Response:
+        """``hedge=True`` marks an idempotent request worth a duplicate when slow."""
+        hedge = hedge and self.hedge and method.upper() == "GET"
+        if self.cache is None:
+            return self._network(method, url, kwargs, hedge)
+
+        key = cache_key(method, url, kwargs.get("params"), kwargs.get("data"))
+        entry = self.cache.lookup(key)
+        mode = self.cache.mode
+        if mode == "offline":
+            if entry is None:
+                self._count(cache_misses=1)
+                raise CacheMiss(f"offline cache miss: {method} {url}")
+            self._count(cache_hits=1)
+            metrics.response("cache", len(entry.body))
+            return entry.to_response()
+        if entry is not None and mode == "use" and entry.age() < self.cache.ttl:
+            self._count(cache_hits=1)
+            metrics.response("cache", len(entry.body))
+            return entry.to_response()
+
+        if entry is not None and method.upper() == "GET" and entry.validators():
+            headers = dict(kwargs.get("headers") or {})
+            headers.update(entry.validators())
+            kwargs["headers"] = headers
+        res = self._network(method, url, kwargs, hedge)
+        if res.status_code == 304 and entry is not None:
+            self.cache.touch(entry)
+            self._count(cache_revalidated=1)
+            return entry.to_response()
+        self._count(cache_misses=1)
+        if res.status_code == 200:
+            self.cache.store(key, res)
+        return res
+
+    def _network(self, method: str, url: str, kwargs: dict, hedge: bool = False) -> requests.Response:
+        host = host_of(url)
+        self._ensure_primed(host)
+        if hedge:
+            return self._hedged(method, url, host, kwargs)
+        return self._send(method, url, host, kwargs)
+
+    # -- hedging ------------------------------------------------------------
+
+    def hedge_delay(self, host: str) -> float:
+        """Seconds to wait for a first attempt before hedging: the host's p95 latency."""
+        with self._lock:
+            samples = list(self._latencies.get(host, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return self.hedge_after
+        p95 = metrics.percentile(samples, HEDGE_QUANTILE) or 0.0
+        return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, p95))
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+            pool = self._hedge_pool
+        # Attempts run with the caller's context: board metrics and deadline follow.
+        return pool.submit(contextvars.copy_context().run, fn, *args)
+
+    def _hedged(self, method: str, url: str, host: str, kwargs: dict) -> requests.Response:
+        first = self._submit(self._send, method, url, host, kwargs)
+        done, _ = wait([first], timeout=self.hedge_delay(host))
+        if done:
+            return first.result()
+        second = self._submit(self._send, method, url, host, kwargs, True)
+        self._count(hedges=1)
+        metrics.record(hedged=1)
+        pending = {first, second}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in (first, second) if f in done and f.exception() is None), None)
+            if winner is not None or not pending:
+                break
+        won = winner is second
+        with self._lock:
+            record = self._hedge_records.setdefault(host, HedgeRecord())
+            record.fired += 1
+            record.won += won
+            if url not in record.urls:
+                record.urls = [url, *record.urls][:HEDGE_URLS_KEPT]
+        if won:
+            self._count(hedge_wins=1)
+            metrics.record(hedge_wins=1)
+        for f in (first, second):
+            if f is not winner:
+                f.add_done_callback(_discard)
+        if winner is None:
+            return first.result()  # both failed: raise the first attempt's error
+        return winner.result()
+
+    def hedge_summary(self) -> dict[str, dict]:
+        """Per host: hedges fired, hedges that answered first, current delay, recent URLs."""
+        with self._lock:
+            records = {host: HedgeRecord(r.fired, r.won, list(r.urls)) for host, r in self._hedge_records.items()}
+        return {
+            host: {**asdict(r), "delay_ms": round(self.hedge_delay(host) * 1000, 1)}
+            for host, r in sorted(records.items(), key=lambda kv: -kv[1].fired)
+        }
+
+    # -- sending ------------------------------------------------------------
+
+    def _send(self, method: str, url: str, host: str, kwargs: dict, hedge: bool = False) -> requests.Response:
+        sess = self.session(host)
+        kwargs = dict(kwargs)
+        timeout = kwargs.pop("timeout", self.timeout)
+        attempt = 0
+        while True:
+            if not self.throttle.acquire(host, _remaining(None), hedge=hedge):
+                raise DeadlineExceeded(f"crawl deadline reached waiting to request {host}")
+            try:
+                bounded = _bounded(timeout, host)
+            except DeadlineExceeded:
+                self.throttle.cancel(host, hedge=hedge)
+                raise
+            t0 = time.perf_counter()
+            try:
+                res = sess.request(method, url, timeout=bounded, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                latency = time.perf_counter() - t0
+                self.throttle.release(host, latency, failed=True, hedge=hedge)
+                self._count(errors=1, throttle_backoffs=1)
+                metrics.failure(type(exc).__name__, latency)
+                if attempt >= self.retries:
+                    raise
+                delay = self.backoff * (2**attempt)
+                print(f"  └ [retry] {method} {url} ({type(exc).__name__}) +{delay:.1f}s", flush=True)
+            except Exception:
+                self.throttle.release(host, time.perf_counter() - t0, hedge=hedge)
+                raise
+            else:
+                latency = time.perf_counter() - t0
+                with self._lock:
+                    self._latencies.setdefault(host, deque(maxlen=LATENCY_WINDOW)).append(latency)
+                failed = res.status_code in RETRY_STATUS
+                hinted = retry_after_seconds(res.headers.get("Retry-After")) if failed else None
+                if hinted is not None:
+                    hinted = min(hinted, MAX_RETRY_AFTER)
+                # Retry-After holds every request to the host, not only this retry.
+                self.throttle.release(host, latency, failed=failed, retry_after=hinted, hedge=hedge)
+                self._record(res, latency)
+                if failed:
+                    self._count(throttle_backoffs=1)
+                if not failed or attempt >= self.retries:
+                    return res
+                delay = self.backoff * (2**attempt)
+                shown = max(delay, hinted or 0.0)
+                print(f"  └ [retry] {method} {url} (HTTP {res.status_code}) +{shown:.1f}s", flush=True)
+                res.close()
+            attempt += 1
+            self._count(retries=1)
+            if _remaining(delay) < delay:
+                raise DeadlineExceeded(f"crawl deadline reached before retrying {method} {url}")
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    # -- stats --------------------------------------------------------------
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+
+    def _record(self, res: requests.Response, seconds: float) -> None:
+        body = len(res.content)
+        wire = body
+        raw = getattr(res, "raw", None)
+        if raw is not None and hasattr(raw, "tell"):
+            try:
+                wire = raw.tell() or body
+            except Exception:
+                pass
+        self._count(requests=1, bytes_received=body, bytes_wire=wire)
+        metrics.response(res.status_code, body, seconds)
+
+    def stats(self) -> dict[str, int]:
+        """Counter snapshot; connection counts come from the urllib3 pools."""
+        with self._lock:
+            snap = TransportStats(**asdict(self._stats))
+            sessions = list(self._sessions.values())
+        opened = served = 0
+        for sess in sessions:
+            for adapter in set(sess.adapters.values()):
+                manager = getattr(adapter, "poolmanager", None)
+                if manager is None:
+                    continue
+                pools = manager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    opened += getattr(pool, "num_connections", 0)
+                    served += getattr(pool, "num_requests", 0)
+        snap.connections_opened = opened
+        snap.connections_reused = max(0, served - opened)
+        return asdict(snap)
+
+
+def format_stats(stats: dict[str, int]) -> str:
+    return (
+        f"{stats['requests']} requests, {stats['bytes_received'] / 1024:.0f} KB "
+        f"({stats['bytes_wire'] / 1024:.0f} KB on wire), "
+        f"{stats['connections_opened']} connections opened, "
+        f"{stats['connections_reused']} reused, {stats['retries']} retries, "
+        f"cache {stats['cache_hits']} hit / {stats['cache_revalidated']} revalidated / "
+        f"{stats['cache_misses']} miss, {stats['throttle_backoffs']} throttle backoffs, "
+        f"{stats['hedges']} hedged ({stats['hedge_wins']} won)"
+    )
+
+
+def format_hedges(summary: dict[str, dict]) -> str:
+    lines = []
+    for host, h in summary.items():
+        lines.append(f"{host}: {h['fired']} hedged, {h['won']} won by the hedge, delay {h['delay_ms']:.0f}ms")
+        lines.extend(f"  {url}" for url in h["urls"])
+    return "\n".join(lines)
+
+
+def _discard(future: Future) -> None:
+    # The losing attempt of a hedge: free its connection once it lands.
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+_default: Transport | None = None
+_default_lock = threading.Lock()
+
+
+def default_transport() -> Transport:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Transport()
+        return _default
+
+
+def set_default_transport(transport: Transport | None) -> None:
+    global _default
+    with _default_lock:
+        _default = transport
+
+
+_bound: ContextVar[Transport | None] = ContextVar("crawler_transport", default=None)
+_deadline: ContextVar[float | None] = ContextVar("crawler_deadline", default=None)
+
+
+@contextmanager
+def deadline(at: float | None) -> Iterator[None]:
+    """Requests in this context must finish by ``at`` (``time.monotonic()``; None = no limit)."""
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _remaining(default: float | None) -> float | None:
+    """Seconds left before the deadline (``default`` without one)."""
+    at = _deadline.get()
+    return default if at is None else at - time.monotonic()
+
+
+def _bounded(timeout, host: str):
+    """``timeout`` capped by the time left; raises once the deadline has passed."""
+    at = _deadline.get()
+    if at is None or timeout is None:
+        return timeout
+    left = at - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded(f"crawl deadline reached before a request to {host}")
+    if isinstance(timeout, tuple):
+        return tuple(min(t, left) if t is not None else left for t in timeout)
+    return min(timeout, left)
+
+
+def current() -> Transport:
+    """Transport bound by :func:`using` in this context, else the default."""
+    return _bound.get() or default_transport()
+
+
+@contextmanager
+def using(transport: Transport | None) -> Iterator[None]:
+    """Route module-level calls in this context (and engine workers) to ``transport``."""
+    token = _bound.set(transport)
+    try:
+        yield
+    finally:
+        _bound.reset(token)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET through the bound transport; pass ``hedge=True`` for list pages."""
+    return current().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return current().post(url, **kwargs)
+
+
+def prime(url: str) -> None:
+    current().prime(url)
@@ -1,28 +1,47 @@
-"""Unified regulatory updates crawler — assembles quarterly Markdown for docs/."""
+"""Unified regulatory updates crawler — assembles quarterly Markdown for docs/.
+
+Every run is described by a :class:`CrawlContext`: the period, the transport its
+boards fetch through, optional checkpoints and the Appendix collector. Nothing
+about a period lives in module state, so one process can crawl several periods
+at once (:func:`collect_periods`) over one shared pool and connection set.
+
+Board items are normalized to ``(yy-mm-dd, title, url)`` rows before anything
+is rendered; with an item store (:mod:`crawler.itemstore`) every crawl saves
+them first, and :func:`render_from_store` rebuilds a quarter file from the
+store without fetching.
+"""
 
 from __future__ import annotations
 
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-
-from . import FSS, FSC, KASB, KICPA, KICPA_Standards
+from typing import Callable
+
+from . import (
+    FSS,
+    FSC,
+    KASB,
+    KICPA,
+    KICPA_Standards,
+    checkpoint,
+    dedupe,
+    incremental,
+    itemstore,
+    metrics,
+    pagesize,
+    transport,
+)
+from .urls import canonical_url
 
 JURISDICTION = "KR"
 
-START_DATE_STR = "2024-10-01"
-END_DATE_STR = "2024-12-31"
-START_DATE = datetime.strptime(START_DATE_STR, "%Y-%m-%d")
-END_DATE = datetime.strptime(END_DATE_STR, "%Y-%m-%d")
-YEAR = START_DATE.year
-
-APPENDIX: dict[str, dict] = {
-    "금융감독원": {},
-    "금융위원회": {},
-    "한국공인회계사회": {},
-    "한국회계기준원": {},
-}
+AGENCIES = ("금융감독원", "금융위원회", "한국공인회계사회", "한국회계기준원")
 
 
 def repo_root() -> Path:
@@ -30,55 +49,60 @@ def repo_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
 
 
-def configure_period(start_str: str, end_str: str) -> None:
-    """Set crawl period globals and sync to agency modules."""
-    global START_DATE_STR, END_DATE_STR, START_DATE, END_DATE, YEAR
-    START_DATE_STR = start_str
-    END_DATE_STR = end_str
-    START_DATE = datetime.strptime(start_str, "%Y-%m-%d")
-    END_DATE = datetime.strptime(end_str, "%Y-%m-%d")
-    YEAR = START_DATE.year
-    APPENDIX.clear()
-    APPENDIX.update(
-        {
-            "금융감독원": {},
-            "금융위원회": {},
-            "한국공인회계사회": {},
-            "한국회계기준원": {},
-        }
-    )
-    sync_period_to_modules()
+def _empty_appendix() -> dict[str, dict[str, list]]:
+    return {agency: {} for agency in AGENCIES}
 
 
-def output_dir() -> Path:
-    return repo_root() / "docs" / "quality-updates" / str(START_DATE.year)
+@dataclass
+class CrawlContext:
+    """One crawl period and what its boards share.
 
+    ``start``/``end`` are ``YYYY-MM-DD``. ``transport`` is bound to every board
+    of the period (``None``: the process default), boards checkpoint to
+    ``checkpoints`` when set, negotiate larger list pages through
+    ``page_sizes`` when set, and stop with ``transport.DeadlineExceeded`` once
+    ``deadline`` (``time.monotonic()``) passes. Fetched items are saved to
+    ``items`` when set. ``appendix`` collects each board's rows for Appendix A
+    as the document is rendered.
+    """
 
-def output_file_name() -> str:
-    return f"{START_DATE_STR}_to_{END_DATE_STR}.md"
+    start: str
+    end: str
+    transport: transport.Transport | None = None
+    checkpoints: checkpoint.Checkpoints | None = None
+    page_sizes: pagesize.Negotiator | None = None
+    deadline: float | None = None
+    items: itemstore.ItemStore | None = None
+    jurisdiction: str = JURISDICTION
+    appendix: dict[str, dict[str, list]] = field(default_factory=_empty_appendix)
 
+    def __post_init__(self) -> None:
+        if self.start_date > self.end_date:
+            raise ValueError("start date must be on or before end date")
 
-def output_path() -> Path:
-    return output_dir() / output_file_name()
+    @property
+    def start_date(self) -> datetime:
+        return datetime.strptime(self.start, "%Y-%m-%d")
 
+    @property
+    def end_date(self) -> datetime:
+        return datetime.strptime(self.end, "%Y-%m-%d")
 
-def sync_period_to_modules() -> None:
-    """Inject period into FSS/FSC module globals."""
-    if hasattr(FSS, "START_DATE"):
-        FSS.START_DATE = START_DATE_STR
-    if hasattr(FSS, "END_DATE"):
-        FSS.END_DATE = END_DATE_STR
-    if hasattr(FSS, "start_dt"):
-        FSS.start_dt = datetime.strptime(START_DATE_STR, "%Y-%m-%d")
+    @property
+    def year(self) -> int:
+        return self.start_date.year
 
-    if hasattr(FSC, "START_DATE"):
-        FSC.START_DATE = START_DATE_STR
-    if hasattr(FSC, "END_DATE"):
-        FSC.END_DATE = END_DATE_STR
+    @property
+    def label(self) -> str:
+        return f"{self.start}_to_{self.end}"
 
+    def output_path(self) -> Path:
+        """docs/quality-updates/{year}/{start}_to_{end}.md"""
+        return repo_root() / "docs" / "quality-updates" / str(self.year) / f"{self.label}.md"
 
-def ensure_output_dir() -> None:
-    output_dir().mkdir(parents=True, exist_ok=True)
+    def for_period(self, start: str, end: str) -> "CrawlContext":
+        """Same transport, checkpoints and item store, another period, a fresh Appendix."""
+        return replace(self, start=start, end=end, appendix=_empty_appendix())
 
 
 def _yy_mm_dd_key(date_str: str) -> tuple[int, int, int]:
@@ -118,22 +142,22 @@ def indent_block(text: str, spaces: int = 4) -> str:
     return "\n".join(prefix + line if line.strip() else "" for line in text.splitlines())
 
 
-def compute_period_metadata() -> dict[str, str]:
-    q = (START_DATE.month - 1) // 3 + 1
-    return {"frequency": "quarterly", "period_label": f"{YEAR}-Q{q}"}
+def compute_period_metadata(ctx: CrawlContext) -> dict[str, str]:
+    q = (ctx.start_date.month - 1) // 3 + 1
+    return {"frequency": "quarterly", "period_label": f"{ctx.year}-Q{q}"}
 
 
-def build_front_matter() -> str:
-    meta = compute_period_metadata()
+def build_front_matter(ctx: CrawlContext) -> str:
+    meta = compute_period_metadata(ctx)
     return f"""---
-title: {START_DATE_STR} ~ {END_DATE_STR} Regulatory Updates
-jurisdiction: {JURISDICTION}
-year: {YEAR}
+title: {ctx.start} ~ {ctx.end} Regulatory Updates
+jurisdiction: {ctx.jurisdiction}
+year: {ctx.year}
 frequency: {meta['frequency']}
 period_label: {meta['period_label']}
 period:
-  start: {START_DATE_STR}
-  end: {END_DATE_STR}
+  start: {ctx.start}
+  end: {ctx.end}
 category: Quality Updates
 agencies:
   - FSS
@@ -141,122 +165,350 @@ agencies:
   - KICPA
   - KASB
 generated_by: quality-updates-crawler
-generated_at: {END_DATE_STR}
+generated_at: {ctx.end}
 ---
 """
 
 
-def collect_fss() -> str:
-    lines = ["### 금융감독원\n"]
-
-    press = FSS.fetch_press_release()
-    APPENDIX["금융감독원"]["보도자료"] = press
-    lines += [
-        "#### 보도자료\n",
-        md_lines([(i["date"], i["title"], i["link"]) for i in sort_fss_items(press)]),
-    ]
-
-    rules = FSS.fetch_rules_revision()
-    APPENDIX["금융감독원"]["세칙제ㆍ개정예고"] = rules
-    lines += [
-        "\n#### 세칙제ㆍ개정예고\n",
-        md_lines([(i["date"], i["title"], i["link"]) for i in sort_fss_items(rules)]),
+def render_rows(rows: list[tuple[str, str, str]]) -> str:
+    """Body lines for one board: oldest first, crawl order within a day."""
+    return md_lines(sort_dated_tuples(rows))
+
+
+@dataclass(frozen=True)
+class BoardSpec:
+    """One crawled board: where it lands in the document and how to fetch it.
+
+    ``fetch(start, end)`` takes ``YYYY-MM-DD`` strings. ``newest_first`` is the
+    board's crawl order (kept in the Appendix); ``narrow_by_date`` means an
+    incremental run may start the board at its watermark date.
+    ``poll_interval`` is how often the daemon polls the board, in seconds.
+    ``render`` takes the board's ``(yy-mm-dd, title, url)`` rows; ``source``
+    is its list page, recorded with every stored item.
+    """
+
+    agency: str
+    heading: str
+    appendix: str
+    host: str
+    fetch: Callable[[str, str], list]
+    render: Callable[[list], str]
+    newest_first: bool = True
+    narrow_by_date: bool = True
+    poll_interval: float = 1800.0
+    source: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.agency}/{self.heading}"
+
+
+HOST_CONCURRENCY = 2
+DEFAULT_JOBS = 8
+
+
+def _dt(date_str: str) -> datetime:
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def board_specs() -> list[BoardSpec]:
+    """Boards in document order."""
+    fss, fsc = "www.fss.or.kr", "fsc.go.kr"
+    kicpa, kasb = "www.kicpa.or.kr", "www.kasb.or.kr"
+    return [
+        BoardSpec(
+            "금융감독원",
+            "보도자료",
+            "보도자료",
+            fss,
+            lambda s, e: FSS.fetch_press_release(start=s, end=e),
+            render_rows,
+            source=FSS.PRESS_URL,
+        ),
+        BoardSpec(
+            "금융감독원",
+            "세칙제ㆍ개정예고",
+            "세칙제ㆍ개정예고",
+            fss,
+            lambda s, e: FSS.fetch_rules_revision(start=s, end=e),
+            render_rows,
+            source=FSS.RULES_URL,
+        ),
+        BoardSpec(
+            "금융감독원",
+            "회계감독 동향자료",
+            "회계감독 동향자료",
+            fss,
+            lambda s, e: FSS.fetch_accounting_trend(start=s, end=e),
+            render_rows,
+            source=FSS.TREND_URL,
+        ),
+        BoardSpec(
+            "금융위원회",
+            "보도자료",
+            "보도자료",
+            fsc,
+            lambda s, e: FSC.crawl_board("보도자료", FSC.BASE_URLS["보도자료"], s, e),
+            render_rows,
+            source=FSC.BASE_URLS["보도자료"],
+        ),
+        BoardSpec(
+            "금융위원회",
+            "고시/공고/훈령",
+            "고시/공고/훈령",
+            fsc,
+            lambda s, e: FSC.crawl_board("소관규정", FSC.BASE_URLS["소관규정"], s, e),
+            render_rows,
+            source=FSC.BASE_URLS["소관규정"],
+        ),
+        BoardSpec(
+            "금융위원회",
+            "입법예고/규정변경예고",
+            "입법예고/규정변경예고",
+            fsc,
+            lambda s, e: FSC.crawl_board("입법예고", FSC.BASE_URLS["입법예고"], s, e),
+            render_rows,
+            source=FSC.BASE_URLS["입법예고"],
+        ),
+        BoardSpec(
+            "한국공인회계사회",
+            "알림마당 - 공지사항",
+            "알림마당 - 공지사항",
+            kicpa,
+            lambda s, e: KICPA.crawl_period("noti", _dt(s), _dt(e)),
+            render_rows,
+            source=f"{KICPA.BASE}/board/list.brd?boardId=noti",
+        ),
+        BoardSpec(
+            "한국공인회계사회",
+            "회계감사 - 감사인증기준",
+            "회계감사 - 감사인증기준",
+            kicpa,
+            lambda s, e: KICPA_Standards.crawl_sumboard(_dt(s), _dt(e)),
+            render_rows,
+            source=KICPA_Standards.LIST_URL,
+            poll_interval=6 * 3600.0,
+        ),
+        BoardSpec(
+            "한국회계기준원",
+            "소통광장 - 공지사항",
+            "소통광장 - 공지사항",
+            kasb,
+            lambda s, e: KASB.crawl_board("공지사항", KASB.BOARDS["공지사항"], s, e),
+            render_rows,
+            source=KASB.BOARDS["공지사항"]["list"],
+        ),
+        BoardSpec(
+            "한국회계기준원",
+            "소통광장 - 보도자료",
+            "소통광장 - 보도자료",
+            kasb,
+            lambda s, e: KASB.crawl_board("보도자료", KASB.BOARDS["보도자료"], s, e),
+            render_rows,
+            source=KASB.BOARDS["보도자료"]["list"],
+        ),
+        # Schedule rows are dated by event, not by posting: always crawl the full period.
+        BoardSpec(
+            "한국회계기준원",
+            "주요일정",
+            "주요일정",
+            kasb,
+            lambda s, e: KASB.crawl_schedule(s, e),
+            md_lines,
+            source=KASB.SCHEDULE["list"],
+            newest_first=False,
+            narrow_by_date=False,
+            poll_interval=6 * 3600.0,
+        ),
     ]
 
-    trend = FSS.fetch_accounting_trend()
-    APPENDIX["금융감독원"]["회계감독 동향자료"] = trend
-    lines += [
-        "\n#### 회계감독 동향자료\n",
-        md_lines([(i["date"], i["title"], i["link"]) for i in sort_fss_items(trend)]),
-    ]
 
+def render_agency(
+    ctx: CrawlContext, agency: str, specs: list[BoardSpec], results: list[list[tuple[str, str, str]]]
+) -> str:
+    """Render one ``### agency`` block and record its boards' rows in ``ctx.appendix`` (spec order)."""
+    lines = ["### 금융감독원\n"] if agency == AGENCIES[0] else [f"\n\n### {agency}\n"]
+    for n, (spec, rows) in enumerate(zip(specs, results)):
+        ctx.appendix.setdefault(agency, {})[spec.appendix] = rows
+        prefix = "" if n == 0 else "\n"
+        lines += [f"{prefix}#### {spec.heading}\n", spec.render(rows)]
     return "\n".join(lines)
 
 
-def collect_fsc() -> str:
-    lines = ["\n\n### 금융위원회\n"]
+@dataclass(frozen=True)
+class BoardTask:
+    """One board of one context, with the period it is fetched for."""
+
+    ctx: CrawlContext
+    spec: BoardSpec
+    period: tuple[str, str]
+    label: str
+
+
+def _run_board(task: BoardTask) -> list:
+    spec, ctx = task.spec, task.ctx
+    with (
+        metrics.board(task.label),
+        transport.using(ctx.transport),
+        transport.deadline(ctx.deadline),
+        pagesize.using(ctx.page_sizes),
+    ):
+        cp = ctx.checkpoints.board(spec.key, task.period) if ctx.checkpoints else None
+        if cp is not None and cp.done:
+            metrics.record(items=len(cp.items))
+            metrics.stop("checkpoint")
+            return cp.items
+        t0 = time.perf_counter()
+        try:
+            with checkpoint.active(cp):
+                items = spec.fetch(*task.period)
+        except Exception as exc:
+            metrics.stop(f"error: {type(exc).__name__}: {exc}")
+            metrics.record(seconds=time.perf_counter() - t0)
+            raise
+        metrics.record(items=len(items), seconds=time.perf_counter() - t0)
+        if cp is not None:
+            cp.complete(items)
+        return items
+
+
+def run_tasks(tasks: list[BoardTask], jobs: int = 1, host_concurrency: int = HOST_CONCURRENCY) -> list[list]:
+    """Fetch every task and return results in task order.
+
+    ``jobs <= 1`` fetches sequentially. Otherwise tasks run in a thread pool of
+    ``jobs`` workers with at most ``host_concurrency`` boards in flight per
+    host, across all contexts.
+    """
+    if jobs <= 1:
+        return [_run_board(t) for t in tasks]
+
+    host_slots: dict[str, threading.BoundedSemaphore] = {
+        t.spec.host: threading.BoundedSemaphore(max(1, host_concurrency)) for t in tasks
+    }
+
+    def run(i: int) -> list:
+        with host_slots[tasks[i].spec.host]:
+            return _run_board(tasks[i])
+
+    # Interleave hosts so queued boards do not park every worker on one host's semaphore.
+    seen: dict[str, int] = {}
+    rank = []
+    for t in tasks:
+        rank.append(seen.get(t.spec.host, 0))
+        seen[t.spec.host] = rank[-1] + 1
+    order = sorted(range(len(tasks)), key=lambda i: rank[i])
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="crawl") as pool:
+        futures = {i: pool.submit(run, i) for i in order}
+        return [futures[i].result() for i in range(len(tasks))]
+
+
+def fetch_boards(
+    ctx: CrawlContext,
+    specs: list[BoardSpec],
+    jobs: int = 1,
+    host_concurrency: int = HOST_CONCURRENCY,
+    periods: list[tuple[str, str]] | None = None,
+) -> list[list]:
+    """Run each spec's fetcher for ``ctx`` and return results in spec order.
+
+    ``periods`` gives each board its own ``(start, end)``; default is the
+    context's period. With ``ctx.checkpoints``, every board saves its pages and
+    items as it goes; boards already done there are not fetched.
+    """
+    if periods is None:
+        periods = [(ctx.start, ctx.end)] * len(specs)
+    tasks = [BoardTask(ctx, spec, period, spec.key) for spec, period in zip(specs, periods)]
+    return run_tasks(tasks, jobs=jobs, host_concurrency=host_concurrency)
+
+
+LINK_LINE_RE = re.compile(r"^- \((\d{2}-\d{2}-\d{2})\) \[(.+)\]\((.+)\)$")
+
+
+def item_row(item) -> tuple[str, str, str] | None:
+    """(yy-mm-dd, title, canonical link) for any board's item shape (dict, tuple, md line)."""
+    if isinstance(item, dict):
+        d = item["date"].strftime("%y-%m-%d") if hasattr(item["date"], "strftime") else item["date"]
+        row = (d, item["title"], item["link"])
+    elif isinstance(item, tuple):
+        row = item
+    elif isinstance(item, str):
+        m = LINK_LINE_RE.match(item)
+        if not m:
+            return None
+        row = m.groups()
+    else:
+        return None
+    return (row[0], row[1], canonical_url(row[2]))
 
-    press = FSC.crawl_board("보도자료", FSC.BASE_URLS["보도자료"])
-    APPENDIX["금융위원회"]["보도자료"] = press
-    lines += ["#### 보도자료\n", "\n".join(sort_md_link_lines(press))]
 
-    rules = FSC.crawl_board("소관규정", FSC.BASE_URLS["소관규정"])
-    APPENDIX["금융위원회"]["고시/공고/훈령"] = rules
-    lines += ["\n#### 고시/공고/훈령\n", "\n".join(sort_md_link_lines(rules))]
+def item_rows(items: list) -> list[tuple[str, str, str]]:
+    """Rows of a board's items in crawl order (items no row can be read from are dropped)."""
+    return [row for row in map(item_row, items) if row]
 
-    legis = FSC.crawl_board("입법예고", FSC.BASE_URLS["입법예고"])
-    APPENDIX["금융위원회"]["입법예고/규정변경예고"] = legis
-    lines += ["\n#### 입법예고/규정변경예고\n", "\n".join(sort_md_link_lines(legis))]
 
-    return "\n".join(lines)
+def appendix_content(items: list) -> str:
+    """Appendix lines for one board, in crawl order."""
+    return md_lines(item_rows(items))
 
 
-def collect_kicpa() -> str:
-    lines = ["\n\n### 한국공인회계사회\n"]
+def _now() -> str:
+    return datetime.now().astimezone().isoformat(timespec="seconds")
 
-    noti = KICPA.crawl_period("noti", START_DATE, END_DATE)
-    APPENDIX["한국공인회계사회"]["알림마당 - 공지사항"] = noti
-    lines += [
-        "#### 알림마당 - 공지사항\n",
-        md_lines(
-            [
-                (i["date"].strftime("%y-%m-%d"), i["title"], i["link"])
-                for i in sort_kicpa_dict_items(noti)
-            ]
-        ),
-    ]
 
-    std = KICPA_Standards.crawl_sumboard(START_DATE, END_DATE)
-    APPENDIX["한국공인회계사회"]["회계감사 - 감사인증기준"] = std
-    lines += [
-        "\n#### 회계감사 - 감사인증기준\n",
-        md_lines(
-            [
-                (i["date"].strftime("%y-%m-%d"), i["title"], i["link"])
-                for i in sort_kicpa_dict_items(std)
-            ]
-        ),
+def raw_items(spec: BoardSpec, items: list, fetched_at: str | None = None) -> list[itemstore.RawItem]:
+    """A board's items as store records, in crawl order."""
+    fetched_at = fetched_at or _now()
+    return [
+        itemstore.RawItem.from_row(spec.key, row, fetched_at=fetched_at, source=spec.source)
+        for row in item_rows(items)
     ]
 
-    return "\n".join(lines)
-
-
-def collect_kasb() -> str:
-    lines = ["\n\n### 한국회계기준원\n"]
-
-    noti = KASB.crawl_board("공지사항", KASB.BOARDS["공지사항"], START_DATE_STR, END_DATE_STR)
-    APPENDIX["한국회계기준원"]["소통광장 - 공지사항"] = noti
-    lines += ["#### 소통광장 - 공지사항\n", md_lines(sort_dated_tuples(noti))]
-
-    press = KASB.crawl_board("보도자료", KASB.BOARDS["보도자료"], START_DATE_STR, END_DATE_STR)
-    APPENDIX["한국회계기준원"]["소통광장 - 보도자료"] = press
-    lines += ["\n#### 소통광장 - 보도자료\n", md_lines(sort_dated_tuples(press))]
-
-    schedule = KASB.crawl_schedule(START_DATE_STR, END_DATE_STR)
-    APPENDIX["한국회계기준원"]["주요일정"] = schedule
-    lines += ["\n#### 주요일정\n", md_lines(schedule)]
-
-    return "\n".join(lines)
 
+def store_results(ctx: CrawlContext, specs: list[BoardSpec], results: list[list]) -> None:
+    """Save every board's items for ``ctx``'s period (no-op without ``ctx.items``)."""
+    if ctx.items is None:
+        return
+    fetched_at = _now()
+    for spec, items in zip(specs, results):
+        ctx.items.write(ctx.start, ctx.end, spec.key, raw_items(spec, items, fetched_at))
+
+
+def store_merged(ctx: CrawlContext, text: str, specs: list[BoardSpec], fresh: dict[str, list]) -> None:
+    """Add merged items to the store, where the board's crawl order puts them.
+
+    A board stored before (a file written by an earlier version) is first
+    seeded from the Appendix of ``text``, the file as it was before the merge.
+    """
+    if ctx.items is None:
+        return
+    fetched_at = _now()
+    seed = None
+    for spec in specs:
+        new = raw_items(spec, fresh.get(spec.key) or [], fetched_at)
+        if ctx.items.has(ctx.start, ctx.end, spec.key):
+            if not spec.newest_first:
+                ctx.items.add(ctx.start, ctx.end, spec.key, new)
+                continue
+            old = ctx.items.read(ctx.start, ctx.end, spec.key)
+        else:
+            if seed is None:
+                seed = incremental.appendix_rows(text)
+            old = [
+                itemstore.RawItem.from_row(spec.key, row, source=spec.source)
+                for row in seed.get((spec.agency, spec.appendix), [])
+            ]
+        # Keep crawl order: newer items lead a newest-first board, as in its Appendix.
+        ctx.items.write(ctx.start, ctx.end, spec.key, new + old if spec.newest_first else old + new)
 
-def build_appendix() -> str:
-    def normalize(items):
-        rows = []
-        for i in items:
-            if isinstance(i, dict):
-                d = i["date"].strftime("%y-%m-%d") if hasattr(i["date"], "strftime") else i["date"]
-                rows.append((d, i["title"], i["link"]))
-            elif isinstance(i, tuple):
-                rows.append(i)
-        return md_lines(rows)
 
+def build_appendix(ctx: CrawlContext) -> str:
     org_blocks = []
-    for org, sections in APPENDIX.items():
+    for org, sections in ctx.appendix.items():
         section_blocks = []
         for section, items in sections.items():
             if not items:
                 continue
-            content = "\n".join(items) if isinstance(items[0], str) else normalize(items)
+            content = appendix_content(items)
             if content.strip():
                 section_blocks.append(f"**{section}**\n\n{content}")
         if section_blocks:
@@ -277,28 +529,236 @@ def build_appendix() -> str:
     )
 
 
-def run_collection() -> str:
-    """Collect all agencies and return full markdown document."""
-    sync_period_to_modules()
-    sections = [collect_fss(), collect_fsc(), collect_kicpa(), collect_kasb()]
-    return build_front_matter() + "\n\n" + "\n".join(sections) + build_appendix()
+def run_collection(ctx: CrawlContext, jobs: int = 1) -> str:
+    """Collect all agencies and return full markdown document.
 
+    With ``jobs > 1`` boards are fetched concurrently; the document and the
+    Appendix are still assembled in fixed board order, so output matches a
+    sequential run.
+    """
+    specs = board_specs()
+    results = fetch_boards(ctx, specs, jobs=jobs)
+    store_results(ctx, specs, results)
+    return render_document(ctx, specs, results)
 
-def write_markdown(path: Path | None = None) -> Path:
-    """Write markdown to path (default: docs/quality-updates/{year}/)."""
-    ensure_output_dir()
-    dest = path or output_path()
+
+def collect_periods(contexts: list[CrawlContext], jobs: int = 1) -> list[str]:
+    """Documents for several periods crawled at once in one pool.
+
+    Boards of every context share the worker pool and the per-host limits;
+    metrics are labelled ``{start}_to_{end}/{agency}/{board}``.
+    """
+    specs = board_specs()
+    tasks = [
+        BoardTask(ctx, spec, (ctx.start, ctx.end), f"{ctx.label}/{spec.key}")
+        for ctx in contexts
+        for spec in specs
+    ]
+    results = run_tasks(tasks, jobs=jobs)
+    n = len(specs)
+    docs = []
+    for i, ctx in enumerate(contexts):
+        store_results(ctx, specs, results[i * n : (i + 1) * n])
+        docs.append(render_document(ctx, specs, results[i * n : (i + 1) * n]))
+    return docs
+
+
+def render_document(ctx: CrawlContext, specs: list[BoardSpec], results: list[list]) -> str:
+    """Full markdown for ``ctx`` from per-board results (spec order, any item shape).
+
+    Near-duplicates across boards are marked in the body (:mod:`crawler.dedupe`).
+    """
+    rows = [item_rows(items) for items in results]
+    sections = []
+    for agency in AGENCIES:
+        picked = [(s, r) for s, r in zip(specs, rows) if s.agency == agency]
+        sections.append(render_agency(ctx, agency, [s for s, _ in picked], [r for _, r in picked]))
+    body, _ = dedupe.annotate("\n".join(sections))
+    return build_front_matter(ctx) + "\n\n" + body + build_appendix(ctx)
+
+
+def _write_atomic(dest: Path, content: str) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
-    content = run_collection()
     tmp = dest.with_suffix(dest.suffix + ".tmp")
     tmp.write_text(content, encoding="utf-8")
     os.replace(tmp, dest)
+
+
+def write_markdown(ctx: CrawlContext, path: Path | None = None, jobs: int = 1) -> Path:
+    """Write markdown to path (default: docs/quality-updates/{year}/)."""
+    dest = path or ctx.output_path()
+    _write_atomic(dest, run_collection(ctx, jobs=jobs))
     return dest
 
 
+def render_from_store(ctx: CrawlContext) -> str:
+    """Full markdown for ``ctx`` from ``ctx.items`` alone: no board is fetched."""
+    if ctx.items is None:
+        raise ValueError("render_from_store needs a context with an item store")
+    specs = board_specs()
+    missing = [s.key for s in specs if not ctx.items.has(ctx.start, ctx.end, s.key)]
+    if missing:
+        raise FileNotFoundError(f"no stored items for {ctx.label}: {', '.join(missing)} (crawl the period first)")
+    results = [[i.row() for i in ctx.items.read(ctx.start, ctx.end, s.key)] for s in specs]
+    return render_document(ctx, specs, results)
+
+
+def write_from_store(ctx: CrawlContext, path: Path | None = None) -> Path:
+    """Re-render the quarter file from stored items (default path as :func:`write_markdown`)."""
+    dest = path or ctx.output_path()
+    _write_atomic(dest, render_from_store(ctx))
+    return dest
+
+
+def item_in_period(item, start: str, end: str) -> bool:
+    """Whether the item's date falls in [start, end] (YYYY-MM-DD strings)."""
+    row = item_row(item)
+    if not row or not re.fullmatch(r"\d{2}-\d{2}-\d{2}", row[0]):
+        return False
+    return start <= "20" + row[0] <= end
+
+
+def run_range(
+    ctx: CrawlContext,
+    periods: list[tuple[str, str]],
+    *,
+    jobs: int = 1,
+    write: bool = True,
+) -> list[tuple[Path, dict[str, incremental.Watermark]]]:
+    """Backfill several periods with one crawl of every board.
+
+    Each board is fetched once over the union of ``periods`` (``ctx`` supplies
+    the transport and checkpoints); its items are routed to periods by date
+    (keeping crawl order) and every period's file is rendered exactly as a
+    single-period run would. Returns (path, watermarks) per period, in order.
+    Page caps scale with the union window, and a board that still reaches
+    its cap raises (:class:`~crawler.FSS.PageCapReached`) instead of losing
+    the oldest periods.
+    """
+    union = ctx.for_period(min(s for s, _ in periods), max(e for _, e in periods))
+    specs = board_specs()
+    results = fetch_boards(union, specs, jobs=jobs)
+
+    written = []
+    for start, end in periods:
+        part = ctx.for_period(start, end)
+        routed = [[i for i in items if item_in_period(i, start, end)] for items in results]
+        content = render_document(part, specs, routed)
+        dest = part.output_path()
+        if write:
+            store_results(part, specs, routed)
+            _write_atomic(dest, content)
+        written.append((dest, current_watermarks(part)))
+    return written
+
+
+def current_watermarks(ctx: CrawlContext) -> dict[str, incremental.Watermark]:
+    """Watermarks for every board from the items in ``ctx.appendix`` (after a full run)."""
+    marks = {}
+    for spec in board_specs():
+        items = ctx.appendix.get(spec.agency, {}).get(spec.appendix) or []
+        marks[spec.key] = incremental.Watermark().advance(item_rows(items))
+    return marks
+
+
+def plan_incremental(
+    ctx: CrawlContext,
+    text: str,
+    specs: list[BoardSpec],
+    marks: dict[str, incremental.Watermark] | None = None,
+) -> tuple[list[tuple[str, str]], dict[str, incremental.Watermark]]:
+    """Fetch period per spec and the watermarks to filter with.
+
+    Watermarks missing from ``marks`` are derived from the file's Appendix.
+    """
+    marks = dict(marks or {})
+    derived = incremental.derive_watermarks(text)
+    periods = []
+    for spec in specs:
+        mark = marks.get(spec.key) or derived.get((spec.agency, spec.appendix))
+        marks[spec.key] = mark or incremental.Watermark()
+        periods.append(
+            incremental.board_period(mark, ctx.start, ctx.end, spec.narrow_by_date)
+        )
+    return periods, marks
+
+
+def merge_new_items(
+    text: str,
+    specs: list[BoardSpec],
+    results: list[list],
+    marks: dict[str, incremental.Watermark],
+) -> tuple[str, dict[str, list], dict[str, incremental.Watermark]]:
+    """Merge items newer than each board's watermark (and not in ``text``) into ``text``.
+
+    Returns (text, new items per board, updated watermarks). New items that
+    repeat one already on another board get a duplicate marker; lines already
+    in ``text`` are not touched.
+    """
+    known = incremental.known_keys(text)
+    marks = dict(marks)
+    added: dict[str, list] = {}
+    new_urls: set[str] = set()
+    for spec, items in zip(specs, results):
+        mark = marks.get(spec.key) or incremental.Watermark()
+        fresh = []
+        for item in items:
+            row = item_row(item)
+            if not row:
+                continue
+            key = incremental.item_key(row[2])
+            if key in known or not mark.is_newer(row[2]):
+                continue
+            known.add(key)
+            fresh.append(item)
+            new_urls.add(row[2])
+        added[spec.key] = fresh
+        marks[spec.key] = mark.advance(item_rows(items))
+        if fresh:
+            text = incremental.merge_items(
+                text,
+                agency=spec.agency,
+                heading=spec.heading,
+                section=spec.appendix,
+                body_lines=spec.render(item_rows(fresh)).splitlines(),
+                appendix_lines=appendix_content(fresh).splitlines(),
+                newest_first=spec.newest_first,
+            )
+    if new_urls:
+        text, _ = dedupe.annotate(text, only=new_urls)
+    return text, added, marks
+
+
+def run_incremental(
+    ctx: CrawlContext,
+    path: Path,
+    *,
+    jobs: int = 1,
+    marks: dict[str, incremental.Watermark] | None = None,
+    write: bool = True,
+) -> tuple[dict[str, int], dict[str, incremental.Watermark]]:
+    """Fetch only items newer than each board's watermark and merge them into ``path``.
+
+    Watermarks missing from ``marks`` are derived from the file's Appendix.
+    Returns (new item count per board, updated watermarks).
+    """
+    before = path.read_text(encoding="utf-8")
+    specs = board_specs()
+    periods, marks = plan_incremental(ctx, before, specs, marks)
+    results = fetch_boards(ctx, specs, jobs=jobs, periods=periods)
+    text, fresh, marks = merge_new_items(before, specs, results, marks)
+    added = {key: len(items) for key, items in fresh.items()}
+    if write:
+        store_merged(ctx, before, specs, fresh)
+    if write and any(added.values()):
+        _write_atomic(path, text)
+    return added, marks
+
+
 def main() -> None:
+    ctx = CrawlContext("2024-10-01", "2024-12-31")
     print("[INFO] Unified crawler started")
-    print(f"[INFO] Jurisdiction: {JURISDICTION}")
-    print(f"[INFO] Period: {START_DATE_STR} ~ {END_DATE_STR}")
-    path = write_markdown()
+    print(f"[INFO] Jurisdiction: {ctx.jurisdiction}")
+    print(f"[INFO] Period: {ctx.start} ~ {ctx.end}")
+    path = write_markdown(ctx)
     print(f"[DONE] Markdown generated → {path}")
@@ -0,0 +1,62 @@
+"""Canonical item URLs for the four agencies.
+
+Detail links copied from list pages carry the list's state: FSS adds
+``sdate``/``edate``/``pageIndex``/``searchCnd``, FSC ``curPage`` and the search
+dates. The same article crawled for another period or page would get another
+URL, which splits every key built from it (corpus ids, MCP ``by_url``,
+incremental known keys, the prefetch store). :func:`canonical_url`
+keeps only what identifies the item on a known detail page::
+
+    https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=130553&menuNo=200218&sdate=2023-07-01&pageIndex=2
+    → https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=130553&menuNo=200218
+
+Identifying params are kept in a fixed order, so the result is both a stable
+key and a working link. Other URLs (news articles, attachments, list pages)
+only lose their fragment and get a normalized host.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# (host suffix, detail page path, identifying query params in output order)
+DETAIL_PAGES: tuple[tuple[str, re.Pattern, tuple[str, ...]], ...] = (
+    ("fss.or.kr", re.compile(r"/view\.do$"), ("nttId", "lrgSlno", "menuNo")),
+    ("fsc.go.kr", re.compile(r"^/[a-z]{2}\d+/\d+$"), ()),
+    ("fsc.go.kr", re.compile(r"^/[a-z]{2}\d+/view$"), ("noticeId",)),
+    ("kicpa.or.kr", re.compile(r"^/board/read\.brd$"), ("boardId", "cmpBrdId", "bltnNo")),
+    ("kicpa.or.kr", re.compile(r"^/kicpa/sumBoard/detail\.face$"), ("boardId", "bltnNo", "params")),
+    ("kasb.or.kr", re.compile(r"^/front/board/\w+View\.do$"), ("seq",)),
+    ("kasb.or.kr", re.compile(r"^/fe/bbs/NR_view\.do$"), ("bbsCd", "bbsSeq")),
+)
+AGENCY_HOSTS = ("fss.or.kr", "fsc.go.kr", "kicpa.or.kr", "kasb.or.kr")
+
+
+def _on(host: str, suffix: str) -> bool:
+    return host == suffix or host.endswith("." + suffix)
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str) -> str:
+    """Stable form of ``url``: identifying params only on agency detail pages."""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+    host = (parts.hostname or "").rstrip(".")
+    netloc = host if parts.port in (None, 80, 443) else f"{host}:{parts.port}"
+    scheme = parts.scheme.lower()
+    if any(_on(host, agency) for agency in AGENCY_HOSTS):
+        scheme = "https"
+    query = parts.query
+    for suffix, path_re, keep in DETAIL_PAGES:
+        if _on(host, suffix) and path_re.search(parts.path):
+            params = dict(parse_qsl(parts.query, keep_blank_values=True))
+            query = urlencode([(k, params[k]) for k in keep if params.get(k)], safe="/")
+            break
+    return urlunsplit((scheme, netloc, parts.path, query, ""))
@@ -9,6 +9,8 @@ from pathlib import Path
 
 import yaml
 
+from quarterly_doc import tokenize
+
 _NAV_MD_RE = re.compile(r"quality-updates/\d{4}/[^\s:]+\.md")
 _PERIOD_FILE_RE = re.compile(
     r"docs/quality-updates/(\d{4})/(\d{4}-\d{2}-\d{2})_to_(\d{4}-\d{2}-\d{2})\.md$"
@@ -16,14 +18,14 @@ _PERIOD_FILE_RE = re.compile(
 
 
 def _parse_front_matter_period(md_path: Path) -> tuple[str, str] | None:
-    text = md_path.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        return None
-    end = text.find("\n---", 3)
-    if end < 0:
+    return _front_matter_period(md_path.read_text(encoding="utf-8"))
+
+
+def _front_matter_period(text: str) -> tuple[str, str] | None:
+    doc = tokenize(text)
+    if doc.front_matter is None:
         return None
-    fm = yaml.safe_load(text[3:end]) or {}
-    period = fm.get("period") or {}
+    period = doc.meta.get("period") or {}
     start = period.get("start")
     end_date = period.get("end")
     if start and end_date:
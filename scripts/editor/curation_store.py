@@ -4,6 +4,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from crawler.urls import canonical_url
+
 
 ALLOWED_STATES = {"skip", "no_summary", "needs_summary"}
 ALLOWED_SOURCE_TYPES = {"pdf", "web", "clip", "url", "shot"}
@@ -13,7 +15,7 @@ def _item_key(item: dict) -> tuple[str, str, str]:
     return (
         str(item.get("date") or ""),
         str(item.get("title") or ""),
-        str(item.get("url") or ""),
+        canonical_url(str(item.get("url") or "")),
     )
 
 
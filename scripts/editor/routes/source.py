@@ -21,13 +21,49 @@ _KASB_ATTACHMENT_MAX_BYTES = 30 * 1024 * 1024
 
 @bp.route("/api/source/kasb_file")
 def kasb_file_proxy():
-    """한국회계기준원 첨부: POST로 받은 뒤 **설정된 downloads_folder**에 저장 (브라우저 기본 다운로드 경로 아님)."""
+    """한국회계기준원 첨부: 크롤러 prefetch 저장본 또는 POST로 받은 뒤 **설정된 downloads_folder**에 저장 (브라우저 기본 다운로드 경로 아님)."""
     file_no = (request.args.get("fileNo") or "").strip()
     file_seq = (request.args.get("fileSeq") or "").strip()
     if not file_no or not file_seq:
         return download_helpers.json_save_result(False, "Missing query params: fileNo, fileSeq", status=400)
     if not re.match(r"^-?[0-9]+$", file_no) or not re.match(r"^[0-9]+$", file_seq):
         return download_helpers.json_save_result(False, "Invalid fileNo/fileSeq.", status=400)
+    cached = source_fetch.prefetched(
+        _KASB_DOWNLOAD_POST_URL,
+        {"fileNo": file_no, "fileSeq": file_seq},
+        max_bytes=_KASB_ATTACHMENT_MAX_BYTES,
+    )
+    if cached is not None:
+        _final_url, body, _content_type, content_disp = cached
+    else:
+        fetched = _kasb_file_download(file_no, file_seq)
+        if not isinstance(fetched, tuple):
+            return fetched
+        body, content_disp = fetched
+
+    hint = download_helpers.parse_content_disposition_filename(content_disp)
+    fname = download_helpers.safe_attachment_storage_name(hint, body, fallback_stem="kasb-attachment")
+
+    root = config.repo_root()
+    cfg = config.load_config()
+    try:
+        downloads_folder = config._normalize_downloads_folder(cfg.get("downloads_folder"), root=root)
+    except ValueError:
+        downloads_folder = config._normalize_downloads_folder(config.DEFAULT_CONFIG["downloads_folder"], root=root)
+
+    folder = root / downloads_folder
+    try:
+        out_path = download_helpers.unique_file_path(folder, fname)
+        out_path.write_bytes(body)
+    except OSError as e:
+        return download_helpers.json_save_result(False, f"Could not save file: {e}", status=500)
+
+    rel = out_path.relative_to(root.resolve()).as_posix()
+    return download_helpers.json_save_result(True, f"첨부 저장: {out_path.name}", rel_posix=rel)
+
+
+def _kasb_file_download(file_no: str, file_seq: str):
+    """POST fileDownload.do; returns ``(body, content_disposition)`` or an error response."""
     try:
         source_fetch.validate_url(_KASB_DOWNLOAD_POST_URL)
     except ValueError:
@@ -65,27 +101,7 @@ def kasb_file_proxy():
     if len(data) == 0:
         return download_helpers.json_save_result(False, "Empty file from server.", status=502)
 
-    body = bytes(data)
-    content_disp = r.headers.get("content-disposition")
-    hint = download_helpers.parse_content_disposition_filename(content_disp)
-    fname = download_helpers.safe_attachment_storage_name(hint, body, fallback_stem="kasb-attachment")
-
-    root = config.repo_root()
-    cfg = config.load_config()
-    try:
-        downloads_folder = config._normalize_downloads_folder(cfg.get("downloads_folder"), root=root)
-    except ValueError:
-        downloads_folder = config._normalize_downloads_folder(config.DEFAULT_CONFIG["downloads_folder"], root=root)
-
-    folder = root / downloads_folder
-    try:
-        out_path = download_helpers.unique_file_path(folder, fname)
-        out_path.write_bytes(body)
-    except OSError as e:
-        return download_helpers.json_save_result(False, f"Could not save file: {e}", status=500)
-
-    rel = out_path.relative_to(root.resolve()).as_posix()
-    return download_helpers.json_save_result(True, f"첨부 저장: {out_path.name}", rel_posix=rel)
+    return bytes(data), r.headers.get("content-disposition")
 
 
 @bp.route("/api/source/preview")
@@ -9,6 +9,9 @@ MVP policy:
 - validate every redirect hop (<=3)
 - enforce connect/read timeouts and max bytes cutoff
 
+Bodies the crawler prefetched (``crawl.py --prefetch`` → ``.cache/crawler/store``)
+are served from local disk without touching the network.
+
 Limitations:
 - DNS rebinding: `validate_url()` resolves DNS to reject private IPs, but the actual
   TCP connection performed by `requests` may resolve again at connect time. This
@@ -24,6 +27,7 @@ import time
 from dataclasses import dataclass
 from time import perf_counter
 from typing import Iterable
+from pathlib import Path
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import requests
@@ -31,6 +35,10 @@ import urllib3.exceptions
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from crawler.store import open_store, request_key
+
+from . import config
+
 
 _ALLOWED_SCHEMES = {"http", "https"}
 _ALLOWED_PORTS = {80, 443}
@@ -152,6 +160,29 @@ def validate_url(url: str) -> NormalizedUrl:
     return NormalizedUrl(url=normalized, scheme=scheme, hostname=hostname, port=port)
 
 
+def prefetch_store_dir() -> Path:
+    return config.repo_root() / ".cache" / "crawler" / "store"
+
+
+def prefetched(
+    url: str,
+    data: dict[str, str] | None = None,
+    *,
+    max_bytes: int | None = None,
+) -> tuple[str, bytes, str | None, str | None] | None:
+    """Prefetched ``(final_url, body, content_type, content_disposition)`` for the request, if stored."""
+    store = open_store(prefetch_store_dir())
+    if store is None:
+        return None
+    hit = store.read(request_key(url, data))
+    if hit is None:
+        return None
+    entry, body = hit
+    if max_bytes is not None and len(body) > max_bytes:
+        return None
+    return entry.final_url or url, body, entry.content_type, entry.content_disposition
+
+
 def _session_with_retries() -> requests.Session:
     """Session with urllib3-level retries on connect/read drops (e.g. WinError 10054)."""
     session = requests.Session()
@@ -280,10 +311,17 @@ def fetch_url(
     Retries on transient TLS/TCP resets (common with some .go.kr hosts): urllib3
     retries per request plus a few full-fetch attempts with short backoff.
 
-    Preview feels slow when: each click refetches (no cache), DNS runs per request,
-    ``Connection: close`` avoids stale sockets on picky hosts, and slow upstreams
-    hit read timeout (see ``_TIMEOUT_DEFAULT``) before failing.
+    Preview feels slow when: each click refetches (unless ``crawl.py --prefetch``
+    stored the URL), DNS runs per request, ``Connection: close`` avoids stale
+    sockets on picky hosts, and slow upstreams hit read timeout (see
+    ``_TIMEOUT_DEFAULT``) before failing.
     """
+    hit = prefetched(url, max_bytes=max_bytes)
+    if hit is not None:
+        if timing is not None:
+            timing["store_hit"] = 1.0
+        return hit
+
     last_exc: BaseException | None = None
     for attempt in range(max_connection_attempts):
         t_attempt = perf_counter()
@@ -126,6 +126,7 @@
     document.getElementById('btn-import-md').addEventListener('click', onImportFromMd);
     document.getElementById('btn-change-folder').addEventListener('click', onChangeFolder);
     document.getElementById('btn-clear-downloads').addEventListener('click', onClearDownloads);
+    document.getElementById('btn-skip-duplicates').addEventListener('click', onSkipDuplicates);
     setupDivider();
     startAutoSave();
   }
@@ -426,6 +427,21 @@
     }
   }
 
+  function onSkipDuplicates() {
+    let n = 0;
+    linksData.forEach(l => {
+      if (l.duplicate_of && l.state === 'undecided') {
+        l.state = 'skip';
+        n += 1;
+      }
+    });
+    showToast(`중복 ${n}건 스킵`);
+    if (n) {
+      updateCounter();
+      renderTable();
+    }
+  }
+
   // ── Data loading ────────────────────────────────────────────────────────────
   async function loadLinks(file) {
     const data = await fetchJSON(`/api/links?file=${encodeURIComponent(file)}`);
@@ -467,7 +483,7 @@
           <div class="link-row-stack">
             <div class="link-row-line1">
               <div class="cell-date">${escHtml(link.date)}</div>
-              <div class="cell-title"><span class="title-link" role="link" tabindex="0" data-url="${escHtml(link.url)}">${escHtml(link.title)}</span></div>
+              <div class="cell-title"><span class="title-link" role="link" tabindex="0" data-url="${escHtml(link.url)}">${escHtml(link.title)}</span>${link.duplicate_of ? `<span class="dup-badge" title="중복: ${escHtml(link.duplicate_of)}">중복</span>` : ''}</div>
               <div class="cell-agency">${escHtml(link.agency || '')}</div>
               <div class="cell-state">${stateBadge(link, idx)}</div>
             </div>
@@ -1306,6 +1322,7 @@
     }
     if (!l.source) l.source = null;
     if (!l.pdf_path) l.pdf_path = null;
+    if (!l.duplicate_of) l.duplicate_of = null;
 
     l.sourcePanel =
       l.source && l.source.type === 'web' ? 'web'
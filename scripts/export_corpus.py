@@ -4,9 +4,14 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+import shutil
+import sqlite3
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -15,9 +20,19 @@ if str(_SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS_DIR))
 
 from corpus.parse import discover_quarter_files, infer_period_from_filename, parse_corpus_items  # noqa: E402
-from corpus.schema import SCHEMA_VERSION  # noqa: E402
+from corpus.schema import SCHEMA_VERSION, make_id  # noqa: E402
+from corpus.shards import SHARDS_DIR, shard_lines, write_shards  # noqa: E402
+from corpus.sqlite_db import DB_NAME, write_database  # noqa: E402
 
 KST = timezone(timedelta(hours=9))
+ALIASES_NAME = "aliases.json"
+# size/mtime -> sha256 per source file: machine-local (mtimes change on every
+# checkout), so it is gitignored and kept out of the committed manifest
+STAT_CACHE_NAME = "stat_cache.json"
+# Modules whose changes alter parsed items; a different fingerprint reparses every file.
+PARSER_MODULES = ("corpus/parse.py", "corpus/schema.py", "crawler/urls.py", "quarterly_doc.py")
+STATUS_COUNTS = ("done", "no_summary", "undecided")
+LAYOUTS = ("single", "sharded")
 
 
 def repo_root() -> Path:
@@ -63,69 +78,249 @@ def load_public_pages(root: Path, site_url: str) -> dict[str, str]:
     return mapping
 
 
+def parser_fingerprint() -> str:
+    h = hashlib.sha256()
+    for rel in PARSER_MODULES:
+        h.update((_SCRIPTS_DIR / rel).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def parse_source(content: str, rel: str, public_page: str, filename: str) -> tuple[dict, list[str]]:
+    """Parse one quarter file: its manifest fields and its items as JSON lines."""
+    fb_label, fb_period = infer_period_from_filename(filename)
+    meta, items = parse_corpus_items(
+        content,
+        source_doc=rel,
+        public_page=public_page,
+        fallback_period_label=fb_label,
+        fallback_period=fb_period,
+    )
+    fields = {
+        "public_page": public_page,
+        "period_label": str(meta["period_label"]) if meta.get("period_label") else None,
+        "shard": str(meta.get("period_label") or fb_label or ""),  # items' period_label
+        "items": len(items),
+        **{status: sum(1 for i in items if i.summary_status == status) for status in STATUS_COUNTS},
+    }
+    return fields, [item.to_json() for item in items]
+
+
+def parse_sources(args: list[tuple[str, str, str, str]], jobs: int = 1) -> list[tuple[dict, list[str]]]:
+    """:func:`parse_source` over every file, in order; ``jobs`` > 1 parses in a process pool.
+
+    Files are independent, so the pool's results (returned in submission
+    order) give the same output as the serial loop.
+    """
+    if jobs <= 1 or len(args) < 2:
+        return [parse_source(*a) for a in args]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(args))) as pool:
+        return list(pool.map(parse_source, *zip(*args)))
+
+
+def previous_sources(out_dir: Path, manifest: dict, parser: str) -> tuple[dict[str, tuple[dict, list[str]]], list[str]]:
+    """Per-file manifest entries and corpus lines of the previous export, plus all its lines.
+
+    Each source file's items are one contiguous block in manifest order, in
+    ``corpus.jsonl`` or in the file's period shard, so the blocks are sliced by
+    the recorded item counts. The mapping is empty (everything is reparsed)
+    when there is no usable previous export: no manifest ``sources``, another
+    parser or schema, or line counts that do not add up.
+    """
+    sharded = manifest.get("layout") == "sharded"
+    streams: dict[str | None, list[str]] = {}
+    if sharded:
+        streams = {s["period_label"]: shard_lines(out_dir, s) for s in manifest.get("shards") or []}
+    elif (out_dir / "corpus.jsonl").exists():
+        text = (out_dir / "corpus.jsonl").read_text(encoding="utf-8")
+        streams = {None: [line for line in text.splitlines() if line.strip()]}
+    lines = [line for stream in streams.values() for line in stream]
+
+    sources = manifest.get("sources") or []
+    if not all("shard" in s for s in sources):
+        return {}, lines
+    stream_of = (lambda s: s["shard"]) if sharded else (lambda s: None)
+    counts: dict[str | None, int] = {}
+    for entry in sources:
+        counts[stream_of(entry)] = counts.get(stream_of(entry), 0) + entry["items"]
+    if (
+        not sources
+        or manifest.get("parser") != parser
+        or manifest.get("schema_version") != SCHEMA_VERSION
+        or counts != {k: len(v) for k, v in streams.items()}
+    ):
+        return {}, lines
+    blocks: dict[str, tuple[dict, list[str]]] = {}
+    pos = dict.fromkeys(streams, 0)
+    for entry in sources:
+        key = stream_of(entry)
+        blocks[entry["path"]] = (entry, streams[key][pos[key] : pos[key] + entry["items"]])
+        pos[key] += entry["items"]
+    return blocks, lines
+
+
+def build_aliases(out_dir: Path, ids: set[str], old_lines: list[str]) -> dict[str, str]:
+    """Old item id -> current id, for ids an earlier export published.
+
+    ``old_lines`` (previous ``corpus.jsonl`` items that were reparsed) are
+    re-keyed with today's :func:`~corpus.schema.make_id` (canonical URLs);
+    earlier aliases are kept and follow their target when it was renamed too.
+    Aliases to ids that no longer exist are dropped.
+    """
+    renamed: dict[str, str] = {}
+    for line in old_lines:
+        old = json.loads(line)
+        new_id = make_id(old["period_label"], old["agency"], old["date"], old["url"])
+        if new_id != old["id"]:
+            renamed[old["id"]] = new_id
+    aliases_path = out_dir / ALIASES_NAME
+    previous = json.loads(aliases_path.read_text(encoding="utf-8")) if aliases_path.exists() else {}
+    merged = {old: renamed.get(new, new) for old, new in previous.items()}
+    merged.update(renamed)
+    return {old: new for old, new in sorted(merged.items()) if new in ids and old not in ids}
+
+
 def export_corpus(
     *,
     dry_run: bool = False,
     strict: bool = False,
     output_dir: Path | None = None,
+    full: bool = False,
+    jobs: int = 1,
+    layout: str = "single",
 ) -> dict:
+    """Export the corpus, reparsing only quarter files changed since the last export.
+
+    The manifest records each source file's size and sha256; the local
+    ``stat_cache.json`` beside it remembers the mtime each hash was taken at.
+    A file whose size and mtime match that cache is not read; one whose
+    content hash is unchanged is not parsed. Its items are carried over from the previous
+    ``corpus.jsonl`` as written, so the output is identical to a full export
+    (``full=True``) in content and order. Changed files are parsed by
+    :func:`parse_sources`, in ``jobs`` processes when ``jobs`` > 1.
+
+    ``layout="sharded"`` writes one JSONL per period under ``shards/`` with
+    the byte-offset index in the manifest (see :mod:`corpus.shards`) instead
+    of ``corpus.jsonl``. ``corpus.sqlite`` (FTS5, see :mod:`corpus.sqlite_db`)
+    is rebuilt from the same lines for the MCP server's SQL backend.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout must be one of {LAYOUTS}, got {layout!r}")
     root = repo_root()
     qu_dir = root / "docs" / "quality-updates"
     out_dir = output_dir or (root / "data" / "corpus")
     site_url = load_site_url(root)
     public_pages = load_public_pages(root, site_url)
+    parser = parser_fingerprint()
+    manifest_path = out_dir / "manifest.json"
+    last = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+    previous, old_lines = previous_sources(out_dir, last, parser)
+    if full:
+        previous = {}
+    stat_path = out_dir / STAT_CACHE_NAME
+    stat_cache = json.loads(stat_path.read_text(encoding="utf-8")) if stat_path.exists() else {}
+    stat_entries: dict[str, dict] = {}
 
-    all_items = []
-    periods: set[str] = set()
+    sources: list[dict] = []
+    blocks: list[list[str]] = []
+    pending: list[tuple[int, tuple[str, str, str, str]]] = []
+    stale: list[str] = []
 
     for md_path in discover_quarter_files(qu_dir):
         rel = md_path.relative_to(root).as_posix()
-        fb_label, fb_period = infer_period_from_filename(md_path.name)
-        content = md_path.read_text(encoding="utf-8")
-        meta, items = parse_corpus_items(
-            content,
-            source_doc=rel,
-            public_page=public_pages.get(rel, ""),
-            fallback_period_label=fb_label,
-            fallback_period=fb_period,
-        )
-        pl = meta.get("period_label")
-        if pl:
-            periods.add(str(pl))
-        all_items.extend(items)
+        public_page = public_pages.get(rel, "")
+        st = md_path.stat()
+        prev, prev_lines = previous.get(rel, ({}, []))
+        entry = {"path": rel, "size": st.st_size}
+        content = None
+        cached = stat_cache.get(rel, {})
+        if cached.get("size") == st.st_size and cached.get("mtime_ns") == st.st_mtime_ns:
+            entry["sha256"] = cached["sha256"]
+        else:
+            content = md_path.read_text(encoding="utf-8")
+            entry["sha256"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        stat_entries[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": entry["sha256"]}
+        sources.append(entry)
+        if prev.get("sha256") == entry["sha256"] and prev.get("public_page", "") == public_page:
+            # mtime_ns: recorded by exports before the stat cache
+            entry.update({k: v for k, v in prev.items() if k not in entry and k != "mtime_ns"})
+            blocks.append(prev_lines)
+            continue
+
+        if content is None:
+            content = md_path.read_text(encoding="utf-8")
+        stale.extend(prev_lines)
+        pending.append((len(blocks), (content, rel, public_page, md_path.name)))
+        blocks.append([])
 
+    for (idx, _), (fields, block) in zip(pending, parse_sources([args for _, args in pending], jobs)):
+        sources[idx].update(fields)
+        blocks[idx] = block
+    reparsed = len(pending)
+
+    lines = [line for block in blocks for line in block]
     stats = {
-        "item_count": len(all_items),
-        "periods": sorted(periods, reverse=True),
-        "done": sum(1 for i in all_items if i.summary_status == "done"),
-        "no_summary": sum(1 for i in all_items if i.summary_status == "no_summary"),
-        "undecided": sum(1 for i in all_items if i.summary_status == "undecided"),
+        "item_count": len(lines),
+        "periods": sorted({s["period_label"] for s in sources if s["period_label"]}, reverse=True),
+        **{status: sum(s[status] for s in sources) for status in STATUS_COUNTS},
+        "reparsed": reparsed,
     }
 
     if dry_run:
         return stats
 
     out_dir.mkdir(parents=True, exist_ok=True)
+    line_ids = [json.loads(line)["id"] for line in lines]
+    aliases = build_aliases(out_dir, set(line_ids), stale if previous else old_lines)
+    (out_dir / ALIASES_NAME).write_text(
+        json.dumps(aliases, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    stats["aliases"] = len(aliases)
     jsonl_path = out_dir / "corpus.jsonl"
-    with jsonl_path.open("w", encoding="utf-8") as f:
-        for item in all_items:
-            f.write(item.to_json() + "\n")
+    shards: list[dict] = []
+    if layout == "sharded":
+        groups: dict[str, tuple[list[str], list[str]]] = {}
+        pos = 0
+        for entry, block in zip(sources, blocks):
+            group_lines, group_ids = groups.setdefault(entry["shard"], ([], []))
+            group_lines.extend(block)
+            group_ids.extend(line_ids[pos : pos + len(block)])
+            pos += len(block)
+        shards = write_shards(out_dir, groups, last.get("shards") or [])
+        jsonl_path.unlink(missing_ok=True)
+    else:
+        with jsonl_path.open("w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line + "\n")
+        if (out_dir / SHARDS_DIR).exists():
+            shutil.rmtree(out_dir / SHARDS_DIR)
 
     manifest = {
         "schema_version": SCHEMA_VERSION,
         "generated_at": datetime.now(KST).isoformat(),
         "item_count": stats["item_count"],
         "periods": stats["periods"],
+        "alias_count": len(aliases),
         "source_commit": git_sha(root),
+        "parser": parser,
+        "layout": layout,
+        "sources": sources,
+        **({"shards": shards} if layout == "sharded" else {}),
     }
-    manifest_path = out_dir / "manifest.json"
+    try:
+        write_database(out_dir / DB_NAME, lines, manifest, aliases)
+        stats["sqlite"] = DB_NAME
+    except sqlite3.OperationalError as e:  # SQLite built without FTS5 / trigram tokenizer
+        print(f"[WARN] {DB_NAME} not written: {e}", file=sys.stderr)
+        stats["sqlite"] = None
     manifest_path.write_text(
         json.dumps(manifest, ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
+    stat_path.write_text(json.dumps(stat_entries, indent=2) + "\n", encoding="utf-8")
 
     if strict:
-        _strict_checks(root, all_items, stats)
+        _strict_checks(root, [json.loads(line) for line in lines], stats)
 
     return stats
 
@@ -134,10 +329,10 @@ def _strict_checks(root: Path, items, stats: dict) -> None:
     if stats["item_count"] < 10:
         raise SystemExit(f"strict: item_count too low ({stats['item_count']})")
     for item in items:
-        if item.schema_version != SCHEMA_VERSION:
-            raise SystemExit(f"strict: bad schema_version on {item.id}")
-        if not item.id or not item.url or not item.period_label:
-            raise SystemExit(f"strict: missing required fields on {item.id}")
+        if item["schema_version"] != SCHEMA_VERSION:
+            raise SystemExit(f"strict: bad schema_version on {item['id']}")
+        if not item["id"] or not item["url"] or not item["period_label"]:
+            raise SystemExit(f"strict: missing required fields on {item['id']}")
     validate_script = root / "scripts" / "validate_content.py"
     if validate_script.exists():
         import subprocess
@@ -160,11 +355,27 @@ def main() -> None:
         default=None,
         help="Output directory (default: data/corpus)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse changed files in N processes (0 = one per CPU; default: 1)",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="single",
+        help="single: corpus.jsonl; sharded: shards/<period>.jsonl with an offset index",
+    )
+    parser.add_argument("--full", action="store_true", help="Reparse every file, ignoring the previous export")
     args = parser.parse_args()
     stats = export_corpus(
         dry_run=args.dry_run,
         strict=args.strict,
         output_dir=args.output_dir,
+        full=args.full,
+        jobs=args.jobs or os.cpu_count() or 1,
+        layout=args.layout,
     )
     print(json.dumps(stats, ensure_ascii=False, indent=2))
 
@@ -17,7 +17,7 @@ from mcp.server.fastmcp import FastMCP  # noqa: E402
 from mcp_server.core import (  # noqa: E402
     get_regulatory_update,
     list_quarterly_periods,
-    load_corpus,
+    open_corpus,
     period_item_ids,
     search_regulatory_updates,
 )
@@ -34,7 +34,7 @@ mcp = FastMCP(
 
 @lru_cache(maxsize=1)
 def _store():
-    return load_corpus()
+    return open_corpus()
 
 
 @mcp.tool()
@@ -4,9 +4,14 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from corpus.shards import read_item, shard_lines
+from corpus.sqlite_db import iso_date, item_snippet, item_text
+from crawler.urls import canonical_url
+from mcp_server.sqlite_store import SqliteCorpus, open_sqlite_corpus
 
 
 @dataclass
@@ -14,39 +19,71 @@ class CorpusStore:
     manifest: dict[str, Any]
     items: list[dict[str, Any]]
     by_id: dict[str, dict[str, Any]]
-    by_url: dict[str, dict[str, Any]]
+    by_url: dict[str, dict[str, Any]]  # keyed by canonical URL
+    aliases: dict[str, str] = field(default_factory=dict)  # ids of earlier exports -> current id
+    base: Path | None = None  # sharded corpora: items of unloaded periods are read from here
 
 
 def default_corpus_dir() -> Path:
     return Path(__file__).resolve().parent.parent.parent / "data" / "corpus"
 
 
-def load_corpus(corpus_dir: Path | None = None) -> CorpusStore:
+def load_corpus(corpus_dir: Path | None = None, *, periods: Iterable[str] | None = None) -> CorpusStore:
+    """Load the exported corpus; with a sharded export, ``periods`` limits which shards are read."""
     base = corpus_dir or default_corpus_dir()
     manifest_path = base / "manifest.json"
     jsonl_path = base / "corpus.jsonl"
-    if not manifest_path.exists() or not jsonl_path.exists():
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+    sharded = manifest.get("layout") == "sharded"
+    if not manifest or not (sharded or jsonl_path.exists()):
         raise FileNotFoundError(
             f"Corpus not found in {base}. Run: python scripts/export_corpus.py"
         )
 
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    wanted = None if periods is None else set(periods)
+    if sharded:
+        lines = [
+            line
+            for shard in manifest.get("shards") or []
+            if wanted is None or shard["period_label"] in wanted
+            for line in shard_lines(base, shard)
+        ]
+    else:
+        lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+
     items: list[dict[str, Any]] = []
     by_id: dict[str, dict[str, Any]] = {}
     by_url: dict[str, dict[str, Any]] = {}
 
-    for line in jsonl_path.read_text(encoding="utf-8").splitlines():
+    for line in lines:
         if not line.strip():
             continue
         item = json.loads(line)
+        if wanted is not None and item.get("period_label") not in wanted:
+            continue
         items.append(item)
         by_id[item["id"]] = item
-        by_url[item["url"]] = item
-
-    return CorpusStore(manifest=manifest, items=items, by_id=by_id, by_url=by_url)
+        by_url[canonical_url(item["url"])] = item
+
+    aliases_path = base / "aliases.json"
+    aliases = json.loads(aliases_path.read_text(encoding="utf-8")) if aliases_path.exists() else {}
+    return CorpusStore(
+        manifest=manifest,
+        items=items,
+        by_id=by_id,
+        by_url=by_url,
+        aliases=aliases,
+        base=base if sharded else None,
+    )
+
+
+def open_corpus(corpus_dir: Path | None = None) -> CorpusStore | SqliteCorpus:
+    """The SQLite backend when ``corpus.sqlite`` matches the manifest, else the in-memory store."""
+    base = corpus_dir or default_corpus_dir()
+    return open_sqlite_corpus(base) or load_corpus(base)
 
 
-def list_quarterly_periods(store: CorpusStore) -> dict[str, Any]:
+def list_quarterly_periods(store: CorpusStore | SqliteCorpus) -> dict[str, Any]:
     return {
         "schema_version": store.manifest.get("schema_version"),
         "periods": store.manifest.get("periods", []),
@@ -55,17 +92,8 @@ def list_quarterly_periods(store: CorpusStore) -> dict[str, Any]:
     }
 
 
-def _item_text(item: dict[str, Any]) -> str:
-    parts = [item.get("title", "")]
-    for note in item.get("notes") or []:
-        parts.extend(note.get("bullets") or [])
-        for table in note.get("tables") or []:
-            parts.extend(table)
-    return "\n".join(parts).lower()
-
-
 def search_regulatory_updates(
-    store: CorpusStore,
+    store: CorpusStore | SqliteCorpus,
     *,
     query: str | None = None,
     agency: str | None = None,
@@ -75,6 +103,16 @@ def search_regulatory_updates(
     has_summary: bool | None = None,
     limit: int = 20,
 ) -> list[dict[str, Any]]:
+    if isinstance(store, SqliteCorpus):
+        return store.search(
+            query=query,
+            agency=agency,
+            period_label=period_label,
+            date_from=date_from,
+            date_to=date_to,
+            has_summary=has_summary,
+            limit=limit,
+        )
     q = (query or "").lower().strip()
     results: list[dict[str, Any]] = []
 
@@ -87,18 +125,14 @@ def search_regulatory_updates(
             continue
         if has_summary is False and item.get("summary_status") == "done":
             continue
-        if date_from and item.get("date", "") < date_from:
+        if date_from and iso_date(item.get("date", "")) < iso_date(date_from):
             continue
-        if date_to and item.get("date", "") > date_to:
+        if date_to and iso_date(item.get("date", "")) > iso_date(date_to):
             continue
-        if q and q not in _item_text(item):
+        if q and q not in item_text(item):
             continue
 
-        snippet = item.get("title", "")
-        notes = item.get("notes") or []
-        if notes and notes[0].get("bullets"):
-            snippet = notes[0]["bullets"][0][:120]
-
+        snippet = item_snippet(item)
         results.append(
             {
                 "id": item["id"],
@@ -118,17 +152,24 @@ def search_regulatory_updates(
 
 
 def get_regulatory_update(
-    store: CorpusStore,
+    store: CorpusStore | SqliteCorpus,
     *,
     id: str | None = None,
     url: str | None = None,
 ) -> dict[str, Any] | None:
+    if isinstance(store, SqliteCorpus):
+        return store.get(id=id, url=url)
     if id:
+        id = id if id in store.by_id else store.aliases.get(id, id)
+        if id not in store.by_id and store.base is not None:
+            return read_item(store.base, store.manifest, id)
         return store.by_id.get(id)
     if url:
-        return store.by_url.get(url)
+        return store.by_url.get(canonical_url(url))
     return None
 
 
-def period_item_ids(store: CorpusStore, period_label: str) -> list[str]:
+def period_item_ids(store: CorpusStore | SqliteCorpus, period_label: str) -> list[str]:
+    if isinstance(store, SqliteCorpus):
+        return store.period_ids(period_label)
     return [i["id"] for i in store.items if i.get("period_label") == period_label]
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""SQLite/FTS5 storage backend for the MCP tools.
+
+Answers the same search/get/period queries as the in-memory
+:class:`~mcp_server.core.CorpusStore` from ``corpus.sqlite`` (written by
+``export_corpus``), so memory does not grow with the corpus and filters are
+index lookups. Results and their order match the in-memory store.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from corpus.sqlite_db import DB_NAME, iso_date
+from crawler.urls import canonical_url
+
+SEARCH_FIELDS = ("id", "date", "title", "agency", "period_label", "summary_status", "url")
+
+
+def _like(q: str) -> str:
+    return "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+@dataclass
+class SqliteCorpus:
+    path: Path
+    manifest: dict[str, Any]
+    conn: sqlite3.Connection
+
+    def search(
+        self,
+        *,
+        query: str | None = None,
+        agency: str | None = None,
+        period_label: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        has_summary: bool | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        where: list[str] = []
+        params: list[Any] = []
+        if agency:
+            where.append("agency = ?")
+            params.append(agency)
+        if period_label:
+            where.append("period_label = ?")
+            params.append(period_label)
+        if has_summary is True:
+            where.append("summary_status = 'done'")
+        if has_summary is False:
+            where.append("summary_status != 'done'")
+        if date_from:
+            where.append("date_iso >= ?")
+            params.append(iso_date(date_from))
+        if date_to:
+            where.append("date_iso <= ?")
+            params.append(iso_date(date_to))
+        q = (query or "").lower().strip()
+        if len(q) >= 3:
+            # trigram tokenizer: a quoted phrase matches any substring of 3+ characters
+            where.append("seq IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)")
+            params.append('"' + q.replace('"', '""') + '"')
+        elif q:
+            where.append("seq IN (SELECT rowid FROM items_fts WHERE text LIKE ? ESCAPE '\\')")
+            params.append(_like(q))
+        sql = "SELECT doc, snippet FROM items"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY seq LIMIT ?"
+        results = []
+        for doc, snippet in self.conn.execute(sql, (*params, limit)):
+            item = json.loads(doc)
+            results.append({**{k: item.get(k) for k in SEARCH_FIELDS}, "snippet": snippet})
+        return results
+
+    def _doc(self, column: str, value: str) -> dict[str, Any] | None:
+        row = self.conn.execute(
+            f"SELECT doc FROM items WHERE {column} = ? ORDER BY seq DESC LIMIT 1", (value,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get(self, *, id: str | None = None, url: str | None = None) -> dict[str, Any] | None:
+        if id:
+            item = self._doc("id", id)
+            if item is None:
+                row = self.conn.execute("SELECT new FROM aliases WHERE old = ?", (id,)).fetchone()
+                item = self._doc("id", row[0]) if row else None
+            return item
+        if url:
+            return self._doc("url_key", canonical_url(url))
+        return None
+
+    def period_ids(self, period_label: str) -> list[str]:
+        rows = self.conn.execute("SELECT id FROM items WHERE period_label = ? ORDER BY seq", (period_label,))
+        return [r[0] for r in rows]
+
+
+def open_sqlite_corpus(base: Path) -> SqliteCorpus | None:
+    """The database in ``base`` when it was built from the current manifest, else None."""
+    path = base / DB_NAME
+    manifest_path = base / "manifest.json"
+    if not path.exists() or not manifest_path.exists():
+        return None
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'manifest'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+    if row is None or json.loads(row[0]).get("generated_at") != manifest.get("generated_at"):
+        conn.close()
+        return None
+    return SqliteCorpus(path=path, manifest=manifest, conn=conn)
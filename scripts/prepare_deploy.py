@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
@@ -14,6 +13,7 @@ if str(_SCRIPTS) not in sys.path:
 
 from deploy_hints import all_hints
 from skip_removal import remove_skip_pairs
+from validate_content import default_paths, validate_paths
 
 
 def repo_root() -> Path:
@@ -36,11 +36,9 @@ def process_file(path: Path, *, dry_run: bool) -> tuple[str, bool]:
 
 
 def run_validate() -> int:
-    cmd = [sys.executable, str(_SCRIPTS / "validate_content.py"), "--strict"]
-    if default_targets():
-        cmd.extend(str(p) for p in default_targets())
-    result = subprocess.run(cmd, cwd=repo_root())
-    return result.returncode
+    """validate_content --strict in-process: the files just rewritten reuse their tokenization."""
+    paths = [p.resolve() for p in default_targets()] or default_paths(repo_root())
+    return 1 if validate_paths(paths, strict=True, repo_root=repo_root()) else 0
 
 
 def main(argv: list[str] | None = None) -> int:
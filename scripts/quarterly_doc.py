@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""Single-pass tokenizer and document model for quarterly markdown.
+
+The editor parser, corpus export, skip removal, source-marker layout,
+reorder/repair and ``validate_content`` all read the same
+``docs/quality-updates/YYYY/*.md`` files. :func:`tokenize` classifies every
+line once, dispatching on its first non-blank character so most lines cost one
+``lstrip`` and at most one regex, and each tool works from the resulting
+:class:`Document`:
+
+- ``tokens``: one :class:`Token` per line (``text.split("\\n")``, so indices
+  are 0-based line numbers and joining the lines back gives the text);
+  ``main_tokens`` covers only the lines through the Appendix heading, which
+  is all most tools read (the Appendix holds most of the links);
+- ``front_matter``: the ``---`` lines around the YAML block, ``meta`` its data;
+- ``appendix``: the column-0 ``## Appendix`` heading (items stop there);
+  reorder and repair split at :meth:`Document.appendix_a` instead;
+- ``items``: link lines before the Appendix with their agency and
+  subsection, curation state, source marker and note blocks.
+
+Documents are cached by content, so tools run one after another on the same
+text share one tokenization. Each CLI runs one tool per process, so nothing
+is classified or imported before a tool asks for it: building a Document
+only splits the lines and finds the front matter and Appendix, ``main_tokens``
+and ``tokens`` are classified on first use, :meth:`Document.tokens_before`
+stays in the main body when that covers the range, and PyYAML is imported
+only for ``meta``.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, Iterable
+
+BLANK = "blank"
+HEADING = "heading"
+LINK = "link"  # - (YY-MM-DD) [title](url), at any indentation
+BULLET = "bullet"  # other "- " lines; ``date`` is set for "- (YY-MM-DD) " ones
+MARKER = "marker"  # <!-- skip -->, <!-- no_summary -->, <!-- source: ... -->, <!-- pdf: ... -->
+ADMONITION = "admonition"  # !!! / ??? blocks
+TABLE = "table"  # lines starting with "|"
+RULE = "rule"  # lines starting with "---"
+TEXT = "text"
+
+LINK_RE = re.compile(r"- \((\d{2}-\d{2}-\d{2})\) \[(.+?)\]\((https?://[^\)]+)\)")
+DATED_RE = re.compile(r"- \((\d{2}-\d{2}-\d{2})\) ")
+DUPLICATE_RE = re.compile(r"<!-- duplicate: (\S+) -->\s*$")
+HEADING_RE = re.compile(r"(#{1,6})\s+(.+)")
+APPENDIX_A_RE = re.compile(r"## Appendix A\b")
+MARKER_RE = re.compile(r"<!-- (?:(skip|no_summary) -->|(source|pdf):\s*(.+?)\s*-->)")
+SOURCE_VALUE_RE = re.compile(r"([a-zA-Z0-9_-]+)\|(.+)")
+ADMONITION_RE = re.compile(r"([!?]{3})\s+(\w+)(.*)")
+NOTE_TITLE_RE = re.compile(r'\s+"(.+?)"\s*$')
+
+ALLOWED_SOURCE_TYPES = {"pdf", "web", "clip", "url", "shot"}
+AGENCIES = ("금융감독원", "금융위원회", "한국공인회계사회", "한국회계기준원")
+DEFAULT_NOTE_TITLE = "주요 내용"
+
+
+@dataclass(slots=True)
+class Token:
+    """One classified line.
+
+    ``stripped`` is the line without surrounding whitespace. Kind-specific
+    fields: headings set ``level``/``title``; links ``date``/``title``/``url``
+    and ``duplicate_of``; markers ``name`` (skip, no_summary, source, pdf) and
+    ``value``; admonitions ``name`` (note, info, ...), ``value`` (``!!!`` or
+    ``???``), ``title`` (quoted title) and ``tail`` (text after the type).
+    """
+
+    kind: str
+    indent: int
+    stripped: str
+    date: str | None = None
+    level: int = 0
+    title: str | None = None
+    url: str | None = None
+    duplicate_of: str | None = None
+    name: str | None = None
+    value: str | None = None
+    tail: str = ""
+
+
+@dataclass
+class Note:
+    """A ``!!!``/``???`` note under a link: its lines [start, end), bullets and table rows."""
+
+    start: int
+    end: int
+    admonition: str
+    title: str
+    bullets: list[str] = field(default_factory=list)
+    tables: list[list[str]] = field(default_factory=list)
+
+
+@dataclass
+class Item:
+    """A link line before the Appendix and what follows it.
+
+    ``agency`` comes from the last ``#``-``###`` heading naming an agency,
+    ``section_agency`` from the last ``#``-``####`` one (the editor's view).
+    ``state`` is ``skip``, ``no_summary``, ``needs_summary`` (source or pdf
+    marker), ``done`` (note block) or ``undecided``; ``end`` is the first line
+    after the item's marker and note.
+    """
+
+    line: int
+    date: str
+    title: str
+    url: str
+    agency: str | None
+    subsection: str
+    state: str = "undecided"
+    source: dict[str, str] | None = None
+    pdf_path: str | None = None
+    marker: int | None = None
+    notes: list[Note] = field(default_factory=list)
+    end: int = 0
+    duplicate_of: str | None = None
+    section_agency: str | None = None
+
+
+def classify(line: str) -> Token:
+    """Token for one line (a trailing ``\\r`` is ignored)."""
+    body = line.lstrip()
+    indent = len(line) - len(body)
+    stripped = body.rstrip()
+    if not stripped:
+        return Token(BLANK, indent, "")
+    c = stripped[0]
+    if c == "-":
+        if stripped.startswith("---"):
+            return Token(RULE, indent, stripped)
+        if not stripped.startswith("- ("):
+            return Token(BULLET, indent, stripped)
+        m = LINK_RE.match(stripped)
+        if m:
+            date, title, url = m.groups()
+            dup = DUPLICATE_RE.search(stripped) if "<!-- duplicate:" in stripped else None
+            return Token(LINK, indent, stripped, date, 0, title, url, dup.group(1) if dup else None)
+        m = DATED_RE.match(body)
+        return Token(BULLET, indent, stripped, m.group(1) if m else None)
+    if c == "#":
+        m = HEADING_RE.match(stripped)
+        if m:
+            return Token(HEADING, indent, stripped, None, len(m.group(1)), m.group(2))
+    elif c == "<":
+        m = MARKER_RE.match(stripped)
+        if m:
+            if m.group(1):
+                return Token(MARKER, indent, stripped, name=m.group(1))
+            return Token(MARKER, indent, stripped, name=m.group(2), value=m.group(3))
+    elif c == "!" or c == "?":
+        m = ADMONITION_RE.match(stripped)
+        if m:
+            tail = m.group(3)
+            t = NOTE_TITLE_RE.match(tail)
+            return Token(
+                ADMONITION, indent, stripped, name=m.group(2), value=m.group(1),
+                title=t.group(1) if t else None, tail=tail,
+            )
+    elif c == "|":
+        return Token(TABLE, indent, stripped)
+    return Token(TEXT, indent, stripped)
+
+
+def detect_agency(title: str) -> str | None:
+    for agency in AGENCIES:
+        if agency in title:
+            return agency
+    return None
+
+
+def is_note(tok: Token) -> bool:
+    """An indented ``!!! note`` / ``??? note`` line (a link's summary block)."""
+    return tok.kind == ADMONITION and tok.name == "note" and tok.indent > 0
+
+
+class Document:
+    """Tokens and structure of one quarterly markdown file."""
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        n = len(lines)
+        self.front_matter: tuple[int, int] | None = None
+        if n and lines[0].strip() == "---":
+            close = next((i for i in range(1, n) if lines[i].strip() == "---"), None)
+            if close is not None:
+                self.front_matter = (0, close)
+        self.body_start = self.front_matter[1] + 1 if self.front_matter else 0
+        self.appendix = next((i for i, line in enumerate(lines) if line.startswith("## Appendix")), n)
+
+    @cached_property
+    def main_tokens(self) -> list[Token]:
+        """Tokens of lines [0, appendix]: the heading is included, so every
+        :attr:`main_next` lookup before it stays inside the list."""
+        return [classify(line) for line in self.lines[: self.appendix + 1]]
+
+    @cached_property
+    def main_next(self) -> list[int]:
+        return _next_content(self.main_tokens)
+
+    @cached_property
+    def tokens(self) -> list[Token]:
+        main = self.main_tokens
+        return main + [classify(line) for line in self.lines[len(main) :]]
+
+    @cached_property
+    def next_content(self) -> list[int]:
+        """next_content[i]: first non-blank line at or after i (``len(tokens)`` when none)."""
+        return _next_content(self.tokens)
+
+    @cached_property
+    def index(self) -> dict[str, list[int]]:
+        """Line numbers of each non-blank kind, ascending."""
+        index: dict[str, list[int]] = {}
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != BLANK:
+                index.setdefault(tok.kind, []).append(i)
+        return index
+
+    @classmethod
+    def from_text(cls, text: str) -> "Document":
+        return cls(text.split("\n"))
+
+    @cached_property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @cached_property
+    def meta(self) -> dict[str, Any]:
+        """Parsed YAML front matter ({} when absent)."""
+        if not self.front_matter:
+            return {}
+        import yaml  # only front-matter readers pay for the import
+
+        # libyaml when available: front matter parsing otherwise costs as much as tokenizing
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load("\n".join(self.lines[1 : self.front_matter[1]]), Loader=loader) or {}
+
+    @cached_property
+    def line_starts(self) -> list[int]:
+        starts = [0]
+        for line in self.lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        return starts
+
+    def line_at(self, offset: int) -> int:
+        """0-based line of a character offset in :attr:`text`."""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def next_non_blank(self, i: int) -> int | None:
+        j = self.next_content[min(i, len(self.tokens))]
+        return j if j < len(self.tokens) else None
+
+    def prev_non_blank(self, i: int) -> int | None:
+        j = i
+        while j >= 0 and self.tokens[j].kind == BLANK:
+            j -= 1
+        return j if j >= 0 else None
+
+    def appendix_a(self, start: int = 0) -> int:
+        """First ``## Appendix A`` heading at or after ``start``, at any indentation."""
+        main = self.main_tokens
+        for i in range(start, len(main)):
+            tok = main[i]
+            if tok.kind == HEADING and APPENDIX_A_RE.match(tok.stripped):
+                return i
+        start = max(start, len(main))
+        return next((i for i, tok in self.of_kind(HEADING, start) if APPENDIX_A_RE.match(tok.stripped)), len(self.lines))
+
+    def tokens_before(self, end: int) -> list[Token]:
+        """Tokens covering lines [0, end): :attr:`main_tokens` when they reach that far."""
+        main = self.main_tokens
+        return main if end <= len(main) else self.tokens
+
+    def of_kind(self, kind: str, start: int = 0, end: int | None = None) -> Iterable[tuple[int, Token]]:
+        """(line, token) of one kind within [start, end), in order."""
+        found = self.index.get(kind, [])
+        lo = bisect_left(found, start) if start else 0
+        hi = len(found) if end is None else bisect_left(found, end)
+        tokens = self.tokens
+        for i in found[lo:hi]:
+            yield i, tokens[i]
+
+    @cached_property
+    def items(self) -> list[Item]:
+        """Link items before the Appendix, in document order."""
+        items: list[Item] = []
+        agency: str | None = None
+        section_agency: str | None = None
+        subsection = ""
+        tokens = self.main_tokens
+        for i in range(self.body_start, self.appendix):
+            tok = tokens[i]
+            if tok.kind == HEADING:
+                if tok.indent == 0 and tok.level <= 4:
+                    found = detect_agency(tok.title)
+                    if found:
+                        section_agency = found
+                        if tok.level <= 3:
+                            agency = found
+                    if tok.level == 4:
+                        subsection = tok.title.strip()
+            elif tok.kind == LINK:
+                item = Item(
+                    i, tok.date, tok.title, tok.url, agency, subsection,
+                    duplicate_of=tok.duplicate_of, section_agency=section_agency,
+                )
+                self._resolve(item)
+                items.append(item)
+        return items
+
+    def _resolve(self, item: Item) -> None:
+        """Curation state, source and notes from the lines after the link."""
+        tokens = self.main_tokens
+        j = self.main_next[item.line + 1]
+        item.end = j
+        if j >= len(tokens):
+            return
+        tok = tokens[j]
+        if tok.kind == MARKER:
+            item.marker = j
+            item.end = j + 1
+            if tok.name in ("skip", "no_summary"):
+                item.state = tok.name
+                return
+            if tok.name == "pdf":
+                item.state = "needs_summary"
+                item.pdf_path = tok.value
+                item.source = {"type": "pdf", "ref": tok.value}
+                return
+            m = SOURCE_VALUE_RE.match(tok.value)
+            if not m:  # not a typed marker: the item stays undecided
+                item.marker, item.end = None, j
+                return
+            src_type = m.group(1)
+            if src_type == "url":
+                src_type = "web"
+            if src_type in ALLOWED_SOURCE_TYPES:
+                item.state = "needs_summary"
+                item.source = {"type": src_type, "ref": m.group(2).strip()}
+                if src_type == "pdf":
+                    item.pdf_path = item.source["ref"]
+            k = self.main_next[j + 1]
+            if k < len(tokens) and is_note(tokens[k]):
+                item.notes.append(self.note(k))
+                item.state = "done"
+                item.end = item.notes[-1].end
+            return
+        if is_note(tok):
+            item.notes.append(self.note(j))
+            item.state = "done"
+            item.end = item.notes[-1].end
+
+    def column_state(self, item: Item) -> str:
+        """``item.state``, except that an indented skip/no_summary marker leaves it undecided.
+
+        The editor and skip removal only honour those markers at column 0; the
+        corpus export accepts them at any indentation.
+        """
+        if item.state in ("skip", "no_summary") and self.main_tokens[item.marker].indent:
+            return "undecided"
+        return item.state
+
+    def note(self, start: int) -> Note:
+        """The note block opened at ``start``: bullets and table rows until it dedents."""
+        tokens = self.main_tokens if start < len(self.main_tokens) else self.tokens
+        head = tokens[start]
+        base = head.indent + 4
+        note = Note(start, start + 1, head.value, head.title or DEFAULT_NOTE_TITLE)
+        table: list[str] | None = None
+        i = start + 1
+        while i < len(tokens):
+            tok = tokens[i]
+            if tok.kind == BLANK:
+                i += 1
+                continue
+            if tok.indent < base or tok.kind == LINK or (tok.kind == HEADING and tok.indent == 0):
+                break
+            if tok.kind == TABLE and len(tok.stripped) > 2 and tok.stripped.endswith("|"):
+                if table is None:
+                    table = []
+                table.append(tok.stripped)
+                i += 1
+                continue
+            if table:
+                note.tables.append(table)
+                table = None
+            if tok.stripped.startswith("- "):
+                note.bullets.append(tok.stripped[2:].strip())
+            i += 1
+        if table:
+            note.tables.append(table)
+        note.end = i
+        return note
+
+
+def _next_content(tokens: list[Token]) -> list[int]:
+    n = len(tokens)
+    nxt = [n] * (n + 1)
+    following = n
+    for i in range(n - 1, -1, -1):
+        if tokens[i].kind != BLANK:
+            following = i
+        nxt[i] = following
+    return nxt
+
+
+@lru_cache(maxsize=32)
+def tokenize(text: str) -> Document:
+    """The :class:`Document` for ``text`` (cached: treat it as read-only)."""
+    return Document.from_text(text)
+
+
+def as_document(lines: "list[str] | Document") -> Document:
+    """Accept a Document or a list of lines (with or without line endings)."""
+    if isinstance(lines, Document):
+        return lines
+    return Document([line.rstrip("\n") for line in lines])
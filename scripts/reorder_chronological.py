@@ -6,132 +6,102 @@ Quality-updates 문서의 날짜순 리스트를 과거→현재 순으로 재
 """
 
 import argparse
-import re
 import sys
 from pathlib import Path
-from typing import Optional
 
+from quarterly_doc import HEADING, RULE, Document, Token, tokenize
 
-DATE_PATTERN = re.compile(r"^(\s*)- \((\d{2})-(\d{2})-(\d{2})\) ")
-APPENDIX_RE = re.compile(r"^## Appendix A\b")
-SUBSECTION_RE = re.compile(r"^####\s+")
-AGENCY_RE = re.compile(r"^###\s+")
 
-
-def _appendix_boundary(lines: list[str]) -> int:
-    for idx, line in enumerate(lines):
-        if APPENDIX_RE.match(line.strip()):
-            return idx
-    return len(lines)
-
-
-def parse_date_from_line(line: str) -> Optional[tuple[str, tuple[int, int, int]]]:
-    m = DATE_PATTERN.match(line)
-    if not m:
-        return None
-    indent, yy, mm, dd = m.group(1), int(m.group(2)), int(m.group(3)), int(m.group(4))
-    year = 2000 + yy
-    return (indent, (year, mm, dd))
+def _is_header(tok: Token) -> bool:
+    """### 기관 / #### 하위섹션 헤더 (들여쓰기 무관)."""
+    return tok.kind == HEADING and tok.level in (3, 4)
 
 
 def _is_schedule_subsection(header_line: str, in_kasb: bool) -> bool:
     return in_kasb and "주요일정" in header_line
 
 
-def _extract_item_block(lines: list[str], start: int) -> tuple[str, int]:
-    item_lines = [lines[start]]
+def _extract_item_block(doc: Document, tokens: list[Token], start: int, end: int) -> tuple[str, int]:
     k = start + 1
-    while k < len(lines):
-        nxt = lines[k]
-        if parse_date_from_line(nxt) is not None:
-            break
-        if SUBSECTION_RE.match(nxt.strip()) or AGENCY_RE.match(nxt.strip()):
+    while k < end:
+        tok = tokens[k]
+        if tok.date is not None or _is_header(tok) or tok.kind == RULE:
             break
-        if APPENDIX_RE.match(nxt.strip()):
-            break
-        if nxt.strip().startswith("---"):
-            break
-        item_lines.append(nxt)
         k += 1
-    return "\n".join(item_lines), k
+    return "\n".join(doc.lines[start:k]), k
 
 
-def _sort_subsection_items(lines: list[str], start: int, end: int) -> list[str]:
-    items: list[tuple[tuple[int, int, int], str]] = []
+def _sort_subsection_items(doc: Document, tokens: list[Token], start: int, end: int) -> list[str]:
+    items: list[tuple[str, str]] = []
     prefix: list[str] = []
     i = start
     while i < end:
-        line = lines[i]
-        parsed = parse_date_from_line(line)
-        if parsed is None:
-            prefix.append(line)
+        date = tokens[i].date
+        if date is None:
+            prefix.append(doc.lines[i])
             i += 1
             continue
-        _, dt = parsed
-        block, i = _extract_item_block(lines, i)
-        items.append((dt, block))
+        block, i = _extract_item_block(doc, tokens, i, end)
+        items.append((date, block))
     if not items:
-        return lines[start:end]
+        return doc.lines[start:end]
+    # yy-mm-dd 문자열 순서 == 날짜 순서 (안정 정렬)
     sorted_blocks = [block for _, block in sorted(items, key=lambda x: x[0])]
     out = prefix[:]
-    for idx, block in enumerate(sorted_blocks):
+    for block in sorted_blocks:
         if out and out[-1].strip() != "":
             out.append("")
         out.append(block)
     return out
 
 
-def process_file(filepath: Path, dry_run: bool = False) -> bool:
-    text = filepath.read_text(encoding="utf-8")
-    lines = text.split("\n")
-    appendix_start = _appendix_boundary(lines)
-    main_lines = lines[:appendix_start]
-    appendix_lines = lines[appendix_start:]
+def reorder_text(text: str) -> str:
+    """본문(Appendix 앞)의 #### 하위섹션별 날짜 항목을 과거→현재 순으로 정렬한 텍스트."""
+    doc = tokenize(text)
+    lines = doc.lines
+    main_end = doc.appendix_a()
+    tokens = doc.tokens_before(main_end)
 
     output: list[str] = []
     i = 0
     in_kasb = False
 
-    while i < len(main_lines):
-        line = main_lines[i]
+    while i < main_end:
+        tok = tokens[i]
+        line = lines[i]
 
-        if AGENCY_RE.match(line.strip()):
+        if tok.kind == HEADING and tok.level == 3:
             in_kasb = "한국회계기준원" in line
             output.append(line)
             i += 1
             continue
 
-        if SUBSECTION_RE.match(line.strip()):
-            header = line
-            output.append(header)
+        if tok.kind == HEADING and tok.level == 4:
+            output.append(line)
             i += 1
-            if _is_schedule_subsection(header, in_kasb):
-                while i < len(main_lines):
-                    nxt = main_lines[i]
-                    if SUBSECTION_RE.match(nxt.strip()) or AGENCY_RE.match(nxt.strip()):
-                        break
-                    output.append(nxt)
-                    i += 1
-                continue
-
             subsection_start = i
-            while i < len(main_lines):
-                nxt = main_lines[i]
-                if SUBSECTION_RE.match(nxt.strip()) or AGENCY_RE.match(nxt.strip()):
-                    break
+            while i < main_end and not _is_header(tokens[i]):
                 i += 1
-            output.extend(_sort_subsection_items(main_lines, subsection_start, i))
+            if _is_schedule_subsection(line, in_kasb):
+                output.extend(lines[subsection_start:i])
+            else:
+                output.extend(_sort_subsection_items(doc, tokens, subsection_start, i))
             continue
 
         output.append(line)
         i += 1
 
+    appendix_lines = lines[main_end:]
     if appendix_lines:
-        if output and appendix_lines and output[-1].strip() != "":
+        if output and output[-1].strip() != "":
             output.append("")
         output.extend(appendix_lines)
+    return "\n".join(output)
 
-    new_text = "\n".join(output)
+
+def process_file(filepath: Path, dry_run: bool = False) -> bool:
+    text = filepath.read_text(encoding="utf-8")
+    new_text = reorder_text(text)
     if new_text != text:
         if not dry_run:
             filepath.write_text(new_text, encoding="utf-8")
@@ -4,15 +4,10 @@
 from __future__ import annotations
 
 import argparse
-import re
 import sys
 from pathlib import Path
 
-LINK_RE = re.compile(
-    r"^- \((\d{2})-(\d{2})-(\d{2})\) \[(.+?)\]\((https?://[^\)]+)\)"
-)
-APPENDIX_RE = re.compile(r"^## Appendix A\b")
-FRONTMATTER_RE = re.compile(r"^---\s*$")
+from quarterly_doc import LINK, Document, Token, tokenize
 
 SECTIONS: list[tuple[str, list[str]]] = [
     ("금융감독원", ["보도자료", "세칙제ㆍ개정예고", "회계감독 동향자료"]),
@@ -25,7 +20,8 @@ SECTIONS: list[tuple[str, list[str]]] = [
 ]
 
 
-def _date_key(yy: str, mm: str, dd: str) -> tuple[int, int, int]:
+def _date_key(date: str) -> tuple[int, int, int]:
+    yy, mm, dd = date.split("-")
     return (2000 + int(yy), int(mm), int(dd))
 
 
@@ -55,50 +51,35 @@ def classify_url(url: str) -> tuple[str, str]:
     raise ValueError(f"Unclassified URL: {url}")
 
 
-def split_document(text: str) -> tuple[str, list[str], list[str]]:
-    lines = text.split("\n")
-    if not lines or not FRONTMATTER_RE.match(lines[0]):
+def split_document(text: str) -> tuple[Document, str]:
+    """Tokenized document and its front matter text (``---`` through ``---``)."""
+    doc = tokenize(text)
+    if doc.lines[0].strip() != "---":
         raise ValueError("Expected YAML frontmatter")
-    end = 1
-    while end < len(lines) and not (end > 0 and FRONTMATTER_RE.match(lines[end])):
-        end += 1
-    if end >= len(lines):
+    if doc.front_matter is None:
         raise ValueError("Unclosed frontmatter")
-    frontmatter = "\n".join(lines[: end + 1])
-    body = lines[end + 1 :]
-    appendix_idx = next(
-        (i for i, ln in enumerate(body) if APPENDIX_RE.match(ln.strip())),
-        len(body),
-    )
-    return frontmatter, body[:appendix_idx], body[appendix_idx:]
+    return doc, "\n".join(doc.lines[: doc.body_start])
 
 
-def extract_blocks(main_lines: list[str]) -> list[tuple[tuple[int, int, int], str, str]]:
-    """Return (date_key, url, block_text) for each top-level link item."""
+def _top_link(tok: Token) -> bool:
+    return tok.kind == LINK and tok.indent == 0
+
+
+def extract_blocks(doc: Document) -> list[tuple[tuple[int, int, int], str, str]]:
+    """Return (date_key, url, block_text) for each top-level link item before the Appendix."""
     blocks: list[tuple[tuple[int, int, int], str, str]] = []
-    i = 0
-    while i < len(main_lines):
-        line = main_lines[i]
-        m = LINK_RE.match(line)
-        if not m:
+    end = doc.appendix_a(doc.body_start)
+    tokens = doc.tokens_before(end)
+    i = doc.body_start
+    while i < end:
+        tok = tokens[i]
+        if not _top_link(tok):
             i += 1
             continue
-        yy, mm, dd, _title, url = m.groups()
-        item_lines = [line]
         k = i + 1
-        while k < len(main_lines):
-            nxt = main_lines[k]
-            if LINK_RE.match(nxt):
-                break
-            if nxt.strip().startswith("###"):
-                break
-            if nxt.strip().startswith("####"):
-                break
-            if APPENDIX_RE.match(nxt.strip()):
-                break
-            item_lines.append(nxt)
+        while k < end and not _top_link(tokens[k]) and not tokens[k].stripped.startswith("###"):
             k += 1
-        blocks.append((_date_key(yy, mm, dd), url, "\n".join(item_lines).rstrip()))
+        blocks.append((_date_key(tok.date), tok.url, "\n".join(doc.lines[i:k]).rstrip()))
         i = k
     return blocks
 
@@ -148,19 +129,25 @@ def rebuild_main_body(blocks: list[tuple[tuple[int, int, int], str, str]]) -> st
     return "\n".join(parts).rstrip() + "\n"
 
 
-def repair_file(filepath: Path, dry_run: bool = False) -> bool:
-    text = filepath.read_text(encoding="utf-8")
-    frontmatter, main_lines, appendix_lines = split_document(text)
-    blocks = dedupe_blocks(extract_blocks(main_lines))
+def repair_text(text: str) -> tuple[str, int]:
+    """Rebuilt document text and the number of link blocks kept."""
+    doc, frontmatter = split_document(text)
+    blocks = dedupe_blocks(extract_blocks(doc))
     new_main = rebuild_main_body(blocks)
-    appendix = "\n".join(appendix_lines).rstrip()
+    appendix = "\n".join(doc.lines[doc.appendix_a(doc.body_start) :]).rstrip()
     new_text = frontmatter + "\n\n" + new_main
     if appendix:
         new_text += "\n" + appendix + "\n"
+    return new_text, len(blocks)
+
+
+def repair_file(filepath: Path, dry_run: bool = False) -> bool:
+    text = filepath.read_text(encoding="utf-8")
+    new_text, block_count = repair_text(text)
     if new_text != text:
         if not dry_run:
             filepath.write_text(new_text, encoding="utf-8")
-        print(f"Repaired: {filepath} ({len(blocks)} blocks)")
+        print(f"Repaired: {filepath} ({block_count} blocks)")
         return True
     print(f"No change: {filepath}")
     return False
@@ -3,49 +3,25 @@
 
 from __future__ import annotations
 
-import re
-
-from editor.parser import APPENDIX_RE, LINK_RE, SKIP_RE
-
-_BLANK_RE = re.compile(r"^\s*$")
-
-
-def _norm(line: str) -> str:
-    return line.rstrip("\r\n")
+from quarterly_doc import tokenize
 
 
 def remove_skip_pairs(content: str) -> str:
-    """Delete link lines immediately followed by ``<!-- skip -->`` (0-1 blank lines allowed).
+    """Delete link lines immediately followed by a column-0 ``<!-- skip -->`` (blank lines allowed).
 
-    Processing stops at ``## Appendix`` (Appendix links are preserved).
+    Blank lines after the marker go too. Processing stops at ``## Appendix``
+    (Appendix links are preserved).
     """
-    lines = content.splitlines(keepends=True)
-    out: list[str] = []
-    i = 0
-    while i < len(lines):
-        raw = lines[i]
-        line = _norm(raw)
-        if APPENDIX_RE.match(line):
-            out.extend(lines[i:])
-            break
-
-        link_match = LINK_RE.match(line)
-        if not link_match:
-            out.append(raw)
-            i += 1
-            continue
-
-        j = i + 1
-        while j < len(lines) and _BLANK_RE.match(_norm(lines[j])):
-            j += 1
-
-        if j < len(lines) and SKIP_RE.match(_norm(lines[j])):
-            i = j + 1
-            while i < len(lines) and _BLANK_RE.match(_norm(lines[i])):
-                i += 1
-            continue
-
-        out.append(raw)
-        i += 1
-
-    return "".join(out)
+    doc = tokenize(content)
+    drops = [(item.line, doc.main_next[item.end]) for item in doc.items if doc.column_state(item) == "skip"]
+    if not drops:
+        return content
+    kept: list[str] = []
+    pos = 0
+    for start, end in drops:
+        kept.extend(doc.lines[pos:start])
+        pos = end
+    kept.extend(doc.lines[pos:])
+    if pos >= len(doc.lines) and kept:
+        kept.append("")  # the last kept line keeps its newline
+    return "\n".join(kept)
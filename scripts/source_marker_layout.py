@@ -2,22 +2,33 @@
 """MkDocs-safe placement for <!-- source --> markers next to admonition summaries."""
 from __future__ import annotations
 
-import re
+from quarterly_doc import BLANK, HEADING, LINK, MARKER, Document, Token, as_document, is_note, tokenize
 
-LINK_RE = re.compile(r"^\s*- \(\d{2}-\d{2}-\d{2}\) \[(.+?)\]\((https?://[^\)]+)\)")
-TOP_LINK_RE = re.compile(r"^- \(\d{2}-\d{2}-\d{2}\) ")
-SECTION_HEADER_RE = re.compile(r"^#{2,4}\s")
-NO_SUMMARY_RE = re.compile(r"^<!-- no_summary -->$")
-APPENDIX_RE = re.compile(r"^## Appendix")
-SOURCE_RE = re.compile(r"^(?P<indent>\s*)<!-- source:\s*(.+?)\s*-->\s*$")
-NOTE_RE = re.compile(r"^\s+[!?]{3} note")
+
+def _unsafe_sources(doc: Document) -> list[tuple[int, int]]:
+    """(link, source marker) lines where a column-0 source marker sits between a link and its note."""
+    pairs: list[tuple[int, int]] = []
+    tokens = doc.tokens
+    for src, tok in doc.of_kind(MARKER):
+        if tok.indent != 0 or not _is_source(tok):
+            continue
+        link = doc.prev_non_blank(src - 1)
+        if link is None or tokens[link].kind != LINK:
+            continue
+        note = doc.next_non_blank(src + 1)
+        if note is not None and is_note(tokens[note]):
+            pairs.append((link, src))
+    return pairs
+
+
+def _is_source(tok: Token) -> bool:
+    return tok.kind == MARKER and tok.name == "source" and tok.stripped.endswith("-->")
 
 
-def _next_non_blank(lines: list[str], start: int) -> int | None:
-    j = start
-    while j < len(lines) and lines[j].strip() == "":
-        j += 1
-    return j if j < len(lines) else None
+def _content_lines(doc: Document) -> list[str]:
+    """Lines without the empty piece after a final newline, CR stripped."""
+    lines = doc.lines[:-1] if doc.lines[-1] == "" else doc.lines
+    return [line[:-1] if line.endswith("\r") else line for line in lines]
 
 
 def fix_mkdocs_source_layout(content: str) -> tuple[str, int]:
@@ -29,68 +40,29 @@ def fix_mkdocs_source_layout(content: str) -> tuple[str, int]:
 
     Returns (new_content, number_of_fixes).
     """
-    lines = content.splitlines(keepends=True)
+    doc = tokenize(content)
+    pairs = _unsafe_sources(doc)
+    lines = doc.lines[:-1] if doc.lines[-1] == "" else doc.lines
     out: list[str] = []
-    fixes = 0
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-        core = line.rstrip("\r\n")
-
-        if LINK_RE.match(core):
-            src_idx = _next_non_blank(lines, i + 1)
-            if src_idx is not None:
-                src_match = SOURCE_RE.match(lines[src_idx].rstrip("\r\n"))
-                if src_match and src_match.group("indent") == "":
-                    note_idx = _next_non_blank(lines, src_idx + 1)
-                    if note_idx is not None and NOTE_RE.match(lines[note_idx].rstrip("\r\n")):
-                        out.append(line if line.endswith("\n") else line + "\n")
-                        if i + 1 < len(lines) and lines[i + 1].strip() == "":
-                            i += 1
-                        out.append("\n")
-                        out.append(f"    <!-- source: {src_match.group(2).strip()} -->\n")
-                        out.append("\n")
-                        fixes += 1
-                        i = src_idx + 1
-                        while i < len(lines) and lines[i].strip() == "":
-                            i += 1
-                        continue
-
-        out.append(line if line.endswith("\n") else line + "\n")
-        i += 1
-
-    return "".join(out), fixes
+    pos = 0
+    for link, src in pairs:
+        out.extend(line + "\n" for line in lines[pos : link + 1])
+        out.extend(["\n", f"    <!-- source: {doc.tokens[src].value} -->\n", "\n"])
+        pos = doc.next_content[src + 1]
+    out.extend(line + "\n" for line in lines[pos:])
+    return "".join(out), len(pairs)
 
 
-def find_unsafe_source_layout(lines: list[str]) -> list[tuple[int, str]]:
+def find_unsafe_source_layout(lines: list[str] | Document) -> list[tuple[int, str]]:
     """Return (1-based line no, message) for MkDocs-unsafe source+note layouts."""
-    issues: list[tuple[int, str]] = []
-    i = 0
-    while i < len(lines):
-        core = lines[i].rstrip("\r\n")
-        if not LINK_RE.match(core):
-            i += 1
-            continue
-        src_idx = _next_non_blank(lines, i + 1)
-        if src_idx is None:
-            i += 1
-            continue
-        src_match = SOURCE_RE.match(lines[src_idx].rstrip("\r\n"))
-        if not src_match or src_match.group("indent") != "":
-            i += 1
-            continue
-        note_idx = _next_non_blank(lines, src_idx + 1)
-        if note_idx is not None and NOTE_RE.match(lines[note_idx].rstrip("\r\n")):
-            issues.append(
-                (
-                    src_idx + 1,
-                    "source 마커가 링크 직후 열 0에 있으면 !!! note가 MkDocs에서 렌더되지 않음 "
-                    "(링크 다음 빈 줄 → 4칸 들여쓰기 source → note)",
-                )
-            )
-        i += 1
-    return issues
+    return [
+        (
+            src + 1,
+            "source 마커가 링크 직후 열 0에 있으면 !!! note가 MkDocs에서 렌더되지 않음 "
+            "(링크 다음 빈 줄 → 4칸 들여쓰기 source → note)",
+        )
+        for _, src in _unsafe_sources(as_document(lines))
+    ]
 
 
 def _trim_trailing_blanks(lines: list[str]) -> list[str]:
@@ -100,40 +72,38 @@ def _trim_trailing_blanks(lines: list[str]) -> list[str]:
     return out
 
 
-def _trim_leading_blanks(lines: list[str]) -> list[str]:
-    out = list(lines)
-    while out and out[0].strip() == "":
-        out.pop(0)
-    return out
+def _trim(tokens: list[Token], start: int, end: int) -> tuple[int, int]:
+    """[start, end) without leading and trailing blank lines."""
+    while start < end and tokens[start].kind == BLANK:
+        start += 1
+    while end > start and tokens[end - 1].kind == BLANK:
+        end -= 1
+    return start, end
 
 
-def _format_link_entry(entry_lines: list[str]) -> list[str]:
-    """Canonical spacing for one top-level curated link block."""
-    if not entry_lines:
-        return []
-    link = entry_lines[0]
-    rest = _trim_leading_blanks(_trim_trailing_blanks(entry_lines[1:]))
+def _format_link_entry(tokens: list[Token], lines: list[str], start: int, end: int) -> list[str]:
+    """Canonical spacing for one top-level curated link block (lines [start, end))."""
+    rest_start, rest_end = _trim(tokens, start + 1, end)
 
     no_summary: str | None = None
-    if rest and NO_SUMMARY_RE.match(rest[0].strip()):
-        no_summary = rest[0]
-        rest = _trim_leading_blanks(rest[1:])
+    if rest_start < rest_end and tokens[rest_start].kind == MARKER and tokens[rest_start].stripped == "<!-- no_summary -->":
+        no_summary = lines[rest_start]
+        rest_start, rest_end = _trim(tokens, rest_start + 1, rest_end)
 
-    note_idx = next((i for i, line in enumerate(rest) if NOTE_RE.match(line.rstrip("\r\n"))), None)
-    source_line = next((line for line in rest if SOURCE_RE.match(line.rstrip("\r\n"))), None)
+    note_idx = next((i for i in range(rest_start, rest_end) if is_note(tokens[i])), None)
+    source_idx = next((i for i in range(rest_start, rest_end) if _is_source(tokens[i])), None)
 
     if note_idx is None:
-        out = [link]
+        out = [lines[start]]
         if no_summary:
             out.append(no_summary)
         return out
 
-    note_block = rest[note_idx:]
-    out = [link, ""]
-    if source_line:
-        out.append(source_line)
+    out = [lines[start], ""]
+    if source_idx is not None:
+        out.append(lines[source_idx])
         out.append("")
-    out.extend(note_block)
+    out.extend(lines[note_idx:rest_end])
     return out
 
 
@@ -147,31 +117,33 @@ def normalize_quarterly_spacing(content: str) -> tuple[str, int]:
     - Single blank between source and admonition; admonition title → body blank preserved
     - Appendix A and nested/indented lists are not modified
     """
-    lines = content.splitlines()
-    appendix_idx = next((i for i, line in enumerate(lines) if APPENDIX_RE.match(line)), len(lines))
-    head, tail = lines[:appendix_idx], lines[appendix_idx:]
+    doc = tokenize(content)
+    lines = _content_lines(doc)
+    appendix_idx = min(doc.appendix, len(lines))
+    tokens = doc.tokens_before(appendix_idx)
+
+    def top_link(i: int) -> bool:
+        return tokens[i].indent == 0 and tokens[i].date is not None
+
+    def section_header(i: int) -> bool:
+        return tokens[i].kind == HEADING and tokens[i].indent == 0 and 2 <= tokens[i].level <= 4
 
     segments: list[tuple[str, list[str]]] = []
     i = 0
-    while i < len(head):
-        if TOP_LINK_RE.match(head[i]):
-            entry = [head[i]]
-            i += 1
+    while i < appendix_idx:
+        start = i
+        i += 1
+        if top_link(start):
             # Stop at next link OR section header — otherwise ###/#### after
             # <!-- no_summary --> is swallowed and dropped by _format_link_entry.
-            while i < len(head) and not TOP_LINK_RE.match(head[i]):
-                if SECTION_HEADER_RE.match(head[i]):
-                    break
-                entry.append(head[i])
+            while i < appendix_idx and not top_link(i) and not section_header(i):
                 i += 1
-            segments.append(("entry", _format_link_entry(entry)))
+            segments.append(("entry", _format_link_entry(tokens, lines, start, i)))
         else:
-            static = [head[i]]
-            i += 1
-            while i < len(head) and not TOP_LINK_RE.match(head[i]):
-                static.append(head[i])
+            while i < appendix_idx and not top_link(i):
                 i += 1
-            segments.append(("static", static))
+            segments.append(("static", lines[start:i]))
+    tail = lines[appendix_idx:]
 
     out: list[str] = []
     fixes = 0
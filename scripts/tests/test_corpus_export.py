@@ -76,3 +76,56 @@ def test_export_writes_jsonl(tmp_path):
     assert "id" in first
     skip_ids = [json.loads(l) for l in lines if "skip" in l]
     assert not skip_ids
+
+
+def test_export_reparses_only_changed_files(tmp_path, monkeypatch):
+    import os
+
+    import export_corpus as ec
+
+    qu = tmp_path / "docs" / "quality-updates" / "2025"
+    qu.mkdir(parents=True)
+    q3 = qu / "2025-07-01_to_2025-09-30.md"
+    q4 = qu / "2025-10-01_to_2025-12-31.md"
+    q3.write_text(SAMPLE_MD.replace("2025-Q4", "2025-Q3").replace("(25-12-", "(25-09-"), encoding="utf-8")
+    q4.write_text(SAMPLE_MD, encoding="utf-8")
+    monkeypatch.setattr(ec, "repo_root", lambda: tmp_path)
+    out = tmp_path / "corpus"
+
+    parsed = []
+    real_parse = ec.parse_corpus_items
+    monkeypatch.setattr(ec, "parse_corpus_items", lambda content, source_doc, **kw: parsed.append(source_doc) or real_parse(content, source_doc, **kw))
+
+    assert ec.export_corpus(output_dir=out)["reparsed"] == 2
+    first = (out / "corpus.jsonl").read_text(encoding="utf-8")
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert all(set(s) >= {"size", "sha256"} and "mtime_ns" not in s for s in manifest["sources"])
+    (out / ec.STAT_CACHE_NAME).unlink()  # a fresh clone: no mtimes, every file hashed, none parsed
+    assert ec.export_corpus(output_dir=out)["reparsed"] == 0
+    assert json.loads((out / "manifest.json").read_text(encoding="utf-8"))["sources"] == manifest["sources"]
+    os.utime(q3, ns=(0, 0))  # touched but unchanged: hashed, not parsed
+    stats = ec.export_corpus(output_dir=out)
+    assert (stats["reparsed"], stats["item_count"], stats["done"]) == (0, 4, 2)
+    assert stats["periods"] == ["2025-Q4", "2025-Q3"]
+    assert (out / "corpus.jsonl").read_text(encoding="utf-8") == first
+
+    q4.write_text(SAMPLE_MD.replace("[제목만]", "[제목 변경]"), encoding="utf-8")
+    parsed.clear()
+    assert ec.export_corpus(output_dir=out)["reparsed"] == 1
+    assert parsed == ["docs/quality-updates/2025/2025-10-01_to_2025-12-31.md"]
+    ec.export_corpus(output_dir=tmp_path / "full", full=True)
+    incremental = (out / "corpus.jsonl").read_text(encoding="utf-8")
+    assert incremental == (tmp_path / "full" / "corpus.jsonl").read_text(encoding="utf-8")
+    assert incremental.index("2025-Q3|") < incremental.index("2025-Q4|")
+    assert "제목 변경" in incremental
+
+    (out / "corpus.jsonl").write_text(first.split("\n", 1)[1], encoding="utf-8")  # out of step with the manifest
+    assert ec.export_corpus(output_dir=out)["reparsed"] == 2
+
+
+def test_parallel_export_matches_serial(tmp_path):
+    serial = export_corpus(output_dir=tmp_path / "serial", full=True)
+    pooled = export_corpus(output_dir=tmp_path / "pooled", full=True, jobs=2)
+    assert pooled == serial
+    for name in ("corpus.jsonl", "aliases.json"):
+        assert (tmp_path / "pooled" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
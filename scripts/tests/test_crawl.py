@@ -64,14 +64,26 @@ def test_skip_if_exists(tmp_path, monkeypatch):
     out.write_text("existing", encoding="utf-8")
 
     monkeypatch.setattr("crawl.repo_root", lambda: tmp_path)
-    monkeypatch.setattr(
-        "crawler.unified.configure_period",
-        lambda s, e: None,
-    )
-    monkeypatch.setattr("crawler.unified.run_collection", lambda: "md")
-    monkeypatch.setattr("crawler.unified.write_markdown", lambda p: p)
+    monkeypatch.setattr("crawler.unified.run_collection", lambda ctx, jobs=1: "md")
+    monkeypatch.setattr("crawler.unified.write_markdown", lambda ctx, p, jobs=1: p)
 
     from crawl import main
 
     assert main(["--year", "2099", "--quarter", "1"]) == 0
     assert out.read_text(encoding="utf-8") == "existing"
+
+
+def test_parse_range_lists_quarters_inclusive():
+    from crawl import parse_range
+
+    periods = parse_range("2025Q4..2026Q2")
+    assert periods == [
+        ("2025-10-01", "2025-12-31"),
+        ("2026-01-01", "2026-03-31"),
+        ("2026-04-01", "2026-06-30"),
+    ]
+    assert len(parse_range("2022Q1..2026Q3")) == 19
+    with pytest.raises(ValueError):
+        parse_range("2026Q3..2022Q1")
+    with pytest.raises(ValueError):
+        parse_range("2026-01..2026-03")
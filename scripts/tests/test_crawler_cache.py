@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import cache, transport
+
+BODY = "<html>목록 페이지</html>".encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    log: list[tuple[str, str]] = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        _Handler.log.append((self.path, self.headers.get("If-None-Match", "")))
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    do_POST = do_GET
+
+
+@pytest.fixture()
+def server():
+    _Handler.log = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _transport(root, **kw):
+    return transport.Transport(min_interval=0, cache=cache.HttpCache(root, **kw))
+
+
+def test_key_depends_on_params_not_their_order():
+    a = cache.cache_key("GET", "http://x/list", {"page": 1, "q": "a"})
+    b = cache.cache_key("get", "http://x/list", {"q": "a", "page": "1"})
+    assert a == b
+    assert a != cache.cache_key("GET", "http://x/list", {"page": 2, "q": "a"})
+    assert a != cache.cache_key("POST", "http://x/list", data={"page": 1, "q": "a"})
+
+
+def test_warm_run_makes_no_requests(server, tmp_path):
+    _transport(tmp_path).get(server + "/list", params={"page": 1})
+    warm = _transport(tmp_path)
+    res = warm.get(server + "/list", params={"page": 1})
+    assert res.text == BODY.decode("utf-8")
+    assert len(_Handler.log) == 1
+    assert warm.stats()["cache_hits"] == 1
+    assert warm.stats()["requests"] == 0
+    assert list(tmp_path.rglob("*.z"))
+
+
+def test_stale_entry_is_revalidated_with_etag(server, tmp_path):
+    _transport(tmp_path, ttl=0).get(server + "/etag")
+    t = _transport(tmp_path, ttl=0)
+    res = t.get(server + "/etag")
+    assert res.status_code == 200
+    assert res.text == BODY.decode("utf-8")
+    assert _Handler.log[-1] == ("/etag", '"v1"')
+    assert t.stats()["cache_revalidated"] == 1
+
+
+def test_refresh_mode_goes_to_network(server, tmp_path):
+    _transport(tmp_path).post(server + "/list", data={"page": 1})
+    _transport(tmp_path, mode="refresh").post(server + "/list", data={"page": 1})
+    assert len(_Handler.log) == 2
+
+
+def test_offline_mode_serves_hits_and_raises_on_miss(server, tmp_path):
+    _transport(tmp_path).get(server + "/list")
+    offline = _transport(tmp_path, mode="offline", ttl=0)
+    assert offline.get(server + "/list").status_code == 200
+    with pytest.raises(cache.CacheMiss):
+        offline.get(server + "/other")
+    assert len(_Handler.log) == 1
+
+
+def test_invalid_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        cache.HttpCache(tmp_path, mode="sometimes")
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import checkpoint, engine, pagesize, unified  # noqa: E402
+from crawler.checkpoint import Checkpoints  # noqa: E402
+from crawler.pagesize import Negotiator, PageSize  # noqa: E402
+
+PERIOD = ("2026-01-01", "2026-03-31")
+
+
+class FlakyBoard:
+    """Eight list pages of KICPA-shaped rows; raises once at ``fail_at``."""
+
+    def __init__(self, fail_at: int | None = None):
+        self.fail_at = fail_at
+        self.fetched: list[int] = []
+
+    def fetch_page(self, page: int) -> int:
+        if page == self.fail_at:
+            self.fail_at = None
+            raise TimeoutError(f"page {page}")
+        self.fetched.append(page)
+        return page
+
+    @staticmethod
+    def parse(page: int):
+        if page > 6:
+            return []
+        return [{"date": datetime(2026, 3, 7 - page), "title": f"t{page}", "link": f"https://x/?bltnNo={page}"}]
+
+    def crawl(self, start, end):
+        pages = engine.crawl_pages(self.fetch_page, self.parse, until=lambda page, items: not items)
+        return [item for _, items in pages for item in items]
+
+
+def test_rows_round_trip_through_json():
+    rows = [("26-01-02", "t", "u"), {"date": datetime(2026, 1, 2), "title": "t"}, "- line", None]
+    assert checkpoint.decode(checkpoint.encode(rows)) == rows
+
+
+def test_interrupted_board_resumes_from_its_last_saved_page(tmp_path):
+    board = FlakyBoard(fail_at=4)
+    with checkpoint.active(Checkpoints(tmp_path).board("한국공인회계사회/공지", PERIOD)):
+        with pytest.raises(TimeoutError):
+            board.crawl(*PERIOD)
+    assert Checkpoints(tmp_path).board("한국공인회계사회/공지", PERIOD).pages == [1, 2, 3]
+
+    board.fetched.clear()
+    cp = Checkpoints(tmp_path).board("한국공인회계사회/공지", PERIOD)
+    with checkpoint.active(cp):
+        items = board.crawl(*PERIOD)
+    assert min(board.fetched) == 4
+    assert items == FlakyBoard().crawl(*PERIOD)
+    assert items[0]["date"] == datetime(2026, 3, 6)
+
+
+def test_saved_pages_are_dropped_when_the_page_size_changes(tmp_path):
+    board = FlakyBoard(fail_at=4)
+    label = "한국공인회계사회/공지"
+
+    def crawl_sized(negotiator):
+        with pagesize.using(negotiator):
+            pagesize.params("kicpa:noti", PageSize(10, ("pageUnit",)), lambda fields: (fields["pageUnit"], 500))
+            return board.crawl(*PERIOD)
+
+    with checkpoint.active(Checkpoints(tmp_path).board(label, PERIOD)):
+        with pytest.raises(TimeoutError):
+            crawl_sized(Negotiator())
+    cp = Checkpoints(tmp_path).board(label, PERIOD)
+    assert (cp.pages, cp.page_size) == ([1, 2, 3], {"pageUnit": 100})
+
+    # The resume runs without a negotiator (default rows): pages 1-3 are refetched.
+    board.fetched.clear()
+    with checkpoint.active(cp):
+        items = crawl_sized(None)
+    assert min(board.fetched) == 1
+    assert items == FlakyBoard().crawl(*PERIOD)
+    assert Checkpoints(tmp_path).board(label, PERIOD).page_size == {}
+
+
+def test_resume_skips_done_boards_and_ignores_other_periods(tmp_path):
+    calls = {"fss": 0, "kasb": 0}
+    broken = {"kasb": True}
+
+    def fss(start, end):
+        calls["fss"] += 1
+        return [{"date": "26-01-05", "title": "a", "link": "http://a"}]
+
+    def kasb(start, end):
+        calls["kasb"] += 1
+        if broken["kasb"]:
+            raise TimeoutError("kasb")
+        return [("26-02-10", "k", "http://k")]
+
+    specs = [
+        unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", fss, unified.render_rows),
+        unified.BoardSpec("한국회계기준원", "공지사항", "공지사항", "kasb", kasb, unified.render_rows),
+    ]
+    checkpoints = Checkpoints(tmp_path)
+    ctx = unified.CrawlContext(*PERIOD, checkpoints=checkpoints)
+    with pytest.raises(TimeoutError):
+        unified.fetch_boards(ctx, specs)
+    assert checkpoints.completed() == ["금융감독원/보도자료"]
+
+    broken["kasb"] = False
+    results = unified.fetch_boards(ctx, specs)
+    assert calls == {"fss": 1, "kasb": 2}
+    assert results[1] == [("26-02-10", "k", "http://k")]
+
+    unified.fetch_boards(ctx, specs, periods=[("2026-02-01", "2026-03-31")] * 2)
+    assert calls == {"fss": 2, "kasb": 3}
+
+
+def test_periods_sharing_checkpoints_keep_separate_board_files(tmp_path):
+    calls = []
+
+    def fss(start, end):
+        calls.append(start)
+        return [{"date": start[2:], "title": start, "link": f"http://a/?nttId={start}"}]
+
+    specs = [unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", fss, unified.render_rows)]
+    ctx = unified.CrawlContext(*PERIOD, checkpoints=Checkpoints(tmp_path))
+    q2 = ctx.for_period("2026-04-01", "2026-06-30")
+    first = unified.fetch_boards(ctx, specs) + unified.fetch_boards(q2, specs)
+
+    # Both periods resume from their own file.
+    assert unified.fetch_boards(ctx, specs) + unified.fetch_boards(q2, specs) == first
+    assert calls == ["2026-01-01", "2026-04-01"]
+    assert Checkpoints(tmp_path).completed() == ["금융감독원/보도자료"] * 2
+
+
+def test_crawl_resume_flag_keeps_then_clears_checkpoints(tmp_path, monkeypatch):
+    from crawl import checkpoint_dir, main
+
+    monkeypatch.setattr("crawl.repo_root", lambda: tmp_path)
+    calls = {"n": 0}
+
+    def flaky(start, end):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise TimeoutError("kasb")
+        return [("99-02-10", "k", "http://k/?seq=1")]
+
+    def steady(start, end):
+        return [("99-01-10", "s", "http://s/?seq=2")]
+
+    monkeypatch.setattr(
+        unified,
+        "board_specs",
+        lambda: [
+            unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", steady, unified.render_rows),
+            unified.BoardSpec("한국회계기준원", "공지사항", "공지사항", "kasb", flaky, unified.render_rows),
+        ],
+    )
+    argv = ["--start", "2099-01-01", "--end", "2099-03-31", "--cache-mode", "off", "--jobs", "1"]
+    root = checkpoint_dir("2099-01-01", "2099-03-31")
+
+    assert main(argv) == 1
+    assert Checkpoints(root).completed() == ["금융감독원/보도자료"]
+
+    assert main(argv + ["--resume"]) == 0
+    assert not root.exists()
+    out = tmp_path / "docs/quality-updates/2099/2099-01-01_to_2099-03-31.md"
+    assert "[k](http://k/?seq=1)" in out.read_text(encoding="utf-8")
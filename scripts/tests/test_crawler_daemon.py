@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import unified  # noqa: E402
+from crawler.daemon import AFTER_CREATE, Daemon  # noqa: E402
+
+PERIOD = ("2026-10-01", "2026-12-31")
+
+
+class Board:
+    """KASB-shaped board whose rows can grow between polls."""
+
+    def __init__(self, name, host, delay=0.0):
+        self.rows = [("26-10-02", f"{name} 첫 공지", f"https://{host}/view.do?seq=1")]
+        self.delay = delay
+        self.running = 0
+        self.overlap = False
+        self.calls = 0
+        self.spec = unified.BoardSpec("한국회계기준원", name, name, host, self.fetch, unified.render_rows)
+
+    def fetch(self, start, end):
+        self.running += 1
+        self.overlap |= self.running > 1
+        self.calls += 1
+        time.sleep(self.delay)
+        self.running -= 1
+        return list(reversed(self.rows))
+
+
+def make_daemon(tmp_path, boards, **kwargs):
+    return Daemon(
+        [b.spec for b in boards],
+        period=lambda: PERIOD,
+        output_path=lambda s, e: tmp_path / f"{s}_to_{e}.md",
+        watermark_path=lambda s, e: tmp_path / "marks.json",
+        feed_path=tmp_path / "feed.jsonl",
+        **kwargs,
+    )
+
+
+def test_poll_creates_quarter_then_merges_only_new_items(tmp_path, monkeypatch):
+    notice, press = Board("공지사항", "a.kasb.or.kr"), Board("보도자료", "b.kasb.or.kr")
+    monkeypatch.setattr(unified, "board_specs", lambda: [notice.spec, press.spec])
+    daemon = make_daemon(tmp_path, [notice, press])
+    out = tmp_path / "2026-10-01_to_2026-12-31.md"
+
+    assert daemon.poll(notice.spec) == 0  # new quarter: full crawl
+    assert "공지사항 첫 공지" in out.read_text(encoding="utf-8")
+
+    notice.rows.append(("26-10-20", "새 공지", "https://a.kasb.or.kr/view.do?seq=2"))
+    assert daemon.poll(notice.spec) == 1
+    assert daemon.poll(notice.spec) == 0
+    assert daemon.poll(press.spec) == 0
+
+    text = out.read_text(encoding="utf-8")
+    assert text.count("[새 공지](https://a.kasb.or.kr/view.do?seq=2)") == 2  # body + Appendix
+    feed = [json.loads(line) for line in (tmp_path / "feed.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [(c["board"], c["title"], c["file"]) for c in feed] == [
+        ("한국회계기준원/공지사항", "새 공지", out.name)
+    ]
+    assert json.loads((tmp_path / "marks.json").read_text(encoding="utf-8"))["한국회계기준원/공지사항"]["id"] == "2"
+
+
+def test_new_quarter_crawl_does_not_block_other_polls(tmp_path, monkeypatch):
+    notice, press = Board("공지사항", "a.kasb.or.kr"), Board("보도자료", "b.kasb.or.kr")
+    started, release = threading.Event(), threading.Event()
+    fetch = notice.fetch
+
+    def slow_fetch(start, end):
+        started.set()
+        release.wait(5)
+        return fetch(start, end)
+
+    slow_spec = unified.BoardSpec("한국회계기준원", "공지사항", "공지사항", "a.kasb.or.kr", slow_fetch, unified.render_rows)
+    monkeypatch.setattr(unified, "board_specs", lambda: [slow_spec, press.spec])
+    other = Board("주요일정", "c.kasb.or.kr")
+    daemon = make_daemon(tmp_path, [notice, press, other], interval=3600)
+    creator = threading.Thread(target=daemon._poll_safely, args=(notice.spec,))
+    creator.start()
+    assert started.wait(5)
+
+    # While the full crawl runs, other polls return at once and the merge lock is free.
+    t0 = time.monotonic()
+    daemon._poll_safely(press.spec)
+    assert time.monotonic() - t0 < 1
+    assert daemon._merge.acquire(timeout=1)
+    daemon._merge.release()
+    # A poll still in flight when the file lands is rescheduled as it ends.
+    daemon._in_flight.add(other.spec.key)
+    assert daemon.poll(other.spec) == 0
+
+    release.set()
+    creator.join(timeout=5)
+    assert "공지사항 첫 공지" in (tmp_path / "2026-10-01_to_2026-12-31.md").read_text(encoding="utf-8")
+    assert press.calls == 1  # only the full crawl fetched it
+    daemon._poll_safely(other.spec)
+
+    # Turned-away boards are polled again shortly, not a full interval later.
+    left = {key: at - time.monotonic() for key, at in daemon._next_at.items()}
+    assert left[press.spec.key] <= AFTER_CREATE and left[other.spec.key] <= AFTER_CREATE
+    assert left[notice.spec.key] > 3000
+
+
+def test_run_never_overlaps_a_board_and_stops_cleanly(tmp_path, monkeypatch):
+    slow, fast = Board("공지사항", "a.kasb.or.kr", delay=0.05), Board("보도자료", "b.kasb.or.kr")
+    monkeypatch.setattr(unified, "board_specs", lambda: [slow.spec, fast.spec])
+    changed = []
+    daemon = make_daemon(
+        tmp_path, [slow, fast], interval=0.001, workers=4, refresh_every=0, on_change=changed.extend
+    )
+    runner = threading.Thread(target=daemon.run)
+    runner.start()
+    time.sleep(0.4)
+    slow.rows.append(("26-10-21", "늦은 공지", "https://a.kasb.or.kr/view.do?seq=3"))
+    time.sleep(0.3)
+    daemon.stop()
+    runner.join(timeout=5)
+
+    assert not runner.is_alive()
+    assert fast.calls > slow.calls > 2
+    assert not slow.overlap and not fast.overlap
+    assert daemon.failures == 0 and daemon.new_items == 1
+    assert tmp_path / "2026-10-01_to_2026-12-31.md" in changed
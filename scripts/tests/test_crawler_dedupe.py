@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import dedupe, unified  # noqa: E402
+from crawler.dedupe import Item  # noqa: E402
+
+FSS_URL = "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=132001&menuNo=200218"
+FSC_URL = "https://www.fsc.go.kr/no010101/81298"
+
+
+def test_normalize_drops_tags_punctuation_and_width():
+    assert dedupe.normalize_title("[보도자료] ｢외부감사법｣ 시행령 개정!") == dedupe.normalize_title("외부감사법 시행령 개정")
+    assert dedupe.jaccard("[보도참고] 가상자산 회계·공시 규율이 강화됩니다.", "가상자산 회계 공시 규율이 강화됩니다") == 1.0
+
+
+def test_mirrors_match_across_boards_but_not_recurring_titles():
+    title = "사업보고서 및 감사보고서에 대한 조사·감리결과 조치"
+    items = [
+        Item("금융감독원/보도자료", "26-02-05", title, FSS_URL),
+        Item("금융위원회/보도자료", "26-02-03", f"[증선위]{title}", FSC_URL),
+        Item("금융위원회/보도자료", "26-03-09", f"[증선위]{title}", "https://www.fsc.go.kr/no010101/81400"),
+        Item("금융감독원/보도자료", "26-02-06", "회계현안 설명회 개최", "https://www.fss.or.kr/x?nttId=2"),
+        Item("금융감독원/보도자료", "26-02-07", title, "https://www.fss.or.kr/y?nttId=3"),
+    ]
+    # The FSS copy repeats the earlier FSC one; the March notice is a new one, and
+    # the second FSS post is not a mirror: the FSC notice already pairs with the
+    # nearer FSS copy.
+    assert dedupe.find_duplicates(items) == {0: 1}
+
+
+def test_same_day_twin_beats_previous_meeting_notice():
+    # 2026 Q1 as published: FSS lists its copy before the FSC one, and every
+    # meeting repeats the same title.
+    fss, fsc = "금융감독원/보도자료", "금융위원회/보도자료"
+    rows = [
+        (fss, "26-01-08", "감사보고서 등에 대한 조사감리결과 조치 - 제1차 증권선물위원회(26.1.7.) 조치 의결 -"),
+        (fss, "26-01-22", "사업보고서 등에 대한 조사,감리결과 조치"),
+        (fss, "26-01-28", "사업보고서 등에 대한 조사,감리결과 조치"),
+        (fss, "26-02-25", "사업보고서 등에 대한 조사,감리결과 조치"),
+        (fss, "26-03-11", "사업보고서 등에 대한 조사,감리결과 조치"),
+        (fsc, "26-01-08", "감사보고서 등에 대한 조사·감리결과 조치"),
+        (fsc, "26-01-22", "사업보고서 등에 대한 조사·감리결과 조치"),
+        (fsc, "26-01-28", "사업보고서 등에 대한 조사·감리결과 조치"),
+        (fsc, "26-02-25", "사업보고서 등에 대한 조사·감리결과 조치"),
+        (fsc, "26-03-11", "사업보고서 등에 대한 조사·감리결과 조치  - 제5차 증권선물위원회(’26.3.11.) 조치 의결"),
+    ]
+    items = [Item(board, d, title, f"https://example.com/{n}") for n, (board, d, title) in enumerate(rows)]
+    # Each FSC notice mirrors the FSS one of the same day; no FSS notice points
+    # at an earlier meeting's FSC notice.
+    assert dedupe.find_duplicates(items) == {6: 1, 7: 2, 8: 3}
+
+
+def test_annotate_only_marks_given_lines():
+    title = "가상자산 회계·공시 규율이 강화됩니다."
+    new_url = "https://www.kicpa.or.kr/board/read.brd?boardId=noti&bltnNo=1176"
+    text = "\n".join([
+        "### 금융감독원", "", "#### 보도자료", "",
+        f"- (26-12-22) [{title}]({FSS_URL})", "",
+        "### 금융위원회", "", "#### 보도자료", "",
+        f"- (26-12-22) [{title}]({FSC_URL})", "",
+        "### 한국공인회계사회", "", "#### 알림마당 - 공지사항", "",
+        f"- (26-12-23) [{title}]({new_url})",
+    ])
+    assert dedupe.annotate(text)[1] == 2
+    marked, count = dedupe.annotate(text, only={new_url})
+    assert count == 1
+    assert f"[{title}]({FSC_URL})\n" in marked  # reviewed line left alone
+    assert f"[{title}]({new_url}) <!-- duplicate: {FSS_URL} -->" in marked
+
+
+def test_render_document_marks_duplicates_in_body_only():
+    title = "가상자산 회계·공시 규율이 강화됩니다."
+    specs = [
+        unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", None, unified.render_rows),
+        unified.BoardSpec("금융위원회", "보도자료", "보도자료", "fsc", None, unified.render_rows),
+    ]
+    results = [
+        [{"date": "26-12-22", "title": title, "link": FSS_URL}],
+        [f"- (26-12-21) [[보도참고] {title}]({FSC_URL})"],
+    ]
+    doc = unified.render_document(unified.CrawlContext("2026-10-01", "2026-12-31"), specs, results)
+    body, appendix = doc.split("## Appendix")
+    assert f"- (26-12-22) [{title}]({FSS_URL}) <!-- duplicate: {FSC_URL} -->" in body.splitlines()
+    assert "duplicate" not in appendix
+
+    again, marked = dedupe.annotate(doc)
+    assert (again, marked) == (doc, 0)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import FSC, FSS, engine
+
+
+def test_pages_come_back_in_order_despite_jitter():
+    rng = random.Random(7)
+    delays = {p: rng.uniform(0, 0.02) for p in range(1, 21)}
+
+    def fetch(page):
+        time.sleep(delays[page])
+        return page
+
+    pages = engine.crawl_pages(fetch, lambda raw: raw * 10, range(1, 21), prefetch=4)
+    assert pages == [(p, p * 10) for p in range(1, 21)]
+
+
+def test_fetches_overlap_with_parsing():
+    def fetch(page):
+        time.sleep(0.05)
+        return page
+
+    def parse(raw):
+        time.sleep(0.05)
+        return raw
+
+    t0 = time.perf_counter()
+    engine.crawl_pages(fetch, parse, range(1, 9), prefetch=3)
+    pipelined = time.perf_counter() - t0
+    assert pipelined < 8 * 0.1 * 0.6
+
+
+def test_parse_runs_off_the_event_loop_thread():
+    main = threading.get_ident()
+    seen = []
+    engine.crawl_pages(lambda p: p, lambda raw: seen.append(threading.get_ident()), range(1, 3))
+    assert seen and main not in seen
+
+
+def test_until_stops_and_ignores_speculative_errors():
+    def fetch(page):
+        if page > 3:
+            raise RuntimeError("past the end")
+        return page
+
+    pages = engine.crawl_pages(fetch, lambda raw: raw, until=lambda page, parsed: parsed == 3)
+    assert [p for p, _ in pages] == [1, 2, 3]
+
+
+def test_error_on_consumed_page_is_raised():
+    def fetch(page):
+        if page == 2:
+            raise ValueError("boom")
+        return page
+
+    with pytest.raises(ValueError, match="boom"):
+        engine.crawl_pages(fetch, lambda raw: raw, range(1, 5))
+
+
+def test_sequential_when_prefetch_zero():
+    calls = []
+
+    def fetch(page):
+        calls.append(page)
+        return [] if page == 2 else [page]
+
+    engine.crawl_pages(fetch, lambda raw: raw, until=lambda page, items: not items, prefetch=0)
+    assert calls == [1, 2]
+
+
+FSC_PAGE = """
+<ul>
+<li><div class="inner"><div class="subject"><a href="/no010101/1">첫째</a></div><div class="day">2026-03-02</div></div></li>
+<li><div class="inner"><div class="subject"><a href="/no010101/2">둘째</a></div><div class="day">2026-02-01</div></div></li>
+</ul>
+"""
+
+
+def test_fsc_crawl_board_stops_at_empty_page():
+    def fake_fetch(url, page, *period):
+        return FSC_PAGE if page <= 2 else "<ul></ul>"
+
+    with patch("crawler.FSC.fetch_page", side_effect=fake_fetch):
+        items = FSC.crawl_board("보도자료", FSC.BASE_URLS["보도자료"])
+
+    assert len(items) == 4
+    assert items[0] == "- (26-03-02) [첫째](https://fsc.go.kr/no010101/1)"
+
+
+FSS_PAGE = """
+<div class="bd-list"><table><tbody>
+<tr><td>1</td><td class="title"><a href="view.do?nttId=2">새 글</a></td><td>x</td><td>2026-02-01</td></tr>
+<tr><td>2</td><td class="title"><a href="view.do?nttId=1">지난 글</a></td><td>x</td><td>2025-12-30</td></tr>
+</tbody></table></div>
+"""
+
+
+def test_fss_press_release_stops_before_start():
+    with patch("crawler.FSS.fetch_list_page", return_value=FSS_PAGE):
+        items = FSS.fetch_press_release(max_page=5, start="2026-01-01", end="2026-03-31")
+    assert [i["title"] for i in items] == ["새 글"]
+    assert items[0]["link"] == "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=2"
+
+
+def test_fss_page_cap_scales_with_the_window_and_fails_when_reached():
+    assert FSS.max_pages("2026-01-01", "2026-03-31") == 50
+    assert FSS.max_pages("2025-01-01", "2026-03-31") == 250
+
+    newer = FSS_PAGE.replace("2025-12-30", "2026-01-30")
+    with patch("crawler.FSS.fetch_list_page", return_value=newer):
+        assert len(FSS.fetch_press_release(max_page=3, start="2026-01-01", end="2026-03-31")) == 6
+        with pytest.raises(FSS.PageCapReached):
+            FSS.fetch_press_release(max_page=3, start="2025-07-01", end="2026-03-31")
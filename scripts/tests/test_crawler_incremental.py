@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import incremental, unified
+
+NTT = "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId={}&menuNo=200218"
+SEQ = "https://www.kasb.or.kr/front/board/calView.do?seq={}"
+
+
+def _specs(fss_rows, kasb_rows, calls):
+    def fss(start, end):
+        calls.append(("fss", start, end))
+        return [{"date": d, "title": t, "link": NTT.format(n)} for d, t, n in fss_rows]
+
+    def kasb(start, end):
+        calls.append(("kasb", start, end))
+        return [(d, t, SEQ.format(n)) for d, t, n in kasb_rows]
+
+    return [
+        unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", fss, unified.render_rows),
+        unified.BoardSpec(
+            "한국회계기준원", "주요일정", "주요일정", "kasb", kasb, unified.md_lines,
+            newest_first=False, narrow_by_date=False,
+        ),
+    ]
+
+
+CTX = ("2026-01-01", "2026-03-31")
+
+
+def _first_run(monkeypatch, tmp_path):
+    calls = []
+    fss_rows = [("26-01-20", "둘째", 102), ("26-01-05", "첫째", 101)]
+    kasb_rows = [("26-01-10", "위원회", 900)]
+    monkeypatch.setattr(unified, "board_specs", lambda: _specs(fss_rows, kasb_rows, calls))
+    monkeypatch.setattr(unified, "AGENCIES", ("금융감독원", "한국회계기준원"))
+    ctx = unified.CrawlContext(*CTX)
+    path = unified.write_markdown(ctx, tmp_path / "q.md")
+    return path, ctx
+
+
+def test_item_ids_cover_all_agencies():
+    assert incremental.item_id(NTT.format(216842)) == "216842"
+    assert incremental.item_id("https://fsc.go.kr/no010101/86611?curPage=18") == "86611"
+    assert incremental.item_id("https://www.kicpa.or.kr/board/read.brd?boardId=noti&bltnNo=1176") == "1176"
+    assert incremental.item_id("https://www.fss.or.kr/x/view.do?lrgSlno=4105&menuNo=1") == "4105"
+    assert incremental.item_id("https://example.com/a") is None
+
+
+def test_item_keys_are_scoped_to_the_board():
+    fss_rule = "https://www.fss.or.kr/fss/job/lrgRegItnPrvntc/view.do?lrgSlno=1860&menuNo=1"
+    kasb = "https://www.kasb.or.kr/front/board/commNView.do?seq=1860"
+    assert incremental.item_key(fss_rule) != incremental.item_key(kasb)
+    assert incremental.item_key(NTT.format(5)) == incremental.item_key(
+        "https://fss.or.kr/fss/bbs/B0000188/view.do?menuNo=1&nttId=5&pageIndex=2"
+    )
+    assert incremental.item_key("https://fsc.go.kr/no010101/86611?curPage=18") == "fsc.go.kr/no010101/86611"
+
+
+def test_board_period_starts_at_watermark_date():
+    mark = incremental.Watermark("102", "26-01-20")
+    assert incremental.board_period(mark, "2026-01-01", "2026-03-31", True) == ("2026-01-20", "2026-03-31")
+    assert incremental.board_period(mark, "2026-01-01", "2026-03-31", False) == ("2026-01-01", "2026-03-31")
+    assert incremental.board_period(None, "2026-01-01", "2026-03-31", True) == ("2026-01-01", "2026-03-31")
+
+
+def test_watermarks_derived_from_appendix(monkeypatch, tmp_path):
+    path, ctx = _first_run(monkeypatch, tmp_path)
+    marks = incremental.derive_watermarks(path.read_text(encoding="utf-8"))
+    assert marks[("금융감독원", "보도자료")] == incremental.Watermark("102", "26-01-20")
+    assert unified.current_watermarks(ctx)["금융감독원/보도자료"] == incremental.Watermark("102", "26-01-20")
+
+
+def test_incremental_merge_keeps_curation(monkeypatch, tmp_path):
+    path, _ = _first_run(monkeypatch, tmp_path)
+    text = path.read_text(encoding="utf-8")
+    curated = text.replace(
+        f"[둘째]({NTT.format(102)})",
+        f"[둘째]({NTT.format(102)})\n\n    <!-- source: clip|clip_1 -->\n\n    !!! note \"주요 내용\"\n\n        - (개요) 요약",
+        1,
+    )
+    path.write_text(curated, encoding="utf-8")
+
+    calls = []
+    fss_rows = [("26-02-03", "넷째", 104), ("26-01-28", "셋째", 103), ("26-01-20", "둘째", 102)]
+    kasb_rows = [("26-01-10", "위원회", 900), ("26-03-02", "세미나", 901)]
+    monkeypatch.setattr(unified, "board_specs", lambda: _specs(fss_rows, kasb_rows, calls))
+
+    added, marks = unified.run_incremental(unified.CrawlContext(*CTX), path)
+
+    assert added == {"금융감독원/보도자료": 2, "한국회계기준원/주요일정": 1}
+    assert ("fss", "2026-01-20", "2026-03-31") in calls
+    assert ("kasb", "2026-01-01", "2026-03-31") in calls
+    assert marks["금융감독원/보도자료"].id == "104"
+
+    merged = path.read_text(encoding="utf-8")
+    body, appendix = merged.split("## Appendix", 1)
+    assert "!!! note \"주요 내용\"\n\n        - (개요) 요약\n\n- (26-01-28) [셋째]" in body
+    assert body.index("[셋째]") < body.index("[넷째]") < body.index("### 한국회계기준원")
+    assert appendix.index("[넷째]") < appendix.index("[셋째]") < appendix.index("[둘째]")
+    assert appendix.index("[위원회]") < appendix.index("[세미나]")
+    assert f"        - (26-02-03) [넷째]({NTT.format(104)})" in appendix
+
+    again, _ = unified.run_incremental(unified.CrawlContext(*CTX), path, marks=marks)
+    assert sum(again.values()) == 0
+    assert path.read_text(encoding="utf-8") == merged
+
+
+def test_missing_subsection_is_created(monkeypatch, tmp_path):
+    path, _ = _first_run(monkeypatch, tmp_path)
+    text = path.read_text(encoding="utf-8").replace("#### 주요일정\n", "")
+    text = text.replace(f"- (26-01-10) [위원회]({SEQ.format(900)})\n", "", 1)
+    path.write_text(text, encoding="utf-8")
+
+    merged = incremental.merge_items(
+        text,
+        agency="한국회계기준원",
+        heading="주요일정",
+        section="주요일정",
+        body_lines=[f"- (26-03-02) [세미나]({SEQ.format(901)})"],
+        appendix_lines=[],
+    )
+    body = merged.split("## Appendix", 1)[0]
+    assert f"#### 주요일정\n\n- (26-03-02) [세미나]({SEQ.format(901)})" in body
+
+
+def test_same_post_id_on_another_board_is_still_merged(monkeypatch, tmp_path):
+    path, ctx = _first_run(monkeypatch, tmp_path)
+    fss_rows = [("26-02-03", "넷째", 901), ("26-01-20", "둘째", 102)]
+    kasb_rows = [("26-01-10", "위원회", 900), ("26-03-02", "세미나", 901)]
+    monkeypatch.setattr(unified, "board_specs", lambda: _specs(fss_rows, kasb_rows, []))
+
+    added, _ = unified.run_incremental(ctx, path)
+
+    assert added == {"금융감독원/보도자료": 1, "한국회계기준원/주요일정": 1}
+    merged = path.read_text(encoding="utf-8")
+    assert f"[넷째]({NTT.format(901)})" in merged and f"[세미나]({SEQ.format(901)})" in merged
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import incremental, unified  # noqa: E402
+from crawler.itemstore import ItemStore, RawItem  # noqa: E402
+
+CTX = ("2026-01-01", "2026-03-31")
+FSS = "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId={}&menuNo=200218"
+FSC = "https://www.fsc.go.kr/no010101/{}"
+KICPA = "https://www.kicpa.or.kr/board/read.brd?boardId=noti&bltnNo={}"
+KASB = "https://www.kasb.or.kr/front/board/comm010View.do?seq={}"
+
+
+def _specs(boards):
+    """One board per agency, each returning its adapter's own item shape."""
+
+    def board(name):
+        def fetch(start, end):
+            if boards is None:
+                raise AssertionError("fetched")
+            return list(boards[name])
+
+        return fetch
+
+    return [
+        unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", board("fss"), unified.render_rows, source="https://fss/list"),
+        unified.BoardSpec("금융위원회", "보도자료", "보도자료", "fsc", board("fsc"), unified.render_rows),
+        unified.BoardSpec("한국공인회계사회", "공지사항", "공지사항", "kicpa", board("kicpa"), unified.render_rows),
+        unified.BoardSpec(
+            "한국회계기준원", "주요일정", "주요일정", "kasb", board("kasb"), unified.md_lines, newest_first=False
+        ),
+    ]
+
+
+BOARDS = {
+    "fss": [{"date": "26-02-01", "title": "둘째", "link": FSS.format(2)}, {"date": "26-01-03", "title": "첫째", "link": FSS.format(1)}],
+    "fsc": [f"- (26-03-02) [[보도] 회계 개선]({FSC.format(7)})", f"- (26-01-09) [보도 참고]({FSC.format(6)})"],
+    "kicpa": [{"title": "연수 안내", "link": KICPA.format(5), "date": datetime(2026, 2, 3)}],
+    "kasb": [("26-03-20", "위원회", KASB.format(9)), ("26-01-15", "세미나", KASB.format(8))],
+}
+
+
+def test_crawl_stores_normalized_items_and_store_renders_same_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(unified, "board_specs", lambda: _specs(BOARDS))
+    store = ItemStore(tmp_path / "items")
+    path = unified.write_markdown(unified.CrawlContext(*CTX, items=store), tmp_path / "q.md")
+
+    fss = store.read(*CTX, "금융감독원/보도자료")
+    assert [(i.date, i.title, i.url, i.source) for i in fss] == [
+        ("2026-02-01", "둘째", FSS.format(2), "https://fss/list"),
+        ("2026-01-03", "첫째", FSS.format(1), "https://fss/list"),
+    ]
+    assert all(i.fetched_at for i in fss)
+    line = store.path(*CTX, "금융위원회/보도자료").read_text(encoding="utf-8").splitlines()[0]
+    assert json.loads(line)["title"] == "[보도] 회계 개선"
+    assert store.read(*CTX, "한국공인회계사회/공지사항")[0].date == "2026-02-03"
+
+    monkeypatch.setattr(unified, "board_specs", lambda: _specs(None))  # any fetch fails the test
+    ctx = unified.CrawlContext(*CTX, items=store)
+    assert unified.render_from_store(ctx) == path.read_text(encoding="utf-8")
+    assert ctx.appendix["한국회계기준원"]["주요일정"][0] == ("26-03-20", "위원회", KASB.format(9))
+
+    store.path(*CTX, "금융위원회/보도자료").unlink()
+    with pytest.raises(FileNotFoundError, match="금융위원회/보도자료"):
+        unified.render_from_store(unified.CrawlContext(*CTX, items=store))
+
+
+def test_incremental_seeds_older_files_from_appendix_then_appends(monkeypatch, tmp_path):
+    boards = {name: list(rows) for name, rows in BOARDS.items()}
+    monkeypatch.setattr(unified, "board_specs", lambda: _specs(boards))
+    path = unified.write_markdown(unified.CrawlContext(*CTX), tmp_path / "q.md")  # no store yet
+
+    boards["fss"].insert(0, {"date": "26-03-05", "title": "셋째", "link": FSS.format(3)})
+    store = ItemStore(tmp_path / "items")
+    added, _ = unified.run_incremental(unified.CrawlContext(*CTX, items=store), path)
+    assert added["금융감독원/보도자료"] == 1
+
+    fss = store.read(*CTX, "금융감독원/보도자료")
+    assert [i.title for i in fss] == ["셋째", "둘째", "첫째"]
+    assert (fss[0].fetched_at is not None, fss[1].fetched_at) == (True, None)
+    assert RawItem.from_row("b", ("26-01-09", "t", "u")).row() == ("26-01-09", "t", "u")
+
+    rendered = unified.render_from_store(unified.CrawlContext(*CTX, items=store))
+    assert incremental.appendix_rows(rendered) == incremental.appendix_rows(path.read_text(encoding="utf-8"))
+    assert "- (26-03-05) [셋째]" in rendered.split("## Appendix")[0]
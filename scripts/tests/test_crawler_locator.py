@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import random
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import KICPA  # noqa: E402
+from crawler.locator import PageLocator  # noqa: E402
+
+PER_PAGE = 10
+
+
+def _board(n_items=4500, seed=7):
+    """Newest-first items with bursty posting (0-3 days apart)."""
+    rng = random.Random(seed)
+    day = datetime(2026, 9, 30)
+    items = []
+    for i in range(n_items):
+        items.append({"title": f"t{i}", "link": f"l{i}", "date": day})
+        day -= timedelta(days=rng.choice([0, 0, 0, 1, 1, 3]))
+    return [items[i : i + PER_PAGE] for i in range(0, n_items, PER_PAGE)]
+
+
+def _locator(pages):
+    loads = []
+    lock = threading.Lock()
+
+    def load(n):
+        with lock:
+            loads.append(n)
+        return list(pages[n - 1]) if 1 <= n <= len(pages) else []
+
+    return PageLocator(load, len(pages)), loads
+
+
+def _brute_range(pages, start, end):
+    hits = [n for n, items in enumerate(pages, 1) if any(start <= i["date"] <= end for i in items)]
+    return hits[0], hits[-1]
+
+
+def test_find_range_matches_scan_and_never_refetches():
+    pages = _board()
+    for start, end in [
+        (datetime(2026, 7, 1), datetime(2026, 9, 30)),
+        (datetime(2025, 1, 1), datetime(2025, 3, 31)),
+        (datetime(2023, 10, 1), datetime(2023, 12, 31)),
+    ]:
+        loc, loads = _locator(pages)
+        first, last = loc.find_range(start, end)
+        lo, hi = _brute_range(pages, start, end)
+        # The range may include at most one boundary page with no in-period items.
+        assert first <= lo and hi <= last
+        assert lo - first <= 1 and last - hi <= 1
+        assert len(loads) == len(set(loads))
+        # Interpolation needs far fewer probes than the 2 * log2(450) ≈ 18 of bisection.
+        assert len(loads) <= 14
+
+        items = loc.items(first, last)
+        want = [i for p in pages for i in p if start <= i["date"] <= end]
+        assert [i for i in items if start <= i["date"] <= end] == want
+        assert len(loads) == len(set(loads))
+
+
+def test_find_range_empty_period():
+    pages = _board(200)
+    loc, _ = _locator(pages)
+    first, last = loc.find_range(datetime(2030, 1, 1), datetime(2030, 3, 31))
+    assert last < first
+
+
+def test_kicpa_crawl_period_uses_each_page_once(monkeypatch):
+    pages = _board(900)
+    calls = []
+
+    def fake_fetch(board_id, page, extra=None):
+        calls.append(page)
+        return page
+
+    def fake_parse(board_id, page):
+        return list(pages[page - 1])
+
+    monkeypatch.setattr(KICPA, "fetch_page", fake_fetch)
+    monkeypatch.setattr(KICPA, "parse_table", fake_parse)
+    monkeypatch.setattr(KICPA, "parse_total_pages", lambda html: len(pages))
+
+    start, end = datetime(2026, 1, 1), datetime(2026, 3, 31)
+    got = KICPA.crawl_period("noti", start, end)
+
+    assert got == [i for p in pages for i in p if start <= i["date"] <= end]
+    assert len(calls) == len(set(calls))
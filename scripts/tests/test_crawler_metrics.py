@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import metrics, transport, unified  # noqa: E402
+from crawler.transport import Transport  # noqa: E402
+
+
+class FlakySite(BaseAdapter):
+    """503 on the first request to each page, then 200."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen = set()
+
+    def send(self, request, **kwargs):
+        res = requests.Response()
+        res.status_code = 200 if request.url in self.seen else 503
+        self.seen.add(request.url)
+        res._content = b"<table><tbody><tr><td>x</td></tr></tbody></table>"
+        res.url = request.url
+        res.request = request
+        return res
+
+    def close(self):
+        pass
+
+
+def test_percentile_nearest_rank():
+    values = [0.1 * n for n in range(1, 11)]
+    assert metrics.percentile(values, 50) == pytest.approx(0.5)
+    assert metrics.percentile(values, 90) == pytest.approx(0.9)
+    assert metrics.percentile(values, 99) == pytest.approx(1.0)
+    assert metrics.percentile([], 50) is None
+
+
+def test_board_report_counts_status_latency_filtering_and_stop(monkeypatch):
+    net = Transport(adapter=lambda size: FlakySite(), min_interval=0, backoff=0)
+    monkeypatch.setattr(transport, "_default", net)
+
+    def ok(start, end):
+        for page in (1, 2):
+            transport.get("https://www.fss.or.kr/list.do", params={"pageIndex": page})
+        metrics.finish("before_start", kept=3, seen=5)
+        return [1, 2, 3]
+
+    def broken(start, end):
+        raise requests.ConnectionError("reset by peer")
+
+    specs = [
+        unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", ok, unified.md_lines),
+        unified.BoardSpec("한국회계기준원", "공지사항", "공지사항", "kasb", broken, unified.md_lines),
+    ]
+    metrics.reset()
+    with pytest.raises(requests.ConnectionError):
+        unified.fetch_boards(unified.CrawlContext("2026-01-01", "2026-03-31"), specs, jobs=2)
+    report = metrics.report(mode="full")
+
+    press = report["boards"]["금융감독원/보도자료"]
+    assert press["pages"] == 4
+    assert press["status"] == {"200": 2, "503": 2}
+    assert press["latency_ms"]["p50"] is not None
+    assert (press["items"], press["kept"], press["filtered"]) == (3, 3, 2)
+    assert press["stop_reason"] == "before_start"
+    assert report["boards"]["한국회계기준원/공지사항"]["stop_reason"].startswith("error: ConnectionError")
+    assert report["mode"] == "full"
+
+
+def test_crawl_writes_telemetry_next_to_output(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr("crawl.repo_root", lambda: tmp_path)
+
+    def fake_write(ctx, path, jobs=1):
+        with metrics.board("금융위원회/보도자료"):
+            metrics.response(200, 2048, 0.12)
+            metrics.finish("empty_page", kept=1, seen=1)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("md", encoding="utf-8")
+        return path
+
+    monkeypatch.setattr(unified, "write_markdown", fake_write)
+    monkeypatch.setattr(unified, "current_watermarks", lambda ctx: {})
+
+    from crawl import main
+
+    assert main(["--start", "2099-01-01", "--end", "2099-03-31", "--cache-mode", "off", "--live"]) == 0
+    report_path = tmp_path / "docs/quality-updates/2099/2099-01-01_to_2099-03-31.crawl.json"
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["status"] == "ok"
+    assert report["period"] == {"start": "2099-01-01", "end": "2099-03-31"}
+    assert report["outputs"] == ["2099-01-01_to_2099-03-31.md"]
+    assert report["boards"]["금융위원회/보도자료"]["latency_ms"]["p50"] == 120.0
+    assert "금융위원회/보도자료" in capsys.readouterr().out
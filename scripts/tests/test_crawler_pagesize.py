@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import FSS, pagesize, transport  # noqa: E402
+from crawler.pagesize import Negotiator, PageSize  # noqa: E402
+from crawler.transport import Transport  # noqa: E402
+
+
+class FakePressBoard(BaseAdapter):
+    """FSS press list: 10 rows per page, ``pageUnit`` honoured up to ``cap``."""
+
+    def __init__(self, n_items=123, cap=50):
+        super().__init__()
+        first = date(2026, 3, 31)
+        self.items = [(n, first - timedelta(days=n // 2)) for n in range(n_items)]
+        self.cap = cap
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        q = {k: v[0] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        self.requests.append(q)
+        unit = min(int(q.get("pageUnit", 10)), self.cap) if self.cap else 10
+        page = int(q["pageIndex"])
+        rows = self.items[(page - 1) * unit : page * unit]
+        body = "".join(
+            f'<tr><td>{n}</td><td class="title"><a href="view.do?nttId={n}">보도 {n}</a></td>'
+            f"<td>첨부</td><td>{d:%Y-%m-%d}</td></tr>"
+            for n, d in rows
+        )
+        html = f'<p class="total">총 <strong>{len(self.items)}</strong>건</p><div class="bd-list"><table><tbody>{body}</tbody></table></div>'
+        res = requests.Response()
+        res.status_code = 200
+        res.url = request.url
+        res.request = request
+        res.headers["Content-Type"] = "text/html; charset=utf-8"
+        res._content = html.encode("utf-8")
+        return res
+
+    def close(self):
+        pass
+
+
+def crawl(site, negotiator):
+    net = Transport(adapter=lambda size: site, min_interval=0)
+    with transport.using(net), pagesize.using(negotiator):
+        return FSS.fetch_press_release(start="2026-01-01", end="2026-03-31")
+
+
+def test_negotiated_page_size_cuts_requests_and_keeps_items(tmp_path):
+    baseline_site = FakePressBoard()
+    baseline = crawl(baseline_site, None)
+    assert len(baseline_site.requests) >= 14  # 13 pages and the empty 14th (plus prefetch)
+
+    site = FakePressBoard()
+    cache = tmp_path / "page_sizes.json"
+    assert crawl(site, Negotiator(cache)) == baseline
+    # pageUnit=100 comes back capped at 50 rows, recordCountPerPage is ignored,
+    # pageUnit=50 is verified; then 3 pages and the empty 4th (plus prefetch).
+    probes = [(q.get("pageUnit"), q.get("recordCountPerPage")) for q in site.requests[:3]]
+    assert probes == [("100", None), (None, "100"), ("50", None)]
+    assert len(site.requests) <= 3 + 4 + 3
+    assert json.loads(cache.read_text(encoding="utf-8"))["fss:200218"]["size"] == 50
+
+    # A fresh board: pages the last crawl fetched speculatively may still land on the old one.
+    site = FakePressBoard()
+    assert crawl(site, Negotiator(cache)) == baseline
+    assert {q["pageUnit"] for q in site.requests} == {"50"}  # no probing within the TTL
+    assert len(site.requests) <= 4 + 3
+
+
+def test_boards_that_ignore_the_field_keep_their_default(tmp_path):
+    site = FakePressBoard(cap=0)
+    negotiator = Negotiator(tmp_path / "page_sizes.json")
+    assert len(crawl(site, negotiator)) == 123
+    assert negotiator.negotiate("fss:200218", FSS.PAGE_SIZE, lambda fields: (99, None)) == {}
+
+    # A period that fits on one default page proves nothing: the default is
+    # remembered for the TTL like any other outcome.
+    small = Negotiator()
+    assert small.negotiate("b", PageSize(10, ("pageUnit",)), lambda fields: (4, 4)) == {}
+    assert small.negotiate("b", PageSize(10, ("pageUnit",)), lambda fields: (30, 70)) == {}
+    expired = Negotiator(ttl=0)
+    assert expired.negotiate("b", PageSize(10, ("pageUnit",)), lambda fields: (4, 4)) == {}
+    assert expired.negotiate("b", PageSize(10, ("pageUnit",)), lambda fields: (30, 70)) == {"pageUnit": 30}
+    assert pagesize.reported_total("전체 : <em>1,234</em> 건") == 1234
+
+
+def test_probe_is_conclusive_only_when_total_exceeds_size(tmp_path):
+    spec = PageSize(10, ("pageUnit",))
+    cache = tmp_path / "page_sizes.json"
+
+    # 45 items: a server capped at 50 looks the same as one honouring 100.
+    capped = lambda fields: (min(fields["pageUnit"], 50, 45), 45)  # noqa: E731
+    negotiator = Negotiator(cache)
+    assert negotiator.negotiate("b", spec, capped) == {"pageUnit": 30}
+    assert json.loads(cache.read_text(encoding="utf-8"))["b"]["size"] == 30
+
+    # Every size holds the whole period: nothing is proven, so the default is
+    # stored and the next run does not probe again.
+    small = Negotiator(tmp_path / "small.json")
+    assert small.negotiate("b", PageSize(10, ("pageUnit",), (100, 50)), capped) == {}
+    assert json.loads((tmp_path / "small.json").read_text(encoding="utf-8"))["b"]["field"] is None
+    probes = []
+    again = Negotiator(tmp_path / "small.json")
+    assert again.negotiate("b", spec, lambda fields: probes.append(fields) or capped(fields)) == {}
+    assert probes == []
+
+    # Probes that all fail teach nothing about the server: try again next run.
+    def down(fields):
+        raise requests.ConnectionError("down")
+
+    failing = Negotiator(tmp_path / "failing.json")
+    assert failing.negotiate("b", spec, down) == {}
+    assert not (tmp_path / "failing.json").exists()
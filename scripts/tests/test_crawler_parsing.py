@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.parsers import BOARD_PARSERS, rows_with  # noqa: E402
+from crawler import parsing  # noqa: E402
+
+
+@pytest.mark.parametrize("board", list(BOARD_PARSERS))
+@pytest.mark.parametrize("backend", ["strained", "lxml"])
+def test_backend_rows_identical_to_html_parser(board, backend):
+    expected = rows_with("html.parser", board)
+    assert expected, f"fixture for {board} yields no rows"
+    assert rows_with(backend, board) == expected
+
+
+def test_strained_parse_keeps_only_first_selector_step():
+    html = (
+        "<ul class='nav'><li>menu</li></ul>"
+        "<table class='other'><tr><td>x</td></tr></table>"
+        "<table class='table_st02'><tbody><tr><td>row</td></tr></tbody></table>"
+        "<p class='page'><strong>1</strong>/3</p>"
+    )
+    soup = parsing.parse(html, "table.table_st02 tbody tr", backend="strained")
+    assert [t["class"] for t in soup.find_all("table")] == [["table_st02"]]
+    assert soup.find("li") is None
+    assert parsing.parse(html, ".page strong", backend="strained").get_text() == "1/3"
+    assert parsing.strainer("#content tr") is None
+
+
+def test_restricted_miss_falls_back_to_full_parse(monkeypatch):
+    html = "<table><tbody><tr><td>a</td></tr></tbody></table>"
+    monkeypatch.setattr(parsing, "parse", lambda *a, **k: parsing.BeautifulSoup("", "html.parser"))
+    assert [r.get_text() for r in parsing.select(html, "table tbody tr", backend="strained")] == ["a"]
+    assert parsing.select(html, "table tbody tr", backend="html.parser") == []
+
+
+def test_empty_page_is_not_parsed_twice(monkeypatch):
+    features = []
+    real = parsing.BeautifulSoup
+
+    def counting(html, feature, **kwargs):
+        features.append(feature)
+        return real(html, feature, **kwargs)
+
+    monkeypatch.setattr(parsing, "BeautifulSoup", counting)
+    html = "<div>menu</div><table class='table_st02'><tbody></tbody></table>"
+    assert parsing.select(html, "table.table_st02 tbody tr", backend="strained") == []
+    assert parsing.select(html, "table tbody tr", backend="lxml") == []
+    assert "html.parser" not in features
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        parsing.set_backend("html5lib")
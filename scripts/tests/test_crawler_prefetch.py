@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import prefetch  # noqa: E402
+from crawler.store import ContentStore, request_key  # noqa: E402
+from crawler.transport import Transport  # noqa: E402
+
+KASB_VIEW = "https://www.kasb.or.kr/front/board/comm010View.do?seq=77"
+FSS_VIEW = "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=5&menuNo=200218"
+
+KASB_HTML = """<h3>공지</h3><div class="file">
+<a href="#" onclick="javascript:fileDownload('-12','3'); return false;">첨부.hwp</a>
+<a href="#" onclick="fileDownload('-12','4')">별첨.pdf</a>
+<a href="https://example.com/x.pdf">외부</a></div>"""
+FSS_HTML = """<div class="bd-view"><ul class="file-list">
+<li><a href="/fss.hpdownload?file=a.pdf&path=/bbs">보도자료.pdf</a></li>
+<li><a href="/fss/cmmn/file/fileDown.do?atchFileId=9&fileSn=1">붙임.hwp</a></li>
+<li><a href="/fss/bbs/B0000188/list.do">목록</a></li></ul></div>"""
+
+
+class FakeSite(BaseAdapter):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append((request.method, request.url, request.body))
+        res = requests.Response()
+        res.status_code = 200
+        res.url = request.url
+        res.request = request
+        if request.url == KASB_VIEW:
+            res.headers["Content-Type"] = "text/html; charset=utf-8"
+            res._content = KASB_HTML.encode("utf-8")
+        elif request.url == FSS_VIEW:
+            res.headers["Content-Type"] = "text/html; charset=utf-8"
+            res._content = FSS_HTML.encode("utf-8")
+        else:
+            res.headers["Content-Type"] = "application/pdf"
+            res.headers["Content-Disposition"] = 'attachment; filename="a.pdf"'
+            res._content = b"%PDF-1.7 same bytes"
+        return res
+
+    def close(self):
+        pass
+
+
+def test_attachments_cover_kasb_file_download_and_fss_file_lists():
+    kasb = prefetch.attachments(KASB_VIEW, KASB_HTML)
+    assert [(f.method, f.key) for f in kasb] == [
+        ("POST", "https://www.kasb.or.kr/commonFile/fileDownload.do?fileNo=-12&fileSeq=3"),
+        ("POST", "https://www.kasb.or.kr/commonFile/fileDownload.do?fileNo=-12&fileSeq=4"),
+    ]
+    fss = prefetch.attachments(FSS_VIEW, FSS_HTML)
+    assert [f.url for f in fss] == [
+        "https://www.fss.or.kr/fss.hpdownload?file=a.pdf&path=/bbs",
+        "https://www.fss.or.kr/fss/cmmn/file/fileDown.do?atchFileId=9&fileSn=1",
+    ]
+
+
+def test_prefetch_stores_pages_and_attachments_once(tmp_path):
+    quarter = tmp_path / "q.md"
+    quarter.write_text(
+        f"- (26-01-02) [공지]({KASB_VIEW})\n- (26-01-03) [보도]({FSS_VIEW})\n- (26-01-04) [외부](https://example.com/a)\n",
+        encoding="utf-8",
+    )
+    site = FakeSite()
+    net = Transport(adapter=lambda size: site, min_interval=0)
+    store = ContentStore(tmp_path / "store")
+
+    stats = prefetch.prefetch_files([quarter], store, jobs=2, net=net)
+    assert (stats.pages, stats.attachments, stats.failed) == (2, 4, 0)
+    assert ("POST", prefetch.KASB_FILE_URL, "fileNo=-12&fileSeq=3") in site.requests
+    assert not any("example.com" in url for _, url, _ in site.requests)
+
+    reloaded = ContentStore(tmp_path / "store")
+    entry, body = reloaded.read(request_key(prefetch.KASB_FILE_URL, {"fileNo": "-12", "fileSeq": "4"}))
+    assert body == b"%PDF-1.7 same bytes"
+    assert entry.content_disposition == 'attachment; filename="a.pdf"'
+    objects = [p for p in (tmp_path / "store" / "objects").rglob("*") if p.is_file()]
+    assert len(objects) == 3  # two detail pages + one shared attachment body
+
+    site.requests.clear()
+    again = prefetch.prefetch_files([quarter], reloaded, jobs=2, net=net)
+    assert site.requests == []
+    assert (again.pages, again.attachments, again.skipped) == (0, 0, 6)
+
+
+def test_editor_serves_prefetched_bodies_without_network(tmp_path, monkeypatch):
+    import editor.app as editor_app
+    import editor.config as editor_config
+    import editor.routes.source as source_routes
+    import editor.source_fetch as source_fetch
+
+    monkeypatch.setattr(editor_config, "repo_root", lambda: tmp_path)
+    monkeypatch.setattr(editor_config, "load_config", lambda: {"downloads_folder": "downloads/"})
+    store = ContentStore(source_fetch.prefetch_store_dir())
+    store.put(FSS_VIEW, FSS_HTML.encode("utf-8"), content_type="text/html; charset=utf-8", final_url=FSS_VIEW)
+    store.put(
+        request_key(prefetch.KASB_FILE_URL, {"fileNo": "-12", "fileSeq": "3"}),
+        b"PK\x03\x04" + b"x" * 20,
+        content_disposition='attachment; filename="a.zip"',
+    )
+    store.save()
+
+    def offline(*args, **kwargs):
+        raise AssertionError("network used")
+
+    monkeypatch.setattr(source_fetch, "_fetch_url_impl", offline)
+    monkeypatch.setattr(source_routes.requests, "post", offline)
+
+    final_url, body, content_type, _ = source_fetch.fetch_url(FSS_VIEW)
+    assert (final_url, content_type) == (FSS_VIEW, "text/html; charset=utf-8")
+    assert "보도자료.pdf" in body.decode("utf-8")
+
+    client = editor_app.app.test_client()
+    resp = client.get("/api/source/kasb_file?fileNo=-12&fileSeq=3")
+    assert resp.status_code == 200
+    assert list((tmp_path / "downloads").glob("*.zip"))
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks import crawl as bench  # noqa: E402
+from crawler import metrics, transport, unified  # noqa: E402
+from crawler.replay import Cassettes, RecordingAdapter, ReplayMiss, replay_transport  # noqa: E402
+from crawler.transport import Transport  # noqa: E402
+
+FSS_LIST = "https://www.fss.or.kr/fss/bbs/B0000188/list.do"
+KASB_LIST = "https://www.kasb.or.kr/front/board/comm010List.do"
+
+
+class FakeSite(BaseAdapter):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        res = requests.Response()
+        res.status_code = 200
+        res.headers["Content-Type"] = "text/html; charset=utf-8"
+        res.encoding = "utf-8"
+        body = request.body or ""
+        res._content = f"<p>{request.method} {request.url} {body} 목록</p>".encode("utf-8")
+        res.url = request.url
+        res.request = request
+        return res
+
+    def close(self):
+        pass
+
+
+def _record(tmp_path):
+    site = FakeSite()
+    cassettes = Cassettes(tmp_path)
+    live = Transport(adapter=lambda size: RecordingAdapter(cassettes, site), min_interval=0)
+    with metrics.board("금융감독원/보도자료"):
+        press = live.get(FSS_LIST, params={"menuNo": 200218, "pageIndex": 1}).text
+    with metrics.board("한국회계기준원/공지사항"):
+        notice = live.post(KASB_LIST, data={"page": 2}).text
+    paths = cassettes.save({"start": "2026-01-01", "end": "2026-03-31"})
+    return paths, press, notice
+
+
+def test_record_per_board_then_replay_with_latency(tmp_path):
+    paths, press, notice = _record(tmp_path)
+    assert sorted(p.name for p in paths) == ["금융감독원_보도자료.json", "한국회계기준원_공지사항.json"]
+
+    loaded = Cassettes.load(tmp_path)
+    assert loaded.meta() == {"start": "2026-01-01", "end": "2026-03-31"}
+    replay = replay_transport(loaded, latency=0.05, min_interval=0)
+
+    t0 = time.perf_counter()
+    assert replay.get(FSS_LIST, params={"menuNo": 200218, "pageIndex": 1}).text == press
+    assert time.perf_counter() - t0 >= 0.05
+    assert replay.post(KASB_LIST, data={"page": 2}).text == notice
+
+    with pytest.raises(ReplayMiss):
+        replay.post(KASB_LIST, data={"page": 3})
+
+
+def test_replay_jitter_stays_in_bounds(tmp_path):
+    from crawler.replay import ReplayAdapter
+
+    adapter = ReplayAdapter(Cassettes(tmp_path), latency=0.1, jitter=0.04, seed=1)
+    delays = [adapter.delay() for _ in range(200)]
+    assert min(delays) >= 0.06 and max(delays) <= 0.14
+    assert len(set(delays)) > 1
+
+
+def test_benchmark_reports_per_board_metrics(tmp_path, monkeypatch):
+    _record(tmp_path)
+
+    def specs():
+        def press(start, end):
+            html = transport.get(FSS_LIST, params={"menuNo": 200218, "pageIndex": 1}).text
+            return [("26-01-02", html, "https://x/1"), ("26-01-01", html, "https://x/2")]
+
+        def notice(start, end):
+            transport.post(KASB_LIST, data={"page": 2})
+            return [("26-01-03", "공지", "https://y/1")]
+
+        return [
+            unified.BoardSpec("금융감독원", "보도자료", "보도자료", "www.fss.or.kr", press, unified.md_lines),
+            unified.BoardSpec("한국회계기준원", "공지사항", "공지사항", "www.kasb.or.kr", notice, unified.md_lines),
+        ]
+
+    monkeypatch.setattr(unified, "board_specs", specs)
+    cassettes = Cassettes.load(tmp_path)
+    seq = bench.run_mode(cassettes, 1, latency=0.05, jitter=0.0, seed=0, min_interval=0)
+    conc = bench.run_mode(cassettes, 4, latency=0.05, jitter=0.0, seed=0, min_interval=0)
+
+    assert seq["boards"]["금융감독원/보도자료"]["requests"] == 1
+    assert seq["boards"]["금융감독원/보도자료"]["items"] == 2
+    assert seq["boards"]["한국회계기준원/공지사항"]["bytes"] > 0
+    assert conc["boards"].keys() == seq["boards"].keys()
+    assert conc["wall_seconds"] < seq["wall_seconds"]
+    report = bench.format_report("sequential", seq)
+    assert "금융감독원/보도자료" in report and "pages/s" in report
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import transport  # noqa: E402
+from crawler.throttle import HostThrottle  # noqa: E402
+from crawler.transport import Transport  # noqa: E402
+
+
+class BusyOnce(BaseAdapter):
+    """429 with ``Retry-After: 1`` on the first request, then 200."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        res = requests.Response()
+        res.status_code = 429 if self.calls == 1 else 200
+        if self.calls == 1:
+            res.headers["Retry-After"] = "1"
+        res._content = b"ok"
+        res.url = request.url
+        res.request = request
+        return res
+
+    def close(self):
+        pass
+
+
+def _cycle(throttle, host="h", latency=0.01, **outcome):
+    throttle.acquire(host)
+    throttle.release(host, latency, **outcome)
+
+
+def test_healthy_responses_raise_limit_additively_up_to_max():
+    throttle = HostThrottle(min_interval=0, initial_limit=1, max_limit=4)
+    for _ in range(3):
+        _cycle(throttle)
+    assert 2.0 <= throttle.snapshot()["h"]["limit"] < 3.0
+    for _ in range(50):
+        _cycle(throttle)
+    assert throttle.snapshot()["h"]["limit"] == 4.0
+
+
+def test_errors_halve_limit_and_widen_spacing():
+    throttle = HostThrottle(min_interval=0.01, initial_limit=4, max_limit=4)
+    _cycle(throttle, failed=True)
+    state = throttle.snapshot()["h"]
+    assert state["limit"] == 2.0
+    assert state["interval"] >= 0.05
+    assert state["backoffs"] == 1
+    # Healthy traffic shrinks the spacing back toward the floor.
+    for _ in range(40):
+        throttle.acquire("h")
+        throttle.release("h", 0.001)
+    assert throttle.snapshot()["h"]["interval"] < 0.02
+
+
+def test_slow_responses_stop_growth():
+    throttle = HostThrottle(min_interval=0, initial_limit=1, max_limit=8)
+    _cycle(throttle, latency=0.01)
+    limit = throttle.snapshot()["h"]["limit"]
+    for _ in range(20):
+        _cycle(throttle, latency=1.0)
+    assert throttle.snapshot()["h"]["limit"] < limit + 2
+
+
+def test_retry_after_holds_the_whole_host():
+    throttle = HostThrottle(min_interval=0, initial_limit=4)
+    _cycle(throttle, failed=True, retry_after=0.15)
+    t0 = time.perf_counter()
+    throttle.acquire("h")
+    assert time.perf_counter() - t0 >= 0.12
+    throttle.release("h", 0.01)
+    # Other hosts are unaffected.
+    t0 = time.perf_counter()
+    _cycle(throttle, host="other")
+    assert time.perf_counter() - t0 < 0.05
+
+
+def test_acquire_gives_up_after_timeout_and_hedges_get_a_reserved_slot():
+    throttle = HostThrottle(min_interval=0, initial_limit=1, max_limit=1)
+    assert throttle.acquire("h")
+    t0 = time.perf_counter()
+    assert not throttle.acquire("h", 0.05)
+    assert 0.04 <= time.perf_counter() - t0 < 0.5
+    # The first request still holds the only slot; a hedge does not wait for it.
+    assert throttle.acquire("h", 0.05, hedge=True)
+    assert not throttle.acquire("h", 0.05, hedge=True)
+    throttle.release("h", 0.01, hedge=True)
+    throttle.release("h", 0.01, failed=True, retry_after=5)
+    assert not throttle.acquire("h", 0.05, hedge=True)
+
+
+def test_concurrency_limit_is_enforced():
+    throttle = HostThrottle(min_interval=0, initial_limit=2, max_limit=2)
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def worker():
+        throttle.acquire("h")
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        throttle.release("h", 0.02)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert active["max"] == 2
+
+
+class BusyLong(BusyOnce):
+    def send(self, request, **kwargs):
+        res = super().send(request, **kwargs)
+        if res.status_code == 429:
+            res.headers["Retry-After"] = "60"
+        return res
+
+
+def test_retry_after_hold_stops_at_the_crawl_deadline():
+    net = Transport(adapter=lambda size: BusyLong(), min_interval=0, backoff=0)
+    t0 = time.perf_counter()
+    with transport.deadline(time.monotonic() + 0.3):
+        with pytest.raises(transport.DeadlineExceeded):
+            net.get("https://www.kicpa.or.kr/list")
+    assert time.perf_counter() - t0 < 1.0
+
+
+def test_transport_backs_off_host_on_429_retry_after():
+    net = Transport(adapter=lambda size: BusyOnce(), min_interval=0, backoff=0)
+    t0 = time.perf_counter()
+    assert net.get("https://www.kicpa.or.kr/list").text == "ok"
+    assert time.perf_counter() - t0 >= 0.9
+    assert net.stats()["throttle_backoffs"] == 1
+    state = net.throttle.snapshot()["www.kicpa.or.kr"]
+    assert state["backoffs"] == 1
+    assert state["limit"] < net.pool_size
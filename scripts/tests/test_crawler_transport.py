@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+import gzip
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: dict[str, int] = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        n = _Handler.hits[self.path] = _Handler.hits.get(self.path, 0) + 1
+        if self.path == "/hang" or (self.path == "/stall" and n == 1):
+            time.sleep(2)
+            self._send(200, b"<html>late</html>")
+        elif self.path == "/flaky" and n < 3:
+            self._send(503, b"busy", {"Retry-After": "0"})
+        elif self.path == "/gzip":
+            assert "gzip" in self.headers.get("Accept-Encoding", "")
+            self._send(200, gzip.compress(b"<html>" + b"x" * 5000 + b"</html>"), {"Content-Encoding": "gzip"})
+        else:
+            self._send(200, b"<html>ok</html>")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._send(200, self.rfile.read(length))
+
+
+@pytest.fixture()
+def server():
+    _Handler.hits = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_connections_are_reused(server):
+    t = transport.Transport(min_interval=0)
+    for _ in range(5):
+        assert t.get(server + "/page").text == "<html>ok</html>"
+    stats = t.stats()
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+
+
+def test_retries_on_503_then_succeeds(server):
+    t = transport.Transport(min_interval=0, backoff=0.01)
+    res = t.get(server + "/flaky")
+    assert res.status_code == 200
+    assert t.stats()["retries"] == 2
+
+
+def test_gzip_is_negotiated_and_counted(server):
+    t = transport.Transport(min_interval=0)
+    res = t.get(server + "/gzip")
+    assert len(res.text) > 5000
+    stats = t.stats()
+    assert stats["bytes_received"] > stats["bytes_wire"]
+
+
+def test_post_and_connection_error(server):
+    t = transport.Transport(min_interval=0, retries=1, backoff=0.01, timeout=(0.5, 0.5))
+    assert t.post(server + "/echo", data={"page": "2"}).text == "page=2"
+    with pytest.raises(requests.ConnectionError):
+        t.get("http://127.0.0.1:9/unreachable")
+    assert t.stats()["errors"] == 2
+
+
+def test_prime_runs_once_per_host_before_first_request(server):
+    t = transport.Transport(min_interval=0)
+    t.prime(server + "/a")
+    t.prime(server + "/b")
+    assert _Handler.hits == {}
+    t.get(server + "/c")
+    t.get(server + "/c")
+    assert _Handler.hits == {"/a": 1, "/c": 2}
+
+
+def test_throttle_spaces_requests():
+    throttle = transport.HostThrottle(min_interval=0.05, initial_limit=4)
+    t0 = time.perf_counter()
+    for _ in range(3):
+        throttle.acquire("h")
+    assert time.perf_counter() - t0 >= 0.09
+
+
+def test_retry_after_parses_seconds_and_dates():
+    assert transport.retry_after_seconds("7") == 7.0
+    assert transport.retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert transport.retry_after_seconds("") is None
+
+
+def test_slow_list_get_is_hedged_after_host_p95(server):
+    t = transport.Transport(min_interval=0, hedge_after=5.0)
+    for _ in range(transport.HEDGE_MIN_SAMPLES):
+        t.get(server + "/page")
+    assert t.hedge_delay("127.0.0.1:" + server.rsplit(":", 1)[1]) < 1.0
+
+    t0 = time.perf_counter()
+    res = t.get(server + "/stall", hedge=True)
+    assert time.perf_counter() - t0 < 1.5
+    assert res.text == "<html>ok</html>"
+    stats = t.stats()
+    assert (stats["hedges"], stats["hedge_wins"]) == (1, 1)
+    [summary] = t.hedge_summary().values()
+    assert (summary["fired"], summary["won"], summary["urls"]) == (1, 1, [server + "/stall"])
+    assert "/stall" in transport.format_hedges(t.hedge_summary())
+
+
+def test_hedge_does_not_queue_behind_a_host_limited_to_one(server):
+    throttle = transport.HostThrottle(min_interval=0, initial_limit=1, max_limit=1)
+    t = transport.Transport(throttle=throttle, hedge_after=0.2)
+    t0 = time.perf_counter()
+    assert t.get(server + "/stall", hedge=True).text == "<html>ok</html>"
+    assert time.perf_counter() - t0 < 1.5
+    assert t.stats()["hedge_wins"] == 1
+
+
+def test_deadline_caps_timeouts_and_stops_retries(server):
+    t = transport.Transport(min_interval=0, retries=5, backoff=0.01, hedge=False)
+    t0 = time.perf_counter()
+    with transport.deadline(time.monotonic() + 0.3):
+        with pytest.raises(transport.DeadlineExceeded):
+            t.get(server + "/hang")
+        assert time.perf_counter() - t0 < 1.5
+        with pytest.raises(transport.DeadlineExceeded):
+            t.get(server + "/page")
+    assert _Handler.hits == {"/hang": 1}
+    assert t.get(server + "/page").status_code == 200
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import incremental  # noqa: E402
+from crawler.store import request_key  # noqa: E402
+from crawler.urls import canonical_url  # noqa: E402
+from editor.curation_store import apply_sidecar_to_links  # noqa: E402
+
+
+def test_detail_pages_keep_only_identifying_params():
+    cases = {
+        "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=130553&menuNo=200218&sdate=2023-07-01"
+        "&edate=2023-09-30&searchCnd=1&searchWrd=&pageIndex=2": "https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=130553&menuNo=200218",
+        "https://www.fss.or.kr/fss/job/lrgRegItnPrvntc/view.do?lrgSlno=2281&menuNo=200489&pageIndex=1": "https://www.fss.or.kr/fss/job/lrgRegItnPrvntc/view.do?lrgSlno=2281&menuNo=200489",
+        "https://fsc.go.kr./po040301/view?noticeId=4154&curPage=1&srchKey=&srchBeginDt=2026-04-01": "https://fsc.go.kr/po040301/view?noticeId=4154",
+        "https://fsc.go.kr/no010101/80801?srchCtgry=&curPage=2&srchBeginDt=2023-07-01#top": "https://fsc.go.kr/no010101/80801",
+        "https://www.kicpa.or.kr/board/read.brd?boardId=noti&cmpBrdId=noti&bltnNo=11693446963608": "https://www.kicpa.or.kr/board/read.brd?boardId=noti&cmpBrdId=noti&bltnNo=11693446963608",
+        "http://www.kasb.or.kr/fe/bbs/NR_view.do?bbsCd=1002&bbsSeq=39173&currentPage=1&rowPerPage=10": "https://www.kasb.or.kr/fe/bbs/NR_view.do?bbsCd=1002&bbsSeq=39173",
+        "https://www.kasb.or.kr/front/board/comm010View.do?seq=1859": "https://www.kasb.or.kr/front/board/comm010View.do?seq=1859",
+        # Not a detail page: attachments and news links keep their query.
+        "https://www.fss.or.kr/fss.hpdownload?file=a.pdf&path=/bbs": "https://www.fss.or.kr/fss.hpdownload?file=a.pdf&path=/bbs",
+        "http://WWW.Naeil.com/news_view/?id_art=446386": "http://www.naeil.com/news_view/?id_art=446386",
+    }
+    for raw, canonical in cases.items():
+        assert canonical_url(raw) == canonical
+        assert canonical_url(canonical) == canonical
+
+
+def test_keys_agree_across_periods_and_pages():
+    q3 = "https://fsc.go.kr/po040301/view?noticeId=3925&curPage=1&srchBeginDt=2023-07-01&srchEndDt=2023-09-30"
+    q4 = "https://fsc.go.kr/po040301/view?noticeId=3925&curPage=3&srchBeginDt=2023-10-01&srchEndDt=2023-12-31"
+    assert incremental.item_key(q3) == incremental.item_key(q4)
+    assert request_key(q3) == request_key(q4)
+    assert request_key(q3, {"a": "1"}) != request_key(q4, {"a": "1"})  # POSTs are keyed as sent
+
+    curated = {("23-07-03", "고시", canonical_url(q3)): {"state": "skip"}}
+    [link] = apply_sidecar_to_links([{"date": "23-07-03", "title": "고시", "url": q4}], curated)
+    assert link["state"] == "skip"
@@ -52,17 +52,13 @@ def test_parse_schedule_page_empty_table():
 
 
 def test_crawl_schedule_sorts_ascending():
-    session = MagicMock()
-    session.headers.update = MagicMock()
-    session.get = MagicMock()
+    pages = {1: SCHEDULE_HTML}
 
-    pages = [
-        SCHEDULE_HTML,
-        "<table><tbody></tbody></table>",
-    ]
+    def fake_fetch(url, page, start, end, extra=None):
+        return pages.get(page, "<table><tbody></tbody></table>")
 
-    with patch("crawler.KASB.requests.Session", return_value=session):
-        with patch("crawler.KASB.fetch_page", side_effect=pages):
+    with patch("crawler.KASB.transport.prime", MagicMock()):
+        with patch("crawler.KASB.fetch_page", side_effect=fake_fetch):
             items = KASB.crawl_schedule("2026-01-01", "2026-03-31")
 
     assert [t[0] for t in items] == ["26-01-16", "26-03-31"]
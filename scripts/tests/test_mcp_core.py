@@ -38,3 +38,99 @@ def test_mcp_core_search(tmp_path):
 
     done_only = search_regulatory_updates(store, has_summary=True, limit=3)
     assert all(h["summary_status"] == "done" for h in done_only)
+
+
+def test_ids_of_earlier_exports_resolve_through_aliases(tmp_path):
+    import hashlib
+
+    out = tmp_path / "corpus"
+    export_corpus(dry_run=False, output_dir=out)
+    current = [json.loads(line) for line in (out / "corpus.jsonl").read_text(encoding="utf-8").splitlines()]
+    volatile = next(i for i in current if "pageIndex=" in i["url"])
+
+    # An export from before canonical URLs hashed the raw link into the id.
+    legacy = dict(volatile, id=volatile["id"].rsplit("|", 1)[0] + "|" + hashlib.sha256(volatile["url"].encode()).hexdigest()[:8])
+    assert legacy["id"] != volatile["id"]
+    (out / "corpus.jsonl").write_text(json.dumps(legacy, ensure_ascii=False) + "\n", encoding="utf-8")
+    stats = export_corpus(dry_run=False, output_dir=out)
+    assert stats["aliases"] == 1
+
+    store = load_corpus(out)
+    assert store.aliases == {legacy["id"]: volatile["id"]}
+    assert get_regulatory_update(store, id=legacy["id"])["id"] == volatile["id"]
+    other_page = volatile["url"].replace("pageIndex=", "pageIndex=9")
+    assert get_regulatory_update(store, url=other_page)["id"] == volatile["id"]
+
+    export_corpus(dry_run=False, output_dir=out)  # aliases survive later exports
+    assert load_corpus(out).aliases == {legacy["id"]: volatile["id"]}
+
+
+def test_sharded_export_loads_selected_periods_and_seeks_items(tmp_path):
+    import hashlib
+
+    single, out = tmp_path / "single", tmp_path / "sharded"
+    export_corpus(output_dir=single)
+    stats = export_corpus(output_dir=out, layout="sharded")
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert not (out / "corpus.jsonl").exists()
+    assert sum(s["items"] for s in manifest["shards"]) == stats["item_count"]
+
+    shard_lines = []
+    for shard in manifest["shards"]:
+        body = (out / shard["path"]).read_bytes()
+        assert (len(body), hashlib.sha256(body).hexdigest()) == (shard["bytes"], shard["sha256"])
+        offset, length = next(iter(shard["offsets"].values()))
+        assert json.loads(body[offset : offset + length])["period_label"] == shard["period_label"]
+        shard_lines.extend(body.decode("utf-8").splitlines())
+    assert sorted(shard_lines) == sorted((single / "corpus.jsonl").read_text(encoding="utf-8").splitlines())
+
+    written = {s["path"]: (out / s["path"]).stat().st_mtime_ns for s in manifest["shards"]}
+    assert export_corpus(output_dir=out, layout="sharded")["reparsed"] == 0
+    assert {p: (out / p).stat().st_mtime_ns for p in written} == written  # unchanged shards not rewritten
+
+    newest, older = manifest["shards"][-1], manifest["shards"][0]
+    store = load_corpus(out, periods=[newest["period_label"]])
+    assert {i["period_label"] for i in store.items} == {newest["period_label"]}
+    other = next(iter(older["offsets"]))
+    assert get_regulatory_update(store, id=other)["id"] == other  # read from its shard, not loaded
+
+    export_corpus(output_dir=out)
+    assert not (out / "shards").exists()
+    assert (out / "corpus.jsonl").read_bytes() == (single / "corpus.jsonl").read_bytes()
+
+
+def test_sqlite_backend_answers_like_the_memory_store(tmp_path):
+    from mcp_server.core import open_corpus, period_item_ids
+    from mcp_server.sqlite_store import SqliteCorpus
+
+    out = tmp_path / "corpus"
+    assert export_corpus(output_dir=out)["sqlite"] == "corpus.sqlite"
+    memory, db = load_corpus(out), open_corpus(out)
+    assert isinstance(db, SqliteCorpus)
+    assert list_quarterly_periods(db) == list_quarterly_periods(memory)
+
+    period = memory.items[-1]["period_label"]
+    cases = [
+        {"query": "내부회계", "limit": 50},
+        {"query": "감사", "limit": 50},  # shorter than a trigram
+        {"query": "K-IFRS", "limit": 50},
+        {"query": "100%"},
+        {"agency": "금융감독원", "has_summary": True, "limit": 500},
+        {"period_label": period, "has_summary": False, "limit": 500},
+        {"date_from": "25-01-01", "date_to": "25-06-30", "limit": 500},
+        {"date_from": "2025-01-01", "limit": 3},
+    ]
+    for kwargs in cases:
+        assert search_regulatory_updates(db, **kwargs) == search_regulatory_updates(memory, **kwargs), kwargs
+    assert search_regulatory_updates(db, query="내부회계")
+    assert all(h["date"] >= "25-01-01" for h in search_regulatory_updates(memory, date_from="2025-01-01"))
+
+    item = memory.items[10]
+    assert get_regulatory_update(db, id=item["id"]) == get_regulatory_update(memory, id=item["id"])
+    assert get_regulatory_update(db, url=item["url"] + "#top")["id"] == get_regulatory_update(memory, url=item["url"])["id"]
+    assert get_regulatory_update(db, id="missing") is None
+    assert period_item_ids(db, period) == period_item_ids(memory, period)
+
+    export_corpus(output_dir=out, dry_run=True)
+    (out / "manifest.json").write_text(json.dumps({**memory.manifest, "generated_at": "later"}), encoding="utf-8")
+    assert not isinstance(open_corpus(out), SqliteCorpus)  # stale database: in-memory store
@@ -129,3 +129,17 @@ def test_line_index():
     assert by_title['제목C']['line_index'] == 11
     assert by_title['제목D']['line_index'] == 17
     assert by_title['제목E']['line_index'] == 21
+
+
+def test_duplicate_marker_parsed():
+    md = """
+### 금융위원회
+
+- (25-02-01) [제목E](https://fsc.go.kr/e) <!-- duplicate: https://fss.or.kr/a -->
+<!-- skip -->
+
+- (25-02-02) [제목F](https://fsc.go.kr/f)
+"""
+    e, f = parse_links(md)
+    assert (e['url'], e['state'], e['duplicate_of']) == ('https://fsc.go.kr/e', 'skip', 'https://fss.or.kr/a')
+    assert f['duplicate_of'] is None
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.quarterly import run_pass  # noqa: E402
+from editor.parser import parse_links  # noqa: E402
+from reorder_chronological import reorder_text  # noqa: E402
+from repair_quarterly_structure import repair_text  # noqa: E402
+from skip_removal import remove_skip_pairs  # noqa: E402
+from source_marker_layout import normalize_quarterly_spacing  # noqa: E402
+from quarterly_doc import ADMONITION, BLANK, HEADING, LINK, MARKER, TABLE, as_document, tokenize  # noqa: E402
+from validate_content import validate_date_format  # noqa: E402
+
+SAMPLE = """\
+---
+title: "2026 Q1"
+period_label: "2026년 1분기"
+period:
+  start: "2026-01-01"
+  end: "2026-03-31"
+---
+
+### 금융감독원
+
+#### 보도자료
+
+- (26-01-08) [심사결과 발표](https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=1)
+
+    <!-- source: pdf|docs/a.pdf -->
+
+    !!! note "주요 내용"
+
+        - 첫째
+        | 구분 | 내용 |
+        |---|---|
+
+- (26-01-09) [제외](https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=2)
+<!-- skip -->
+
+#### 회계감독 동향자료
+
+- (26-02-01) [동향](https://www.fss.or.kr/fss/bbs/B0000154/view.do?nttId=3)
+
+## Appendix A
+
+- (26-03-01) [부록 링크](https://fsc.go.kr/no010101/9)
+"""
+
+
+def test_tokens_and_spans():
+    doc = tokenize(SAMPLE)
+    assert doc.front_matter == (0, 6)
+    assert doc.meta["period"]["start"] == "2026-01-01"
+    assert doc.tokens[8].kind == HEADING and doc.tokens[8].level == 3
+    assert [i for i, _ in doc.of_kind(LINK)] == [12, 22, 27, 31]
+    assert doc.tokens[14].kind == MARKER and doc.tokens[14].value == "pdf|docs/a.pdf"
+    assert doc.tokens[16].kind == ADMONITION and doc.tokens[16].title == "주요 내용"
+    assert doc.tokens[19].kind == TABLE and doc.tokens[13].kind == BLANK
+    assert doc.appendix == 29
+    assert doc.lines[doc.appendix] == "## Appendix A"
+    assert doc.text == SAMPLE
+    assert doc.line_at(SAMPLE.index("Appendix")) == 29
+
+
+def test_items_carry_agency_state_and_note_blocks():
+    items = tokenize(SAMPLE).items
+    assert [(it.title, it.agency, it.subsection, it.state) for it in items] == [
+        ("심사결과 발표", "금융감독원", "보도자료", "done"),
+        ("제외", "금융감독원", "보도자료", "skip"),
+        ("동향", "금융감독원", "회계감독 동향자료", "undecided"),
+    ]
+    first = items[0]
+    assert first.source == {"type": "pdf", "ref": "docs/a.pdf"}
+    [note] = first.notes
+    assert (note.start, note.end) == (16, 22)
+    assert note.bullets == ["첫째"] and note.tables == [["| 구분 | 내용 |", "|---|---|"]]
+    assert items[1].end == 24  # line after the skip marker
+
+
+def test_editor_takes_agency_from_level_four_headings():
+    text = SAMPLE.replace("#### 회계감독 동향자료", "#### 금융위원회 회계감독 동향자료")
+    [*_, last] = tokenize(text).items
+    assert (last.agency, last.section_agency) == ("금융감독원", "금융위원회")
+    assert [link["agency"] for link in parse_links(text)] == ["금융감독원", "금융감독원", "금융위원회"]
+
+
+def test_indented_skip_marker_counts_only_for_the_corpus():
+    text = SAMPLE.replace("\n<!-- skip -->", "\n    <!-- skip -->")
+    doc = tokenize(text)
+    assert doc.items[1].state == "skip" and doc.column_state(doc.items[1]) == "undecided"
+    assert parse_links(text)[1]["state"] == "undecided"
+    assert remove_skip_pairs(text) == text
+    assert "제외" not in remove_skip_pairs(SAMPLE)
+
+
+def test_reorder_and_repair_stop_at_appendix_a_only():
+    text = SAMPLE.replace(
+        "## Appendix A",
+        "## Appendix Z\n\n- (26-01-02) [본문](https://www.fss.or.kr/fss/bbs/B0000188/view.do?nttId=4)\n\n  ## Appendix A",
+    )
+    doc = tokenize(text)
+    assert doc.lines[doc.appendix] == "## Appendix Z"
+    assert doc.lines[doc.appendix_a()] == "  ## Appendix A"
+    assert [it.title for it in doc.items][-1] == "동향"
+    # the link under "## Appendix Z" still belongs to the last subsection
+    reordered = reorder_text(text)
+    assert reordered.index("[본문]") < reordered.index("[동향]") < reordered.index("Appendix A")
+    repaired, _ = repair_text(text)
+    assert repaired.index("[본문]") < repaired.index("[동향]") < repaired.index("Appendix A")
+
+
+def test_items_leave_the_appendix_unclassified():
+    doc = tokenize(SAMPLE + "x\n")
+    assert len(doc.items) == 3 and len(doc.main_tokens) == doc.appendix + 1
+    assert "tokens" not in vars(doc)
+    assert doc.tokens[: doc.appendix + 1] == doc.main_tokens and len(doc.tokens) == len(doc.lines)
+
+
+def test_main_body_tools_leave_the_appendix_unclassified():
+    for n, tool in enumerate((reorder_text, repair_text, normalize_quarterly_spacing)):
+        text = SAMPLE + f"tail {n}\n"
+        tool(text)
+        assert "tokens" not in vars(tokenize(text)), tool.__name__
+
+
+def test_lines_and_cached_documents_agree():
+    lines = [line + "\n" for line in SAMPLE.split("\n")]
+    assert as_document(lines).tokens == tokenize(SAMPLE).tokens
+    assert tokenize(SAMPLE) is tokenize(SAMPLE)
+
+
+def test_date_format_reports_first_long_date_per_line():
+    lines = ["- (2026-01-08) x (2026-01-09)", "ok (26-01-08)", "(2026-02-01)"]
+    errs = validate_date_format(lines, Path("docs/quality-updates/2026/x.md"))
+    assert [(e.line_no, e.message[-10:]) for e in errs] == [(1, "2026-01-08"), (3, "2026-02-01")]
+
+
+def test_shared_pass_matches_previous_implementations():
+    docs = [(Path("docs/quality-updates/2026/2026-01-01_to_2026-03-31.md"), SAMPLE)]
+    previous = run_pass(docs, "previous")
+    assert run_pass(docs, "separate") == previous
+    assert run_pass(docs, "shared") == previous
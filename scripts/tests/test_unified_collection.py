@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crawler import transport, unified
+
+CTX = ("2026-01-01", "2026-03-31")
+
+
+def _fake_specs(delay: float = 0.0, active: dict | None = None):
+    lock = threading.Lock()
+
+    def fetcher(host: str, rows):
+        def fetch(start, end):
+            if active is not None:
+                with lock:
+                    active[host] = active.get(host, 0) + 1
+                    active["max_" + host] = max(active.get("max_" + host, 0), active[host])
+            time.sleep(delay)
+            if active is not None:
+                with lock:
+                    active[host] -= 1
+            return list(rows)
+
+        return fetch
+
+    fss = [{"date": "26-02-01", "title": "b", "link": "http://b"}, {"date": "26-01-01", "title": "a", "link": "http://a"}]
+    fsc = ["- (26-03-02) [y](http://y)", "- (26-01-05) [x](http://x)"]
+    kasb = [("26-02-10", "k", "http://k")]
+    specs = []
+    for agency, host, render, rows in (
+        ("금융감독원", "fss", unified.render_rows, fss),
+        ("금융위원회", "fsc", unified.render_rows, fsc),
+        ("한국공인회계사회", "kicpa", unified.render_rows, kasb),
+        ("한국회계기준원", "kasb", unified.render_rows, kasb),
+    ):
+        for n in range(3):
+            specs.append(
+                unified.BoardSpec(agency, f"board{n}", f"section{n}", host, fetcher(host, rows), render)
+            )
+    return specs
+
+
+def test_concurrent_collection_matches_sequential(monkeypatch):
+    monkeypatch.setattr(unified, "board_specs", lambda: _fake_specs(delay=0.01))
+    seq_ctx, conc_ctx = unified.CrawlContext(*CTX), unified.CrawlContext(*CTX)
+    sequential = unified.run_collection(seq_ctx, jobs=1)
+    concurrent = unified.run_collection(conc_ctx, jobs=8)
+
+    assert concurrent == sequential
+    assert conc_ctx.appendix == seq_ctx.appendix
+    assert list(seq_ctx.appendix["금융감독원"]) == ["section0", "section1", "section2"]
+
+
+def test_fetch_boards_respects_host_concurrency():
+    active: dict = {}
+    specs = _fake_specs(delay=0.05, active=active)
+    results = unified.fetch_boards(unified.CrawlContext(*CTX), specs, jobs=12, host_concurrency=2)
+    assert len(results) == len(specs)
+    for host in ("fss", "fsc", "kicpa", "kasb"):
+        assert active["max_" + host] <= 2
+
+
+def test_fetch_boards_runs_hosts_in_parallel():
+    specs = _fake_specs(delay=0.1)
+    t0 = time.perf_counter()
+    unified.fetch_boards(unified.CrawlContext(*CTX), specs, jobs=12, host_concurrency=3)
+    assert time.perf_counter() - t0 < 0.1 * len(specs) / 2
+
+
+def test_range_backfill_fetches_once_and_matches_per_quarter_runs(monkeypatch, tmp_path):
+    rows = [
+        ("26-04-03", "q2 late", "http://x/4"),
+        ("26-03-31", "q1 last", "http://x/3"),
+        ("26-01-01", "q1 first", "http://x/2"),
+        ("25-12-31", "q4 last", "http://x/1"),
+    ]
+    calls = []
+
+    def specs():
+        def fetch(start, end):
+            calls.append((start, end))
+            return [r for r in rows if start <= "20" + r[0] <= end]
+
+        return [
+            unified.BoardSpec("한국회계기준원", "공지사항", "공지사항", "kasb", fetch, unified.render_rows),
+            unified.BoardSpec("금융감독원", "보도자료", "보도자료", "fss", fetch, unified.render_rows),
+        ]
+
+    monkeypatch.setattr(unified, "board_specs", specs)
+    monkeypatch.setattr(unified, "repo_root", lambda: tmp_path)
+    quarters = [("2025-10-01", "2025-12-31"), ("2026-01-01", "2026-03-31"), ("2026-04-01", "2026-06-30")]
+
+    written = unified.run_range(unified.CrawlContext("2025-10-01", "2026-06-30"), quarters, jobs=2)
+
+    assert sorted(calls) == [("2025-10-01", "2026-06-30")] * 2
+    assert [p.name for p, _ in written] == [f"{s}_to_{e}.md" for s, e in quarters]
+    assert written[0][0].parent.name == "2025" and written[2][0].parent.name == "2026"
+    for (start, end), (path, marks) in zip(quarters, written):
+        assert path.read_text(encoding="utf-8") == unified.run_collection(unified.CrawlContext(start, end))
+    assert written[1][1]["한국회계기준원/공지사항"].date == "26-03-31"
+
+
+def test_periods_crawl_concurrently_through_their_own_transport(monkeypatch):
+    seen = []
+    lock = threading.Lock()
+
+    def specs():
+        def fetch(start, end):
+            time.sleep(0.05)
+            with lock:
+                seen.append((start, transport.current()))
+            return [(start[2:], f"item {start}", f"http://x/{start}")]
+
+        return [
+            unified.BoardSpec(agency, "공지", "공지", host, fetch, unified.render_rows)
+            for agency, host in zip(unified.AGENCIES, ("fss", "fsc", "kicpa", "kasb"))
+        ]
+
+    monkeypatch.setattr(unified, "board_specs", specs)
+    shared = transport.Transport(min_interval=0)
+    quarters = [unified.CrawlContext(s, e, transport=shared) for s, e in (CTX, ("2026-04-01", "2026-06-30"))]
+
+    t0 = time.perf_counter()
+    docs = unified.collect_periods(quarters, jobs=8)
+    assert time.perf_counter() - t0 < 0.05 * 8 / 2
+    assert len(seen) == 8 and all(net is shared for _, net in seen)
+    assert "[item 2026-01-01]" in docs[0] and "2026-04-01" not in docs[0].split("---", 2)[2]
+    assert "period_label: 2026-Q2" in docs[1]
+    assert quarters[0].appendix["금융감독원"]["공지"] == [("26-01-01", "item 2026-01-01", "http://x/2026-01-01")]
+    assert transport.current() is not shared
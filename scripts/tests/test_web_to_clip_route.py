@@ -6,6 +6,7 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import editor.app as editor_app
+import editor.clip_store as clip_store
 import editor.config as editor_config
 import editor.preview_helpers as preview_helpers
 from editor.clip_store import get_clip
@@ -17,7 +18,9 @@ def test_web_to_clip_requires_url(monkeypatch):
     assert r.status_code == 400
 
 
-def test_web_to_clip_saves_html_payload(monkeypatch):
+def test_web_to_clip_saves_html_payload(monkeypatch, tmp_path):
+    monkeypatch.setattr(clip_store, "clips_dir", lambda: tmp_path / "clips")
+
     def fake_build_preview_payload(url: str) -> dict:
         return {"kind": "html", "status": 200, "html": "<p>Hello</p>"}
 
@@ -37,6 +40,7 @@ def test_web_capture_to_clip_happy_path(monkeypatch, tmp_path):
     monkeypatch.setattr(preview_helpers, "capture_preview_png_bytes", lambda cleaned_html, base_url: b"PNG")
     monkeypatch.setattr(preview_helpers, "ocr_png_to_text", lambda png: "OCR TEXT")
     monkeypatch.setattr(editor_config, "repo_root", lambda: tmp_path)
+    monkeypatch.setattr(clip_store, "clips_dir", lambda: tmp_path / "clips")
     (tmp_path / "downloads").mkdir(parents=True, exist_ok=True)
 
     client = editor_app.app.test_client()
@@ -10,6 +10,7 @@ import sys
 from pathlib import Path
 from typing import NamedTuple
 
+from quarterly_doc import ADMONITION, HEADING, TABLE, Document, as_document, tokenize
 from source_marker_layout import find_unsafe_source_layout
 
 
@@ -26,6 +27,9 @@ TYPE_B_HEADER_1 = "| 회사명 | 구분 | 주요 지적사항 | 주요 조치 |"
 TYPE_B_HEADER_2 = "| 회사 | 주요 지적사항 | 대상 | 조치 |"
 
 DATE_PATTERN = re.compile(r"\(\d{2}-\d{2}-\d{2}\)")
+LONG_DATE_RE = re.compile(r"\((\d{4}-\d{2}-\d{2})\)")
+YAML_KEY_RE = re.compile(r"^([a-zA-Z_]+):")
+ADMONITION_TYPES = {"note", "info", "warning", "success", "danger"}
 
 PHASE2_PATTERNS = [
     ("PHASE2_ES", re.compile(r"^#{2,3}\s+Executive Summary\s*$"), "error"),
@@ -34,18 +38,24 @@ PHASE2_PATTERNS = [
     ("PHASE2_LEGACY", re.compile(r"^#{2,3}\s+요약\s*$"), "error"),
 ]
 
-COLLAPSIBLE_NOTE = re.compile(r"^\s*\?\?\?\s+note\s+")
 
 
-def validate_no_collapsible_note(lines: list[str], path: Path) -> list[ValidationError]:
+def _titled(doc: Document, i: int) -> bool:
+    """admonition 타입 뒤에 공백(제목)이 이어지는지 — ``!!! note "..."``."""
+    tail = doc.tokens[i].tail
+    return tail[:1].isspace() or (not tail and doc.lines[i][-1:].isspace())
+
+
+def validate_no_collapsible_note(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """Link-summary note must use !!! (non-collapsible); ??? info in Appendix remains allowed."""
     if path.name == "index.md":
         return []
     if "quality-updates" not in path.as_posix():
         return []
+    doc = as_document(lines)
     errors: list[ValidationError] = []
-    for i, line in enumerate(lines):
-        if COLLAPSIBLE_NOTE.match(line):
+    for i, tok in doc.of_kind(ADMONITION):
+        if tok.value == "???" and tok.name == "note" and _titled(doc, i):
             errors.append(
                 ValidationError(
                     i + 1,
@@ -57,31 +67,33 @@ def validate_no_collapsible_note(lines: list[str], path: Path) -> list[Validatio
     return errors
 
 
-def _is_admonition_line(line: str) -> bool:
-    return bool(re.match(r"^\s*(!!!|\?\?\?)\s+(note|info|warning|success|danger)\s+", line))
+def _is_admonition_line(doc: Document, i: int) -> bool:
+    tok = doc.tokens[i]
+    return (
+        tok.kind == ADMONITION
+        and tok.value in ("!!!", "???")
+        and tok.name in ADMONITION_TYPES
+        and _titled(doc, i)
+    )
 
 
-def validate_admonitions(lines: list[str], path: Path) -> list[ValidationError]:
+def validate_admonitions(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """admonition 들여쓰기 + 빈 줄 규칙 통합 검증."""
+    doc = as_document(lines)
+    tokens = doc.tokens
     errors: list[ValidationError] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if not _is_admonition_line(line):
-            i += 1
+    for i, tok in doc.of_kind(ADMONITION):
+        if not _is_admonition_line(doc, i):
             continue
 
-        base_indent = len(line) - len(line.lstrip())
+        base_indent = tok.indent
         required_content = base_indent + 4
-        j = i + 1
-
-        while j < len(lines):
-            nxt = lines[j]
-            stripped = nxt.strip()
-            if not stripped:
-                j += 1
-                continue
-            curr_indent = len(nxt) - len(nxt.lstrip())
+        j = doc.next_content[i + 1]
+
+        while j < len(tokens):
+            nxt = tokens[j]
+            stripped = nxt.stripped
+            curr_indent = nxt.indent
             if curr_indent <= base_indent and (stripped.startswith("###") or stripped.startswith("- (") or stripped.startswith("---")):
                 break
             if j == i + 1:
@@ -89,7 +101,7 @@ def validate_admonitions(lines: list[str], path: Path) -> list[ValidationError]:
                     ValidationError(j + 1, "ADMON_BLANK", "!!!/??? 줄과 첫 내용 줄 사이에 빈 줄 1개 필요", "warning")
                 )
             if curr_indent > base_indent and curr_indent < required_content:
-                if not stripped.startswith("|"):
+                if nxt.kind != TABLE:
                     errors.append(
                         ValidationError(
                             j + 1,
@@ -98,23 +110,22 @@ def validate_admonitions(lines: list[str], path: Path) -> list[ValidationError]:
                             "warning",
                         )
                     )
-            j += 1
-        i += 1
+            j = doc.next_content[j + 1]
     return errors
 
 
-def validate_yaml_frontmatter(lines: list[str], path: Path) -> list[ValidationError]:
+def validate_yaml_frontmatter(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """YAML front matter 필수 키 검증."""
+    doc = as_document(lines)
     errors: list[ValidationError] = []
-    if not lines or lines[0].strip() != "---":
+    if doc.tokens[0].stripped != "---":
         return errors
+    end = doc.front_matter[1] if doc.front_matter else len(doc.lines)
     keys = set()
-    i = 1
-    while i < len(lines) and lines[i].strip() != "---":
-        m = re.match(r"^([a-zA-Z_]+):", lines[i])
+    for line in doc.lines[1:end]:
+        m = YAML_KEY_RE.match(line)
         if m:
             keys.add(m.group(1))
-        i += 1
     if "title" not in keys:
         errors.append(ValidationError(1, "YAML_TITLE", "YAML front matter에 'title' 필수", "error"))
     if "period" not in keys and "period_label" not in keys:
@@ -122,20 +133,25 @@ def validate_yaml_frontmatter(lines: list[str], path: Path) -> list[ValidationEr
     return errors
 
 
-def validate_date_format(lines: list[str], path: Path) -> list[ValidationError]:
+def validate_date_format(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """날짜 (YY-MM-DD) 패턴 일관성 검증."""
+    doc = as_document(lines)
     errors: list[ValidationError] = []
-    for i, line in enumerate(lines):
-        bad = re.findall(r"\((\d{4}-\d{2}-\d{2})\)", line)
-        if bad:
-            errors.append(
-                ValidationError(
-                    i + 1,
-                    "DATE_FMT",
-                    f"날짜는 (YY-MM-DD) 형식 사용. (YYYY-MM-DD) 검출: {bad[0]}",
-                    "warning",
-                )
+    last = -1
+    # 문서 전체를 한 번 훑고, 줄마다 첫 검출만 보고
+    for m in LONG_DATE_RE.finditer(doc.text):
+        i = doc.line_at(m.start())
+        if i == last:
+            continue
+        last = i
+        errors.append(
+            ValidationError(
+                i + 1,
+                "DATE_FMT",
+                f"날짜는 (YY-MM-DD) 형식 사용. (YYYY-MM-DD) 검출: {m.group(1)}",
+                "warning",
             )
+        )
     return errors
 
 
@@ -145,12 +161,14 @@ def _normalize_table_header(line: str) -> str:
     return "| " + " | ".join(parts) + " |"
 
 
-def validate_table_schema(lines: list[str], path: Path) -> list[ValidationError]:
+def validate_table_schema(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """Type A/B 제재 표 열 이름 검증."""
+    doc = as_document(lines)
     errors: list[ValidationError] = []
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("|") and "|" in stripped[1:]:
+    for i, tok in doc.of_kind(TABLE):
+        line = doc.lines[i]
+        stripped = tok.stripped
+        if "|" in stripped[1:]:
             if "회사명" in stripped and "대상자" in stripped and "위반내용" in stripped and "과징금 부과액" in stripped:
                 normalized = _normalize_table_header(line)
                 if normalized != TYPE_A_HEADER:
@@ -189,7 +207,7 @@ def validate_table_schema(lines: list[str], path: Path) -> list[ValidationError]
     return errors
 
 
-def validate_source_layout(lines: list[str], path: Path) -> list[ValidationError]:
+def validate_source_layout(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """MkDocs 렌더를 깨는 source+note 배치 검출."""
     errors: list[ValidationError] = []
     for line_no, message in find_unsafe_source_layout(lines):
@@ -197,15 +215,18 @@ def validate_source_layout(lines: list[str], path: Path) -> list[ValidationError
     return errors
 
 
-def validate_no_phase2(lines: list[str], path: Path) -> list[ValidationError]:
+def validate_no_phase2(lines: list[str] | Document, path: Path) -> list[ValidationError]:
     """Phase 2 집계 요약 헤더 금지 (링크 note 접두어는 제외)."""
     if path.name == "index.md":
         return []
     if "quality-updates" not in path.as_posix():
         return []
+    doc = as_document(lines)
     errors: list[ValidationError] = []
-    for i, line in enumerate(lines):
-        stripped = line.rstrip()
+    for i, tok in doc.of_kind(HEADING):
+        if tok.indent:
+            continue
+        stripped = tok.stripped
         for code, pat, sev in PHASE2_PATTERNS:
             if pat.match(stripped):
                 errors.append(
@@ -220,7 +241,12 @@ def validate_file(filepath: Path, strict: bool) -> list[ValidationError]:
         text = filepath.read_text(encoding="utf-8")
     except Exception as e:
         return [ValidationError(0, "READ", str(e), "error")]
-    lines = text.split("\n")
+    return validate_text(text, filepath, strict)
+
+
+def validate_text(text: str, filepath: Path, strict: bool) -> list[ValidationError]:
+    """문서 텍스트 검증 (모든 규칙이 같은 토큰화 결과를 공유)."""
+    doc = tokenize(text)
     all_errors: list[ValidationError] = []
     for fn in [
         validate_admonitions,
@@ -231,7 +257,7 @@ def validate_file(filepath: Path, strict: bool) -> list[ValidationError]:
         validate_no_phase2,
         validate_no_collapsible_note,
     ]:
-        all_errors.extend(fn(lines, filepath))
+        all_errors.extend(fn(doc, filepath))
     if strict:
         all_errors = [e for e in all_errors if e.severity in ("error", "warning")]
     else:
@@ -239,6 +265,33 @@ def validate_file(filepath: Path, strict: bool) -> list[ValidationError]:
     return all_errors
 
 
+def default_paths(repo_root: Path) -> list[Path]:
+    """docs/quality-updates/ 아래 전체 .md (AGENT_INSTRUCTION 제외)."""
+    paths = sorted((repo_root / "docs" / "quality-updates").rglob("*.md"))
+    return [p for p in paths if "AGENT_INSTRUCTION" not in p.name]
+
+
+def validate_paths(paths: list[Path], strict: bool, repo_root: Path) -> int:
+    """파일별 검증 결과를 출력하고 에러 수를 반환 (strict면 경고 포함)."""
+    total_errors = 0
+    for fp in paths:
+        errs = validate_file(fp, strict)
+        err_count = sum(1 for e in errs if e.severity == "error")
+        warn_count = sum(1 for e in errs if e.severity == "warning")
+        if strict:
+            err_count += warn_count
+        total_errors += err_count
+        rel = fp.relative_to(repo_root) if repo_root in fp.parents else fp
+        for e in errs:
+            sev = "ERROR" if e.severity == "error" else "WARN"
+            if strict and e.severity == "warning":
+                sev = "ERROR"
+            print(f"{rel}:{e.line_no}: [{sev}] {e.code}: {e.message}")
+        if errs:
+            print(f"  → {err_count} error(s), {warn_count} warning(s)")
+    return total_errors
+
+
 def main():
     parser = argparse.ArgumentParser(description="Quality-updates 마크다운 문서 콘텐츠 검증")
     parser.add_argument(
@@ -254,7 +307,6 @@ def main():
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parent.parent
-    docs_dir = repo_root / "docs" / "quality-updates"
 
     if args.files:
         paths = []
@@ -268,25 +320,9 @@ def main():
             else:
                 print(f"Warning: 파일 없음 {f}", file=sys.stderr)
     else:
-        paths = sorted(docs_dir.rglob("*.md"))
-        paths = [p for p in paths if "AGENT_INSTRUCTION" not in p.name]
+        paths = default_paths(repo_root)
 
-    total_errors = 0
-    for fp in paths:
-        errs = validate_file(fp, args.strict)
-        err_count = sum(1 for e in errs if e.severity == "error")
-        warn_count = sum(1 for e in errs if e.severity == "warning")
-        if args.strict:
-            err_count += warn_count
-        total_errors += err_count
-        rel = fp.relative_to(repo_root) if repo_root in fp.parents else fp
-        for e in errs:
-            sev = "ERROR" if e.severity == "error" else "WARN"
-            if args.strict and e.severity == "warning":
-                sev = "ERROR"
-            print(f"{rel}:{e.line_no}: [{sev}] {e.code}: {e.message}")
-        if errs:
-            print(f"  → {err_count} error(s), {warn_count} warning(s)")
+    total_errors = validate_paths(paths, args.strict, repo_root)
     sys.exit(1 if total_errors > 0 else 0)
 
 